@@ -1 +1,8 @@
 from .decompose import decompose
+from .batch import (
+    DECOMPOSE_CACHE,
+    DecomposeCache,
+    DecomposedTemplate,
+    circuit_structure,
+    decompose_batch,
+)
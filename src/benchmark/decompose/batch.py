@@ -0,0 +1,249 @@
+import hashlib
+import os
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from numbers import Real
+from typing import Union
+
+from qiskit import QuantumCircuit
+from qiskit.circuit import Barrier, ParameterVector
+from qiskit.circuit.library.standard_gates import get_standard_gate_name_mapping
+from qiskit.compiler import transpile
+
+from ...synthesis.cache import CacheInfo
+from ...synthesis.repeated import RepeatedCircuit
+from ...utils.trace import span, traced
+from .decompose import DEFAULT_GATES
+
+# Operations whose name determines what they do, so that two circuits with the
+# same names, qubits and number of angles decompose the same way.
+_STANDARD = {
+    name: type(gate)
+    for name, gate in get_standard_gate_name_mapping().items()
+    if name != "delay"
+}
+_STANDARD["barrier"] = Barrier
+
+
+def circuit_structure(
+    circuit: QuantumCircuit,
+) -> Union[tuple[bytes, list[float]], None]:
+    """
+    Splits the circuit into its gate skeleton and its angles. Circuits with
+    the same skeleton only differ in the angles, in the order they appear.
+
+    Returns: Digest of the skeleton and the list of angles, or None if the
+    circuit has an operation that is not a standard gate, or a symbolic angle.
+    """
+    qubits = {bit: ind for ind, bit in enumerate(circuit.qubits)}
+    clbits = {bit: ind for ind, bit in enumerate(circuit.clbits)}
+    parts = [f"{circuit.num_qubits},{circuit.num_clbits}"]
+    angles = []
+
+    for instruction in circuit.data:
+        operation = instruction.operation
+        if _STANDARD.get(operation.name) is not type(operation):
+            return None
+        for param in operation.params:
+            if not isinstance(param, Real):
+                return None
+            angles.append(float(param))
+
+        parts.append(
+            f"{operation.name}"
+            f":{','.join(str(qubits[bit]) for bit in instruction.qubits)}"
+            f":{','.join(str(clbits[bit]) for bit in instruction.clbits)}"
+            f":{len(operation.params)}"
+        )
+
+    digest = hashlib.blake2b("|".join(parts).encode(), digest_size=16).digest()
+    return digest, angles
+
+
+def _parameterize(circuit: QuantumCircuit, num_angles: int) -> QuantumCircuit:
+    """
+    Copy of the circuit where the `k`-th angle is replaced by `θ[k]`, without
+    the global phase.
+    """
+    angles = ParameterVector("θ", num_angles)
+    template = circuit.copy_empty_like()
+    template.global_phase = 0
+
+    ind = 0
+    for instruction in circuit.data:
+        operation = instruction.operation
+        if len(operation.params) > 0:
+            operation = operation.copy()
+            count = len(operation.params)
+            operation.params = list(angles[ind : ind + count])
+            ind += count
+            instruction = instruction.replace(operation=operation)
+        template._append(instruction)
+    return template
+
+
+class DecomposedTemplate:
+    """
+    Decomposition of a parameterized gate skeleton, bound to the angles of
+    every circuit with that skeleton.
+    """
+
+    def __init__(self, circuit: QuantumCircuit):
+        self.circuit = circuit
+        # Angles that are still used after the decomposition, some may have
+        # been cancelled along with their gates.
+        self.parameters = [(param.index, param) for param in circuit.parameters]
+
+    def bind(self, angles: list[float], global_phase: float) -> QuantumCircuit:
+        if len(self.parameters) == 0:
+            bound = self.circuit.copy()
+        else:
+            bound = self.circuit.assign_parameters(
+                {param: angles[ind] for ind, param in self.parameters}
+            )
+        bound.global_phase += global_phase
+        return bound
+
+
+class DecomposeCache:
+    """
+    Bounded cache of decomposed templates keyed by the gate skeleton and the
+    basis. The least recently used template is evicted once the cache is full.
+    """
+
+    def __init__(self, maxsize: int = 64):
+        if maxsize <= 0:
+            raise ValueError("Cache size must be positive.")
+
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._templates: OrderedDict = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._templates)
+
+    def get(self, key) -> Union[DecomposedTemplate, None]:
+        template = self._templates.get(key)
+        if template is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._templates.move_to_end(key)
+        return template
+
+    def insert(self, key, template: DecomposedTemplate) -> DecomposedTemplate:
+        self._templates[key] = template
+        if len(self._templates) > self.maxsize:
+            self._templates.popitem(last=False)
+        return template
+
+    def info(self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self))
+
+    def clear(self):
+        self._templates.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+# Shared by the batch decompositions unless a cache is passed explicitly
+DECOMPOSE_CACHE = DecomposeCache()
+
+
+def _transpile(circuit: QuantumCircuit, basis: list[str]) -> QuantumCircuit:
+    with span("benchmark.transpile"):
+        return transpile(circuit, basis_gates=basis)
+
+
+@traced("benchmark.decompose_batch")
+def decompose_batch(
+    circuits: list[QuantumCircuit | RepeatedCircuit],
+    basis: Union[list[str], None] = None,
+    workers: Union[int, None] = None,
+    cache: Union[DecomposeCache, None] = None,
+) -> list[QuantumCircuit | RepeatedCircuit]:
+    """
+    Decomposes many circuits, transpiling every distinct gate skeleton once.
+    The skeleton is transpiled with symbolic angles and the decomposition is
+    bound to the angles of every circuit that shares it, as for the circuits
+    of a sweep over time. Only the step of a `RepeatedCircuit` is decomposed.
+
+    For the default basis the result equals `decompose`, for bases where the
+    transpiler merges rotations the result is equivalent but may keep gates
+    that `decompose` would have merged numerically.
+
+    Inputs:
+        - circuits: Circuits to decompose.
+        - basis: Basis gates, `DEFAULT_GATES` by default.
+        - workers: Number of processes transpiling the skeletons, in process
+        if 1 and all the cores if None.
+        - cache: Decomposed skeletons to reuse, defaults to the shared cache.
+
+    Returns: Decomposed circuits, in the same order.
+    """
+    basis = DEFAULT_GATES if basis is None else basis
+    cache = DECOMPOSE_CACHE if cache is None else cache
+    basis_key = tuple(basis)
+
+    steps = [
+        circuit.step if isinstance(circuit, RepeatedCircuit) else circuit
+        for circuit in circuits
+    ]
+
+    # Every circuit is either bound to a skeleton or transpiled on its own,
+    # jobs are keyed by the skeleton or by the position of the circuit.
+    structures = [circuit_structure(step) for step in steps]
+    templates: dict = {}
+    jobs: dict = {}
+    for ind, (step, structure) in enumerate(zip(steps, structures)):
+        if structure is None:
+            jobs[ind] = step
+            continue
+
+        key = (structure[0], basis_key)
+        if key in templates or key in jobs:
+            cache.hits += 1
+            continue
+        template = cache.get(key)
+        if template is None:
+            jobs[key] = _parameterize(step, len(structure[1]))
+        else:
+            templates[key] = template
+
+    keys = list(jobs)
+    workers = os.cpu_count() if workers is None else workers
+    workers = min(workers, len(keys))
+    if workers <= 1:
+        results = [_transpile(jobs[key], basis) for key in keys]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(
+                executor.map(_transpile, [jobs[key] for key in keys], repeat(basis))
+            )
+
+    direct = {}
+    for key, result in zip(keys, results):
+        if isinstance(key, int):
+            direct[key] = result
+        else:
+            templates[key] = cache.insert(key, DecomposedTemplate(result))
+
+    decomposed = []
+    with span("benchmark.bind"):
+        for ind, (circuit, step, structure) in enumerate(
+            zip(circuits, steps, structures)
+        ):
+            if structure is None:
+                result = direct[ind]
+            else:
+                template = templates[(structure[0], basis_key)]
+                result = template.bind(structure[1], step.global_phase)
+
+            if isinstance(circuit, RepeatedCircuit):
+                result = RepeatedCircuit(result, circuit.reps)
+            decomposed.append(result)
+
+    return decomposed
@@ -1,12 +1,21 @@
 from qiskit import QuantumCircuit
 from qiskit.compiler import transpile
 
+from ...synthesis.repeated import RepeatedCircuit
+from ...utils.trace import traced
 
 DEFAULT_GATES = ["rz", "h", "s", "cx", "cz"]
 
 
-def decompose(circ: QuantumCircuit, basis=None) -> QuantumCircuit:
+@traced("benchmark.transpile")
+def decompose(
+    circ: QuantumCircuit | RepeatedCircuit, basis=None
+) -> QuantumCircuit | RepeatedCircuit:
     if basis is None:
         basis = DEFAULT_GATES
 
+    # Only the step is transpiled, the repetitions stay compact
+    if isinstance(circ, RepeatedCircuit):
+        return RepeatedCircuit(transpile(circ.step, basis_gates=basis), circ.reps)
+
     return transpile(circ, basis_gates=basis)
@@ -0,0 +1,110 @@
+import numpy as np
+import pytest
+from qiskit import QuantumCircuit
+from qiskit.circuit import Parameter
+from qiskit.circuit.library import PauliEvolutionGate
+from qiskit.quantum_info import Operator, SparsePauliOp
+
+from .batch import DecomposeCache, circuit_structure, decompose_batch
+from .decompose import decompose
+from ...hamiltonian.random_hamiltonian import random_table
+from ...qdrift.simple import qdrift
+from ...synthesis.repeated import RepeatedCircuit
+from ...trotter.simple import trotter
+from ...trotter_grouping.bitwise_simple import bitwise_simple
+
+
+def _circuit(angles):
+    circuit = QuantumCircuit(2)
+    circuit.h(0)
+    circuit.sdg(1)
+    circuit.rz(angles[0], 0)
+    circuit.cx(0, 1)
+    circuit.rx(angles[1], 1)
+    circuit.cx(0, 1)
+    return circuit
+
+
+def test_circuit_structure():
+    key, angles = circuit_structure(_circuit([0.1, 0.2]))
+    assert angles == [0.1, 0.2]
+    assert circuit_structure(_circuit([0.3, -1.0]))[0] == key
+
+    other = _circuit([0.1, 0.2])
+    other.cx(1, 0)
+    assert circuit_structure(other)[0] != key
+
+    symbolic = _circuit([Parameter("a"), 0.2])
+    assert circuit_structure(symbolic) is None
+
+    evolution = QuantumCircuit(2)
+    evolution.append(PauliEvolutionGate(SparsePauliOp("XY"), 0.5), [0, 1])
+    assert circuit_structure(evolution) is None
+
+
+def test_rebinds_angles():
+    circuits = [_circuit([0.1 * ind, -0.3 * ind]) for ind in range(4)]
+    circuits[2].global_phase = 0.7
+    cache = DecomposeCache()
+
+    result = decompose_batch(circuits, workers=1, cache=cache)
+    assert cache.info().misses == 1
+    assert cache.info().hits == 3
+    assert len(cache) == 1
+
+    for circuit, decomposed in zip(circuits, result):
+        assert decomposed == decompose(circuit)
+        assert Operator(decomposed).equiv(Operator(circuit))
+        assert decomposed.global_phase == pytest.approx(decompose(circuit).global_phase)
+
+    # A second batch reuses the stored skeleton
+    decompose_batch([_circuit([1.0, 2.0])], workers=1, cache=cache)
+    assert cache.info().misses == 1
+
+
+@pytest.mark.parametrize("reps", [1, 3])
+def test_matches_decompose(reps):
+    h = random_table(4, 12, seed=5)
+    circuits = [trotter(h, t, reps) for t in (0.2, 0.5)]
+    circuits += [bitwise_simple(h, t, reps) for t in (0.2, 0.5)]
+    circuits.append(qdrift(h, 1.0, 2.0, rng=3))
+
+    result = decompose_batch(circuits, workers=1, cache=DecomposeCache())
+    for circuit, decomposed in zip(circuits, result):
+        expected = decompose(circuit)
+        assert decomposed == expected
+        assert np.isclose(decomposed.global_phase, expected.global_phase)
+
+
+def test_uncacheable_and_repeated():
+    evolution = QuantumCircuit(2)
+    evolution.append(PauliEvolutionGate(SparsePauliOp("XY"), 0.5), [0, 1])
+    repeated = RepeatedCircuit(_circuit([0.1, 0.2]), 3)
+    cache = DecomposeCache()
+
+    first, second = decompose_batch([evolution, repeated], workers=1, cache=cache)
+    assert first == decompose(evolution)
+    assert isinstance(second, RepeatedCircuit)
+    assert second.reps == 3
+    assert second.step == decompose(repeated).step
+    assert len(cache) == 1
+
+
+def test_workers():
+    circuits = [_circuit([0.1, 0.2]), QuantumCircuit(2), _circuit([0.4, 0.5])]
+    circuits[1].cz(0, 1)
+    result = decompose_batch(circuits, workers=2, cache=DecomposeCache())
+    assert result == [decompose(circuit) for circuit in circuits]
+
+
+def test_cache_eviction():
+    with pytest.raises(ValueError):
+        DecomposeCache(0)
+
+    cache = DecomposeCache(maxsize=1)
+    other = QuantumCircuit(2)
+    other.cz(0, 1)
+    decompose_batch([_circuit([0.1, 0.2]), other], workers=1, cache=cache)
+    assert len(cache) == 1
+    cache.clear()
+    assert cache.info() == (0, 0, 1, 0)
@@ -0,0 +1,14 @@
+from .resources import (
+    Resources,
+    generic_resources,
+    qdrift_resources,
+    term_counts,
+    trotter_resources,
+)
+from .depth import (
+    DepthEstimate,
+    generic_depth,
+    qdrift_depth,
+    schedule_depth,
+    trotter_depth,
+)
@@ -0,0 +1,234 @@
+from typing import Callable, NamedTuple, Union
+
+import numpy as np
+
+from ...grouping.grouper import Grouper
+from ...hamiltonian.table import PauliTable, as_table
+from ...qdrift.simple import qdrift_samples
+from ...qdrift.sampler import Seed
+from ...synthesis.cache import TemplateCache
+from ...synthesis.rotation import Op
+from .resources import Block, generic_blocks, trotter_blocks
+
+
+class DepthEstimate(NamedTuple):
+    """
+    Depth of the whole circuit and of a single step, along with the labels of
+    the blocks on the longest path through a single step.
+    """
+
+    depth: int
+    step_depth: int
+    critical_path: list[str]
+
+
+class _ChainRotation:
+    """
+    Timing of a rotation with a chain ladder on its support `q_0 < ... < q_k-1`:
+    the CNOT `j` of the ladder finishes at `max(t_j-1, s_j) + 1` for the start
+    times `s_j` after the basis change, the RZ follows the last one and the
+    uncomputation is sequential, so every qubit of the support leaves at a
+    fixed offset from the RZ.
+    """
+
+    def __init__(self, ops: list[Op]):
+        first = next(i for i, (name, _) in enumerate(ops) if name in ("cx", "rz"))
+        last = len(ops) - next(
+            i for i, (name, _) in enumerate(ops[::-1]) if name in ("cx", "rz")
+        )
+        ladder = [qubits for name, qubits in ops[first:last] if name == "cx"]
+        ladder = ladder[: len(ladder) // 2]
+
+        if len(ladder) > 0:
+            self.qubits = [ladder[0][0]] + [target for _, target in ladder]
+        else:
+            self.qubits = [ops[first][1][0]]
+
+        pre = dict.fromkeys(self.qubits, 0)
+        post = dict.fromkeys(self.qubits, 0)
+        for _, (qubit,) in ops[:first]:
+            pre[qubit] += 1
+        for _, (qubit,) in ops[last:]:
+            post[qubit] += 1
+        self.pre = [pre[qubit] for qubit in self.qubits]
+        self.post = [post[qubit] for qubit in self.qubits]
+
+
+def _is_chain_rotation(ops: list[Op]) -> bool:
+    names = [name for name, _ in ops]
+    if names.count("rz") != 1:
+        return False
+    middle = [qubits for name, qubits in ops if name == "cx"]
+    ladder = middle[: len(middle) // 2]
+    return all(a[1] == b[0] for a, b in zip(ladder, ladder[1:]))
+
+
+class _Timelines:
+    """
+    Ready time of every qubit, along with the path of blocks that determines
+    it. Paths are linked lists of `(block, parent)` shared between qubits.
+    """
+
+    def __init__(self, num_qubits: int):
+        self.ready = [0] * num_qubits
+        self.path: list[Union[tuple, None]] = [None] * num_qubits
+
+    def _enter(self, qubit: int, block: int) -> tuple:
+        path = self.path[qubit]
+        if path is None or path[0] != block:
+            path = (block, path)
+        return path
+
+    def schedule_ops(self, block: int, ops: list[Op]):
+        """
+        Places every gate as soon as all of its qubits are ready.
+        """
+        ready, paths = self.ready, self.path
+        for _, qubits in ops:
+            if len(qubits) == 1:
+                (qubit,) = qubits
+                paths[qubit] = self._enter(qubit, block)
+                ready[qubit] += 1
+                continue
+
+            latest = max(qubits, key=ready.__getitem__)
+            path = self._enter(latest, block)
+            time = ready[latest] + 1
+            for qubit in qubits:
+                ready[qubit] = time
+                paths[qubit] = path
+
+    def schedule_chain(self, block: int, rotation: _ChainRotation):
+        """
+        Places a rotation with a chain ladder in time linear in its weight.
+        """
+        ready = self.ready
+        qubits = rotation.qubits
+        size = len(qubits)
+
+        # The RZ finishes at `max_j (s_j + size - max(j, 1)) + 1`
+        latest, finish = qubits[0], ready[qubits[0]] + rotation.pre[0] + size - 1
+        for j in range(1, size):
+            qubit = qubits[j]
+            value = ready[qubit] + rotation.pre[j] + size - j
+            if value > finish:
+                latest, finish = qubit, value
+        rz_time = finish + 1
+
+        path = self._enter(latest, block)
+        for j, qubit in enumerate(qubits):
+            offset = size - j if j > 0 else size - 1
+            ready[qubit] = rz_time + offset + rotation.post[j]
+            self.path[qubit] = path
+
+    def critical_path(self) -> list[int]:
+        qubit = int(np.argmax(self.ready))
+        blocks = []
+        path = self.path[qubit]
+        while path is not None:
+            blocks.append(path[0])
+            path = path[1]
+        return blocks[::-1]
+
+
+def schedule_depth(
+    blocks: list[Block], num_qubits: int, reps: int = 1
+) -> DepthEstimate:
+    """
+    Schedules the blocks of a step on per qubit timelines, every gate as soon
+    as its qubits are free. The depth equals `QuantumCircuit.depth()` of the
+    synthesized circuit, which bounds the depth after `decompose` from above
+    since the transpiler only removes CNOTs.
+
+    Repetitions are scheduled until one step delays every qubit that is used
+    by the same amount, after which the remaining steps are extrapolated.
+
+    Inputs:
+        - blocks: Labelled operations of a single step.
+        - num_qubits: Number of qubits of the circuit.
+        - reps: The number of steps.
+
+    Returns: Depth estimate.
+    """
+    if reps < 1:
+        raise ValueError("Number of repetitions must be positive.")
+
+    chains: dict[int, _ChainRotation] = {}
+    for _, ops in blocks:
+        if len(ops) > 0 and id(ops) not in chains and _is_chain_rotation(ops):
+            chains[id(ops)] = _ChainRotation(ops)
+
+    used = sorted({qubit for _, ops in blocks for _, qubits in ops for qubit in qubits})
+    timelines = _Timelines(num_qubits)
+
+    def schedule_step():
+        for block, (_, ops) in enumerate(blocks):
+            chain = chains.get(id(ops))
+            if chain is not None:
+                timelines.schedule_chain(block, chain)
+            else:
+                timelines.schedule_ops(block, ops)
+
+    schedule_step()
+    step_depth = max(timelines.ready, default=0)
+    critical_path = [blocks[block][0] for block in timelines.critical_path()]
+
+    depth = step_depth
+    for done in range(1, reps):
+        before = [timelines.ready[qubit] for qubit in used]
+        schedule_step()
+        delays = {timelines.ready[qubit] - b for qubit, b in zip(used, before)}
+        depth = max(timelines.ready)
+        if len(delays) == 1:
+            depth += (reps - done - 1) * delays.pop()
+            break
+
+    return DepthEstimate(depth, step_depth, critical_path)
+
+
+def trotter_depth(
+    h: dict[str, float] | PauliTable,
+    reps: int = 1,
+    ladder: str = "chain",
+    cache: Union[TemplateCache, None] = None,
+) -> DepthEstimate:
+    """
+    Depth of `trotter(h, t, reps, ladder)` without building the circuit.
+    """
+    table = as_table(h)
+    return schedule_depth(trotter_blocks(table, ladder, cache), table.num_qubits, reps)
+
+
+def generic_depth(
+    grouper_class: Callable[[PauliTable], Grouper],
+    orderer: Callable[[PauliTable], PauliTable],
+    h: dict[str, float] | PauliTable,
+    reps: int = 1,
+    ladder: str = "chain",
+    cache: Union[TemplateCache, None] = None,
+) -> DepthEstimate:
+    """
+    Depth of `generic(grouper_class, orderer, h, t, reps, ladder)`, where the
+    basis changes of the groups are scheduled along with the rotations.
+    """
+    table = as_table(h)
+    blocks = generic_blocks(grouper_class, orderer, table, ladder, cache)
+    return schedule_depth(blocks, table.num_qubits, reps)
+
+
+def qdrift_depth(
+    h: dict[str, float] | PauliTable,
+    t: float = 1.0,
+    eps: float = 1.0,
+    ladder: str = "chain",
+    rng: Seed = None,
+    cache: Union[TemplateCache, None] = None,
+) -> DepthEstimate:
+    """
+    Depth of `qdrift(h, t, eps, ladder, rng=rng)`, the whole sequence of
+    sampled terms is a single step.
+    """
+    table = as_table(h)
+    terms = trotter_blocks(table, ladder, cache)
+    blocks = [terms[ind] for ind in qdrift_samples(table, t, eps, rng).tolist()]
+    return schedule_depth(blocks, table.num_qubits)
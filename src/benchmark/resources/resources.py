@@ -0,0 +1,293 @@
+import math
+from collections import Counter
+from typing import Callable, Iterable, NamedTuple, Union
+
+import numpy as np
+
+from ...grouping.grouper import Grouper
+from ...hamiltonian.table import PauliTable, as_table, popcount
+from ...qdrift.simple import qdrift_samples
+from ...qdrift.sampler import Seed
+from ...synthesis.cache import TEMPLATE_CACHE, TemplateCache
+from ...synthesis.rotation import Op, circuit_ops
+from ..decompose.decompose import DEFAULT_GATES
+
+# Gates emitted by the synthesis that are not in `DEFAULT_GATES` and what they
+# are translated to by `decompose`.
+_TRANSLATED = {"sdg": "rz"}
+
+
+class Resources(NamedTuple):
+    """
+    Gate counts of a circuit after `decompose` to `DEFAULT_GATES`, along with
+    the number of rotations by arbitrary angles. Every other gate is Clifford.
+    """
+
+    counts: dict[str, int]
+    rotations: int
+
+    def t_count(self, eps: float = 1e-10) -> int:
+        """
+        Proxy for the T-count after approximating every arbitrary rotation to
+        precision `eps`, with `3 log2(1 / eps)` T gates each as in the
+        Ross-Selinger synthesis.
+        """
+        return self.rotations * math.ceil(3 * math.log2(1 / eps))
+
+
+def term_counts(h: dict[str, float] | PauliTable) -> dict[str, np.ndarray]:
+    """
+    Vectorized gate counts of the native rotation of every term after
+    `decompose`, computed from the packed Pauli weights. The counts are the
+    same for both ladders.
+
+    Inputs:
+        - h: Hamiltonian in Pauli basis along with coefficients, or PauliTable.
+
+    Returns: Dictionary from gate name to an array with one count per term.
+    """
+    table = as_table(h)
+    weight = popcount(table.x | table.z).astype(np.int64)
+    num_x = popcount(table.x & ~table.z).astype(np.int64)
+    num_y = popcount(table.x & table.z).astype(np.int64)
+    non_identity = (weight > 0).astype(np.int64)
+
+    # X needs H on both sides, Y needs SDG H and H S, where SDG becomes an RZ
+    return {
+        "cx": 2 * np.maximum(weight - 1, 0),
+        "rz": non_identity + num_y,
+        "h": 2 * (num_x + num_y),
+        "s": num_y,
+    }
+
+
+def _without_zeros(counts: dict[str, int]) -> dict[str, int]:
+    return {name: int(count) for name, count in counts.items() if count > 0}
+
+
+# A block is a labelled part of a Trotter step: the rotation of a term, labelled
+# by its Pauli string, or a basis change of a group.
+Block = tuple[str, list[Op]]
+
+
+def trotter_blocks(
+    h: dict[str, float] | PauliTable,
+    ladder: str = "chain",
+    cache: Union[TemplateCache, None] = None,
+) -> list[Block]:
+    """
+    Operations of a single step of `trotter`, one block for each term.
+    """
+    cache = TEMPLATE_CACHE if cache is None else cache
+    table = as_table(h)
+    labels = table.labels()
+    return [
+        (labels[ind], cache.get_row(table, ind, ladder).ops)
+        for ind in range(len(table))
+    ]
+
+
+def generic_blocks(
+    grouper_class: Callable[[PauliTable], Grouper],
+    orderer: Callable[[PauliTable], PauliTable],
+    h: dict[str, float] | PauliTable,
+    ladder: str = "chain",
+    cache: Union[TemplateCache, None] = None,
+) -> list[Block]:
+    """
+    Operations of a single step of `generic`. Every group contributes the
+    diagonalizing circuit, labelled `basis:<group>`, the rotations of the
+    diagonalized terms in order, and the inverse labelled `unbasis:<group>`.
+
+    Raises:
+        - ValueError: if the Hamiltonian is empty.
+    """
+    cache = TEMPLATE_CACHE if cache is None else cache
+    table = as_table(h)
+
+    if len(table) == 0:
+        raise ValueError("Input Hamiltonian was empty.")
+
+    grouper = grouper_class(table)
+    blocks: list[Block] = []
+
+    for ind, rows in enumerate(grouper.group_indices):
+        diag_circ = grouper.group_circuit(ind)
+        blocks.append((f"basis:{ind}", circuit_ops(diag_circ)))
+        ordered = orderer(table[rows])
+        diagonal = grouper.diagonalize_group(ind, ordered)
+        for row, pauli in enumerate(ordered.labels()):
+            blocks.append((pauli, cache.get_row(diagonal, row, ladder).ops))
+        blocks.append((f"unbasis:{ind}", circuit_ops(diag_circ.inverse())))
+
+    return blocks
+
+
+def _is_rotation(label: str, ops: list[Op]) -> bool:
+    return ":" not in label and len(ops) > 0
+
+
+def _scan(steps: Iterable[list[Op]]) -> tuple[Counter, int]:
+    """
+    Counts the gates of the sequence of steps translated to `DEFAULT_GATES`,
+    and the number of CNOTs removed by the cancellation of adjacent pairs that
+    `decompose` performs. Every qubit keeps a stack of the gates on it, a CNOT
+    cancels with the previous one when it is on top of both stacks, which
+    reaches the same fixed point as repeating the transpiler pass.
+    """
+    counts: Counter = Counter()
+    stacks: dict[int, list[int]] = {}
+    gates: list[Op] = []
+    cancelled = 0
+
+    for ops in steps:
+        for name, qubits in ops:
+            name = _TRANSLATED.get(name, name)
+            if name not in DEFAULT_GATES:
+                raise ValueError(f"Cannot estimate the resources of gate: {name}")
+            counts[name] += 1
+
+            if name == "cx":
+                top_a = stacks.get(qubits[0])
+                top_b = stacks.get(qubits[1])
+                if top_a and top_b and top_a[-1] == top_b[-1]:
+                    if gates[top_a[-1]] == ("cx", qubits):
+                        top_a.pop()
+                        top_b.pop()
+                        cancelled += 2
+                        continue
+
+            gates.append((name, qubits))
+            for qubit in qubits:
+                stacks.setdefault(qubit, []).append(len(gates) - 1)
+
+    return counts, cancelled
+
+
+def _repeated_counts(step: list[list[Op]], reps: int, optimize: bool) -> Counter:
+    """
+    Counts of `reps` repetitions of the step. The CNOTs cancelled within a
+    step and at a boundary between two steps are found by scanning one and two
+    steps, every one of the `reps - 1` boundaries then saves the same, so the
+    cost does not depend on `reps`.
+    """
+    counts, cancelled = _scan(step)
+    counts = Counter({name: count * reps for name, count in counts.items()})
+    if not optimize:
+        return counts
+
+    boundary = _scan(step * 2)[1] - 2 * cancelled if reps > 1 else 0
+    counts["cx"] -= reps * cancelled + (reps - 1) * boundary
+    return counts
+
+
+def trotter_resources(
+    h: dict[str, float] | PauliTable,
+    reps: int = 1,
+    ladder: str = "chain",
+    optimize: bool = True,
+    cache: Union[TemplateCache, None] = None,
+) -> Resources:
+    """
+    Gate counts of `trotter(h, t, reps, ladder)` after `decompose`, without
+    building the circuit. The counts do not depend on the time.
+
+    Inputs:
+        - h: Hamiltonian in Pauli basis along with coefficients, or PauliTable.
+        - reps: The number of Trotter steps.
+        - ladder: Shape of the CNOT parity ladder, `chain` or `tree`.
+        - optimize: Account for the CNOTs that cancel between adjacent terms,
+        otherwise the counts only need the Pauli weights.
+        - cache: Rotation templates to reuse, defaults to the shared cache.
+
+    Returns: Resources of the circuit.
+    """
+    table = as_table(h)
+    per_term = term_counts(table)
+    rotations = int(np.count_nonzero(per_term["rz"] > per_term["s"])) * reps
+
+    if not optimize:
+        counts = {name: np.sum(count) * reps for name, count in per_term.items()}
+        return Resources(_without_zeros(counts), rotations)
+
+    step = [ops for _, ops in trotter_blocks(table, ladder, cache)]
+    return Resources(_without_zeros(_repeated_counts(step, reps, True)), rotations)
+
+
+def generic_resources(
+    grouper_class: Callable[[PauliTable], Grouper],
+    orderer: Callable[[PauliTable], PauliTable],
+    h: dict[str, float] | PauliTable,
+    reps: int = 1,
+    ladder: str = "chain",
+    optimize: bool = True,
+    cache: Union[TemplateCache, None] = None,
+) -> Resources:
+    """
+    Gate counts of `generic(grouper_class, orderer, h, t, reps, ladder)` after
+    `decompose`. Only the diagonalizing circuits of the groups are built.
+
+    Inputs:
+        - grouper_class: Pauli grouper
+        - orderer: Function that orders the diagonalized terms
+        - h: Hamiltonian in dictionary form, or PauliTable
+        - reps: The number of Trotter steps.
+        - ladder: Shape of the CNOT parity ladder, `chain` or `tree`.
+        - optimize: Account for the CNOTs that cancel between adjacent gates.
+        - cache: Rotation templates to reuse, defaults to the shared cache.
+
+    Returns: Resources of the circuit.
+    """
+    blocks = generic_blocks(grouper_class, orderer, h, ladder, cache)
+    step = [ops for _, ops in blocks]
+    rotations = sum(1 for label, ops in blocks if _is_rotation(label, ops))
+
+    counts = _repeated_counts(step, reps, optimize)
+    return Resources(_without_zeros(counts), rotations * reps)
+
+
+def qdrift_resources(
+    h: dict[str, float] | PauliTable,
+    t: float = 1.0,
+    eps: float = 1.0,
+    ladder: str = "chain",
+    rng: Seed = None,
+    optimize: bool = False,
+    cache: Union[TemplateCache, None] = None,
+) -> Resources:
+    """
+    Gate counts of `qdrift(h, t, eps, ladder, rng=rng)` after `decompose`, from
+    the sampled term indices. By default the counts are a weighted sum of the
+    per term counts, and the CNOTs that cancel between adjacent samples are
+    left out.
+
+    Inputs:
+        - h: Hamiltonian in Pauli basis along with coefficients, or PauliTable
+        - t: Time
+        - eps: Error factor for QDRIFT.
+        - ladder: Shape of the CNOT parity ladder, `chain` or `tree`.
+        - rng: Generator or seed, the same as given to `qdrift`.
+        - optimize: Account for the CNOTs that cancel between adjacent samples,
+        a gate by gate scan of every sample that is linear in the size of the
+        circuit.
+        - cache: Rotation templates to reuse, defaults to the shared cache.
+
+    Returns: Resources of the circuit.
+    """
+    table = as_table(h)
+    inds = qdrift_samples(table, t, eps, rng)
+    per_term = term_counts(table)
+    occurrences = np.bincount(inds, minlength=len(table))
+
+    is_rotation = per_term["rz"] > per_term["s"]
+    rotations = int(np.sum(occurrences[is_rotation]))
+
+    if not optimize:
+        counts = {name: occurrences @ count for name, count in per_term.items()}
+        return Resources(_without_zeros(counts), rotations)
+
+    cache = TEMPLATE_CACHE if cache is None else cache
+    templates = [cache.get_row(table, ind, ladder).ops for ind in range(len(table))]
+    counts, cancelled = _scan(templates[ind] for ind in inds.tolist())
+    counts["cx"] -= cancelled
+    return Resources(_without_zeros(counts), rotations)
@@ -0,0 +1,54 @@
+import pytest
+
+from ...grouping import Bitwise, FullCommute, RLF
+from ...ordering import lexico
+from ...qdrift.simple import qdrift
+from ...trotter.simple import trotter
+from ...trotter_grouping.group_trotter import generic
+from ..decompose import decompose
+from .depth import generic_depth, qdrift_depth, schedule_depth, trotter_depth
+from .test_resources import _hamiltonian
+
+
+@pytest.mark.parametrize("seed", range(20))
+@pytest.mark.parametrize("ladder", ["chain", "tree"])
+@pytest.mark.parametrize("reps", [1, 2, 5])
+def test_trotter(seed, ladder, reps):
+    h = _hamiltonian(seed)
+    circuit = trotter(h, 1.0, reps, ladder)
+
+    estimate = trotter_depth(h, reps, ladder)
+    assert estimate.depth == circuit.depth()
+    assert estimate.step_depth == trotter(h, 1.0, 1, ladder).depth()
+    assert decompose(circuit).depth() <= estimate.depth
+
+
+@pytest.mark.parametrize("seed", range(10))
+@pytest.mark.parametrize("grouper", [Bitwise, RLF, FullCommute])
+@pytest.mark.parametrize("reps", [1, 3])
+def test_generic(seed, grouper, reps):
+    h = _hamiltonian(seed)
+    circuit = generic(grouper, lexico, h, reps=reps)
+    assert generic_depth(grouper, lexico, h, reps).depth == circuit.depth()
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_qdrift(seed):
+    h = _hamiltonian(seed)
+    circuit = qdrift(h, 1.0, eps=0.5, rng=seed)
+    assert qdrift_depth(h, 1.0, eps=0.5, rng=seed).depth == circuit.depth()
+
+
+def test_critical_path():
+    # The two rotations on the first qubits are sequential, the last one runs
+    # in parallel with them.
+    h = {"iizz": 1.0, "iixx": 1.0, "zzii": 1.0}
+    estimate = trotter_depth(h)
+
+    assert estimate.critical_path == ["iizz", "iixx"]
+    assert estimate.depth == 3 + 5
+
+
+def test_invalid_reps():
+    with pytest.raises(ValueError):
+        schedule_depth([], 1, reps=0)
@@ -0,0 +1,88 @@
+import numpy as np
+import pytest
+
+from ...grouping import Bitwise, DSatur, FullCommute
+from ...ordering import lexico
+from ...qdrift.simple import qdrift
+from ...trotter.simple import trotter
+from ...trotter_grouping.group_trotter import generic
+from ...utils.gate_count import gate_count
+from ..decompose import decompose
+from .resources import (
+    generic_resources,
+    qdrift_resources,
+    term_counts,
+    trotter_resources,
+)
+
+
+def _hamiltonian(seed: int) -> dict[str, float]:
+    rng = np.random.default_rng(seed)
+    num_qubits = int(rng.integers(2, 6))
+    labels = {
+        "".join(rng.choice(list("ixyz"), num_qubits))
+        for _ in range(int(rng.integers(1, 9)))
+    }
+    return {label: float(rng.normal()) for label in labels}
+
+
+def _unoptimized(circuit) -> dict[str, int]:
+    counts = gate_count(circuit)
+    if "sdg" in counts:
+        counts["rz"] = counts.get("rz", 0) + counts.pop("sdg")
+    return counts
+
+
+@pytest.mark.parametrize("seed", range(20))
+@pytest.mark.parametrize("ladder", ["chain", "tree"])
+@pytest.mark.parametrize("reps", [1, 2, 5])
+def test_trotter(seed, ladder, reps):
+    h = _hamiltonian(seed)
+    circuit = trotter(h, 1.0, reps, ladder)
+
+    resources = trotter_resources(h, reps, ladder)
+    assert resources.counts == gate_count(decompose(circuit))
+
+    unoptimized = trotter_resources(h, reps, ladder, optimize=False)
+    assert unoptimized.counts == _unoptimized(circuit)
+    assert unoptimized.rotations == resources.rotations
+
+
+@pytest.mark.parametrize("seed", range(10))
+@pytest.mark.parametrize("grouper", [Bitwise, DSatur, FullCommute])
+@pytest.mark.parametrize("reps", [1, 3])
+def test_generic(seed, grouper, reps):
+    h = _hamiltonian(seed)
+    circuit = generic(grouper, lexico, h, reps=reps)
+
+    resources = generic_resources(grouper, lexico, h, reps)
+    assert resources.counts == gate_count(decompose(circuit))
+
+    unoptimized = generic_resources(grouper, lexico, h, reps, optimize=False)
+    assert unoptimized.counts == _unoptimized(circuit)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_qdrift(seed):
+    h = _hamiltonian(seed)
+    circuit = qdrift(h, 1.0, eps=0.5, rng=seed)
+
+    resources = qdrift_resources(h, 1.0, eps=0.5, rng=seed, optimize=True)
+    assert resources.counts == gate_count(decompose(circuit))
+
+    unoptimized = qdrift_resources(h, 1.0, eps=0.5, rng=seed)
+    assert unoptimized.counts == _unoptimized(circuit)
+
+
+def test_term_counts():
+    counts = term_counts({"iii": 1.0, "xyz": 1.0, "izi": 1.0})
+    assert counts["cx"].tolist() == [0, 4, 0]
+    assert counts["rz"].tolist() == [0, 2, 1]
+    assert counts["h"].tolist() == [0, 4, 0]
+    assert counts["s"].tolist() == [0, 1, 0]
+
+
+def test_rotations():
+    resources = trotter_resources({"ii": 1.0, "xz": 1.0, "zz": 1.0}, reps=3)
+    assert resources.rotations == 6
+    assert resources.t_count(1e-3) == 6 * 30
@@ -0,0 +1,11 @@
+from .suite import (
+    Config,
+    Regression,
+    compare,
+    load_run,
+    run_config,
+    run_suite,
+    save_run,
+    sweep,
+    write_csv,
+)
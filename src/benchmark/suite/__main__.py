@@ -0,0 +1,115 @@
+import argparse
+import contextlib
+import sys
+
+from ...utils.trace import profile
+from .suite import METHODS, compare, load_run, run_suite, save_run, sweep, write_csv
+
+
+def _list(kind):
+    return lambda value: [kind(item) for item in value.split(",")]
+
+
+def _positive(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be positive: {value}")
+    return number
+
+
+def _threshold(value: str) -> tuple[str, float]:
+    metric, _, ratio = value.partition("=")
+    try:
+        number = float(ratio)
+    except ValueError:
+        number = None
+    if len(metric) == 0 or number is None:
+        raise argparse.ArgumentTypeError(f"expected METRIC=RATIO: {value}")
+    return metric, number
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m src.benchmark.suite",
+        description="Sweeps product formulas and compares against a baseline.",
+    )
+    parser.add_argument("--methods", type=_list(str), default=list(METHODS))
+    parser.add_argument("--qubits", type=_list(int), default=[4, 8])
+    parser.add_argument("--terms", type=_list(int), default=[16, 64])
+    parser.add_argument("--times", type=_list(float), default=[1.0])
+    parser.add_argument("--reps", type=_list(int), default=[1, 4])
+    parser.add_argument("--eps", type=_list(float), default=[1.0])
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=_positive, default=3)
+    parser.add_argument("--no-transpile", action="store_true")
+    parser.add_argument("--name", default="run")
+    parser.add_argument("--out", help="JSON file to store the run in")
+    parser.add_argument("--csv", help="CSV file to export the results to")
+    parser.add_argument("--baseline", help="Stored run to compare against")
+    parser.add_argument(
+        "--threshold",
+        type=_threshold,
+        action="append",
+        default=[],
+        metavar="METRIC=RATIO",
+        help="Override the regression threshold of a metric",
+    )
+    parser.add_argument(
+        "--trace", help="Chrome trace JSON file to store the pipeline spans in"
+    )
+    parser.add_argument(
+        "--profile", action="store_true", help="Print a report of the pipeline spans"
+    )
+    parser.add_argument(
+        "--track-memory",
+        action="store_true",
+        help="Record the allocations of every span with --trace or --profile, "
+        "which slows down the builds",
+    )
+    args = parser.parse_args(argv)
+
+    configs = sweep(
+        args.methods,
+        args.qubits,
+        args.terms,
+        args.times,
+        args.reps,
+        args.eps,
+        args.seed,
+    )
+    profiling = args.trace is not None or args.profile
+    context = profile(args.track_memory) if profiling else contextlib.nullcontext()
+    with context as profiler:
+        run = run_suite(configs, args.name, args.repeat, not args.no_transpile)
+
+    if args.trace:
+        profiler.save_chrome_trace(args.trace)
+    if args.profile:
+        print(profiler.report())
+
+    if args.out:
+        save_run(run, args.out)
+    if args.csv:
+        write_csv(run, args.csv)
+
+    for result in run["results"]:
+        print(
+            f"{result['key']}: {result['wall_time'] * 1e3:.2f} ms, "
+            f"{result['peak_memory'] / 2**20:.2f} MiB, depth {result['depth']}"
+        )
+
+    if args.baseline is None:
+        return 0
+
+    regressions = compare(load_run(args.baseline), run, dict(args.threshold))
+    for regression in regressions:
+        print(
+            f"REGRESSION {regression.key} {regression.metric}: "
+            f"{regression.baseline} -> {regression.current} "
+            f"({regression.ratio:.2f}x)"
+        )
+    return 1 if len(regressions) > 0 else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,310 @@
+import csv
+import datetime
+import itertools
+import json
+import platform
+import time
+import tracemalloc
+from typing import Callable, Iterable, NamedTuple, Union
+
+import numpy as np
+import qiskit
+from qiskit import QuantumCircuit
+
+from ...grouping.bitwise import Bitwise
+from ...hamiltonian.random_hamiltonian import random_table
+from ...hamiltonian.table import PauliTable
+from ...ordering import lexico
+from ...qdrift.simple import qdrift
+from ...synthesis.cache import TemplateCache
+from ...trotter.simple import trotter
+from ...trotter_grouping.group_trotter import generic
+from ...utils.gate_count import gate_count
+from ..decompose import decompose
+
+# Bumped whenever the layout of a stored run changes
+SCHEMA_VERSION = 1
+
+GATES = ["cx", "rz", "h", "s", "cz"]
+
+
+class Config(NamedTuple):
+    """
+    A single benchmark configuration, `eps` is only used by QDRIFT and `reps`
+    by the other methods.
+    """
+
+    method: str
+    qubits: int
+    terms: int
+    t: float
+    reps: int
+    eps: Union[float, None]
+    seed: int
+
+    @property
+    def key(self) -> str:
+        return (
+            f"{self.method}/q{self.qubits}/n{self.terms}/t{self.t}"
+            f"/r{self.reps}/e{self.eps}/s{self.seed}"
+        )
+
+
+# Builders of every method, given the template cache to synthesize into
+METHODS: dict[str, Callable[[PauliTable, Config, TemplateCache], QuantumCircuit]] = {
+    "trotter": lambda h, config, cache: trotter(h, config.t, config.reps, cache=cache),
+    "qdrift": lambda h, config, cache: qdrift(
+        h, config.t, config.eps, cache=cache, rng=config.seed
+    ),
+    # Same as `bitwise_simple`, which does not take a cache
+    "bitwise_simple": lambda h, config, cache: generic(
+        Bitwise, lexico, h, config.t, config.reps, cache=cache
+    ),
+}
+
+
+def sweep(
+    methods: Iterable[str] = tuple(METHODS),
+    qubits: Iterable[int] = (4,),
+    terms: Iterable[int] = (16,),
+    times: Iterable[float] = (1.0,),
+    reps: Iterable[int] = (1,),
+    eps: Iterable[float] = (1.0,),
+    seed: int = 0,
+) -> list[Config]:
+    """
+    Cartesian product of the parameters, without the configurations that only
+    differ in a parameter the method does not use.
+
+    Raises:
+        - ValueError: if a method is unknown.
+    """
+    configs = []
+    for method, num_qubits, num_terms, t, r, e in itertools.product(
+        methods, qubits, terms, times, reps, eps
+    ):
+        if method not in METHODS:
+            raise ValueError(
+                f"Unknown method: {method}, expected one of {list(METHODS)}"
+            )
+        if method == "qdrift":
+            configs.append(Config(method, num_qubits, num_terms, t, 1, e, seed))
+        else:
+            configs.append(Config(method, num_qubits, num_terms, t, r, None, seed))
+    return list(dict.fromkeys(configs))
+
+
+def run_config(
+    config: Config, repeat: int = 3, transpile: bool = True
+) -> dict[str, Union[str, int, float]]:
+    """
+    Builds the circuit of the configuration and measures it. The wall time is
+    the best of `repeat` builds, the peak memory is measured on a separate
+    build with `tracemalloc` so that tracing does not slow down the timed
+    ones. Every build starts from an empty template cache.
+
+    Inputs:
+        - config: Configuration to run.
+        - repeat: Number of timed builds.
+        - transpile: Also time `decompose` and count gates after it.
+
+    Returns: Flat dictionary of the configuration and the metrics.
+
+    Raises:
+        - ValueError: if `repeat` is not positive.
+    """
+    if repeat < 1:
+        raise ValueError("Number of timed builds must be positive.")
+    h = random_table(config.qubits, config.terms, config.seed)
+    build = METHODS[config.method]
+
+    # Every build synthesizes into a fresh template cache, so that template
+    # synthesis is measured rather than served by an earlier build
+    wall_times = []
+    for _ in range(repeat):
+        cache = TemplateCache()
+        start = time.perf_counter()
+        circuit = build(h, config, cache)
+        wall_times.append(time.perf_counter() - start)
+
+    # Tracing may already be on for a memory profiler, and is left on then
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    try:
+        cache = TemplateCache()
+        before = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        build(h, config, cache)
+        peak = tracemalloc.get_traced_memory()[1] - before
+    finally:
+        if started:
+            tracemalloc.stop()
+
+    result = dict(config._asdict())
+    result["key"] = config.key
+    result["wall_time"] = min(wall_times)
+    result["peak_memory"] = peak
+
+    if transpile:
+        start = time.perf_counter()
+        circuit = decompose(circuit)
+        result["decompose_time"] = time.perf_counter() - start
+
+    counts = gate_count(circuit)
+    result["size"] = circuit.size()
+    result["depth"] = circuit.depth()
+    for gate in sorted(set(GATES) | set(counts)):
+        result[f"count_{gate}"] = counts.get(gate, 0)
+
+    return result
+
+
+def environment() -> dict[str, str]:
+    return {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "qiskit": qiskit.__version__,
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+    }
+
+
+def run_suite(
+    configs: list[Config], name: str = "run", repeat: int = 3, transpile: bool = True
+) -> dict:
+    """
+    Runs every configuration and collects the results in a versioned run.
+
+    Returns: Run with the schema version, name, creation time, environment and
+    one result per configuration.
+
+    Raises:
+        - ValueError: if `repeat` is not positive.
+    """
+    if repeat < 1:
+        raise ValueError("Number of timed builds must be positive.")
+    return {
+        "schema": SCHEMA_VERSION,
+        "name": name,
+        "created": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "environment": environment(),
+        "results": [run_config(config, repeat, transpile) for config in configs],
+    }
+
+
+def save_run(run: dict, file: str):
+    with open(file, "w") as outfile:
+        json.dump(run, outfile, indent=2)
+
+
+def load_run(file: str) -> dict:
+    """
+    Loads a run saved by `save_run`.
+
+    Raises:
+        - ValueError: if the file does not exist, is not a run, or was saved
+        with another schema version.
+    """
+    try:
+        with open(file, "r") as infile:
+            run = json.load(infile)
+    except json.JSONDecodeError:
+        raise ValueError("Incorrect format")
+    except FileNotFoundError:
+        raise ValueError("File not found")
+
+    if not isinstance(run, dict) or "results" not in run:
+        raise ValueError("Incorrect format")
+    if run.get("schema") != SCHEMA_VERSION:
+        raise ValueError(
+            f"Unsupported schema version: {run.get('schema')}, "
+            f"expected {SCHEMA_VERSION}"
+        )
+    return run
+
+
+def write_csv(run: dict, file: str):
+    """
+    Writes the results of a run as CSV, one row per configuration. The schema
+    version and the run name are repeated on every row.
+    """
+    columns = ["schema", "name"]
+    for result in run["results"]:
+        columns.extend(column for column in result if column not in columns)
+
+    with open(file, "w", newline="") as outfile:
+        writer = csv.DictWriter(outfile, fieldnames=columns, restval="")
+        writer.writeheader()
+        for result in run["results"]:
+            writer.writerow({"schema": run["schema"], "name": run["name"], **result})
+
+
+class Regression(NamedTuple):
+    key: str
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline if self.baseline else float("inf")
+
+
+# Largest allowed ratio of the current value to the baseline for each metric,
+# timings are noisy while the circuit itself is deterministic.
+DEFAULT_THRESHOLDS = {
+    "wall_time": 1.25,
+    "decompose_time": 1.25,
+    "peak_memory": 1.10,
+    "size": 1.0,
+    "depth": 1.0,
+}
+
+
+def compare(
+    baseline: dict,
+    current: dict,
+    thresholds: Union[dict[str, float], None] = None,
+    min_time: float = 1e-3,
+) -> list[Regression]:
+    """
+    Compares the results of two runs configuration by configuration. A metric
+    regresses when it grows by more than its threshold ratio, gate counts use
+    the `count` threshold, or the size threshold if not given. Configurations
+    missing from either run are skipped.
+
+    Inputs:
+        - baseline, current: Runs to compare.
+        - thresholds: Overrides of `DEFAULT_THRESHOLDS`.
+        - min_time: Timings that grow by fewer seconds are considered noise.
+
+    Returns: List of regressions.
+    """
+    thresholds = {**DEFAULT_THRESHOLDS, **(thresholds or {})}
+    count_threshold = thresholds.get("count", thresholds["size"])
+    baseline_results = {result["key"]: result for result in baseline["results"]}
+
+    regressions = []
+    for result in current["results"]:
+        reference = baseline_results.get(result["key"])
+        if reference is None:
+            continue
+
+        for metric, value in result.items():
+            if metric.startswith("count_"):
+                threshold = count_threshold
+            elif metric in thresholds:
+                threshold = thresholds[metric]
+            else:
+                continue
+            if metric not in reference:
+                continue
+
+            before = reference[metric]
+            if metric.endswith("_time") and value - before < min_time:
+                continue
+            if value > before * threshold:
+                regressions.append(Regression(result["key"], metric, before, value))
+
+    return regressions
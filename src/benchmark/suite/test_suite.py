@@ -0,0 +1,146 @@
+import copy
+import json
+import tracemalloc
+
+import pytest
+
+from ...synthesis.cache import TEMPLATE_CACHE
+from .__main__ import main
+from .suite import (
+    SCHEMA_VERSION,
+    Config,
+    compare,
+    load_run,
+    run_config,
+    run_suite,
+    save_run,
+    sweep,
+    write_csv,
+)
+
+
+def test_sweep():
+    configs = sweep(["trotter", "qdrift"], [3], [4, 6], [1.0], [1, 2], [0.5])
+
+    assert len(configs) == 2 * 2 + 2
+    assert Config("qdrift", 3, 4, 1.0, 1, 0.5, 0) in configs
+    assert Config("trotter", 3, 6, 1.0, 2, None, 0) in configs
+
+    with pytest.raises(ValueError):
+        sweep(["unknown"])
+
+
+@pytest.fixture(scope="module")
+def run():
+    configs = sweep(qubits=[3], terms=[5], reps=[1, 2])
+    return run_suite(configs, "test", repeat=1)
+
+
+def test_invalid_repeat():
+    configs = sweep(qubits=[3], terms=[5], reps=[1])
+    with pytest.raises(ValueError):
+        run_suite(configs, "test", repeat=0)
+
+    with pytest.raises(SystemExit):
+        main(["--qubits", "3", "--terms", "5", "--repeat", "0"])
+
+
+@pytest.mark.parametrize("threshold", ["wall_time", "wall_time=fast", "=1.5"])
+def test_invalid_threshold(threshold):
+    with pytest.raises(SystemExit):
+        main(["--qubits", "3", "--terms", "5", "--threshold", threshold])
+
+
+def test_run(run):
+    assert run["schema"] == SCHEMA_VERSION
+    assert len(run["results"]) == 5
+
+    for result in run["results"]:
+        assert result["wall_time"] > 0
+        assert result["peak_memory"] > 0
+        assert result["size"] == sum(
+            value for key, value in result.items() if key.startswith("count_")
+        )
+
+
+def test_cold_builds():
+    # Builds never go through the shared cache, so synthesis is always timed
+    config = Config("trotter", 3, 5, 1.0, 1, None, 0)
+    info = TEMPLATE_CACHE.info()
+    run_config(config, repeat=2, transpile=False)
+    assert TEMPLATE_CACHE.info() == info
+
+
+def test_enclosing_tracing():
+    config = Config("qdrift", 3, 5, 1.0, 1, 1.0, 0)
+    tracemalloc.start()
+    try:
+        result = run_config(config, repeat=1, transpile=False)
+        assert tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()
+    assert result["peak_memory"] > 0
+
+
+def test_store(tmp_path, run):
+    file = str(tmp_path / "run.json")
+    save_run(run, file)
+    assert load_run(file) == run
+
+    csv_file = tmp_path / "run.csv"
+    write_csv(run, str(csv_file))
+    lines = csv_file.read_text().splitlines()
+    assert len(lines) == 1 + len(run["results"])
+    assert lines[0].startswith("schema,name,method")
+
+    old = dict(run, schema=SCHEMA_VERSION - 1)
+    save_run(old, file)
+    with pytest.raises(ValueError):
+        load_run(file)
+
+
+def _run(**metrics) -> dict:
+    result = {"key": "trotter/q2", "wall_time": 0.5, "count_cx": 10, "depth": 20}
+    result.update(metrics)
+    return {"schema": SCHEMA_VERSION, "name": "run", "results": [result]}
+
+
+def test_compare(run):
+    assert compare(run, run) == []
+
+    baseline = _run()
+    current = _run(wall_time=1.0, count_cx=11, depth=19)
+    assert {(r.metric, r.baseline, r.current) for r in compare(baseline, current)} == {
+        ("wall_time", 0.5, 1.0),
+        ("count_cx", 10, 11),
+    }
+
+    # Thresholds are ratios, gate counts follow the size unless overridden
+    assert compare(baseline, current, {"wall_time": 2.0, "size": 1.2}) == []
+    assert compare(baseline, current, {"wall_time": 2.0, "count": 1.05}) != []
+
+    # Small absolute changes in time are noise
+    assert compare(_run(), _run(wall_time=0.9), min_time=0.5) == []
+
+    # Configurations missing from the baseline are skipped
+    assert compare(_run(key="other"), current) == []
+
+
+def test_cli(tmp_path):
+    baseline = str(tmp_path / "baseline.json")
+    args = ["--methods", "trotter", "--qubits", "2", "--terms", "3", "--reps", "1"]
+    assert main(args + ["--repeat", "1", "--out", baseline]) == 0
+    thresholds = ["--threshold", "wall_time=100", "--threshold", "peak_memory=100"]
+    assert main(args + ["--repeat", "1", "--baseline", baseline] + thresholds) == 0
+
+    trace = str(tmp_path / "trace.json")
+    assert main(args + ["--repeat", "1", "--no-transpile", "--trace", trace]) == 0
+    with open(trace) as infile:
+        names = {event["name"] for event in json.load(infile)["traceEvents"]}
+    assert {"trotter", "trotter.compose"} <= names
+
+    memory = ["--no-transpile", "--trace", trace, "--track-memory"]
+    assert main(args + ["--repeat", "1"] + memory) == 0
+    with open(trace) as infile:
+        events = json.load(infile)["traceEvents"]
+    assert any(event["args"]["alloc"] != 0 for event in events)
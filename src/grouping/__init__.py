@@ -1,7 +1,19 @@
 from .bitwise import (
     bitwise_group,
+    bitwise_group_indices,
     bitwise_representor,
     bitwise_gate,
     bitwise_operator_convertor,
+    qubitwise_commutes,
     Bitwise,
 )
+from .colouring import (
+    conflict_graph,
+    colour_groups,
+    Colouring,
+    LargestFirst,
+    DSatur,
+    RLF,
+)
+from .full import FullCommute
+from .clifford import diagonalizing_gates
@@ -1,5 +1,13 @@
+import time
+from typing import Union
+
+import numpy as np
+from qiskit import QuantumCircuit
+
 from .grouper import Grouper
-from ..utils import get_el
+from ..hamiltonian.table import PauliTable, popcount
+from ..utils import circuit_constructor, get_el
+from ..utils.trace import traced
 
 
 class Bitwise(Grouper):
@@ -10,21 +18,61 @@ class Bitwise(Grouper):
     in parallel in case the application does not need the entire functionality.
     """
 
-    def __init__(self, pauli_list: set[str]):
-        self._commutable_sets = bitwise_group(pauli_list)
+    @traced("grouping.bitwise")
+    def __init__(self, pauli_list: Union[set[str], PauliTable]):
+        if isinstance(pauli_list, PauliTable):
+            table = pauli_list
+            labels = table.labels()
+        else:
+            labels = list(pauli_list)
+            table = PauliTable.from_labels(labels) if len(labels) > 0 else None
+
+        start = time.perf_counter()
+        self.group_indices: list[np.ndarray] = []
+        if table is not None:
+            self.group_indices = self._group(table)
+        self.build_time = time.perf_counter() - start
+
+        self._commutable_sets = [
+            [labels[ind] for ind in group] for group in self.group_indices
+        ]
         self.map_repr: dict[str, str] = {}
 
-        for comm_set in self._commutable_sets:
-            bitwise_repr = bitwise_representor(comm_set)
+        for comm_set, group in zip(self._commutable_sets, self.group_indices):
+            rep_x = np.bitwise_or.reduce(table.x[group], axis=0)
+            rep_z = np.bitwise_or.reduce(table.z[group], axis=0)
+            bitwise_repr = PauliTable(
+                rep_x[None, :], rep_z[None, :], [1.0], table.num_qubits
+            ).labels()[0]
             for pauli in comm_set:
                 self.map_repr[pauli] = bitwise_repr
 
+    def _group(self, table: PauliTable) -> list[np.ndarray]:
+        """
+        Groups the rows of the table, subclasses can override the strategy as
+        long as the groups commute qubit-wise.
+        """
+        return bitwise_group_indices(table)
+
     def diagonalize(self, pauli_op: str) -> tuple[float, str]:
         """
         Gets the operator after it has been diagonlized by the circuit.
         """
         return bitwise_operator_convertor(pauli_op)
 
+    def diagonalize_group(self, group: int, table: PauliTable) -> PauliTable:
+        """
+        Rows of a group once diagonalized, every non-identity Pauli becomes Z
+        and every Y flips the sign.
+        """
+        signs = np.where(popcount(table.x & table.z) % 2, -1.0, 1.0)
+        return PauliTable(
+            np.zeros_like(table.x),
+            table.x | table.z,
+            table.coeffs * signs,
+            table.num_qubits,
+        )
+
     def circuit(self, pauli_op: str) -> list[str]:
         """
         Calls the gate constructor with the representor string stored. This
@@ -32,6 +80,14 @@ class Bitwise(Grouper):
         """
         return bitwise_gate(self.map_repr[pauli_op])
 
+    def diagonal_circuit(self, pauli_op: str) -> QuantumCircuit:
+        """
+        Circuit that diagonalizes the group of the given operator. The gates
+        returned by `circuit` are indexed by the position in the Pauli string,
+        which acts on qubit `n - 1 - i`.
+        """
+        return circuit_constructor(self.circuit(pauli_op)[::-1])
+
 
 def commutes(pauli_list: set[str], pauli_a: str) -> bool:
     """
@@ -46,24 +102,98 @@ def commutes(pauli_list: set[str], pauli_a: str) -> bool:
     return True
 
 
-def bitwise_group(pauli_list: set[str]) -> list[set[str]]:
-    """Creating the pauli groups as a list of strings.
+def qubitwise_commutes(
+    x: np.ndarray, z: np.ndarray, rep_x: np.ndarray, rep_z: np.ndarray
+) -> np.ndarray:
+    """
+    Vectorized qubit-wise commutation check on packed rows. Two Pauli operators
+    commute qubit-wise if they agree on every position where neither of them is
+    the identity. The arguments are broadcast against each other, so a batch of
+    terms can be checked against a single representor at once.
+
+    Inputs:
+        - x, z: Packed words of the terms, shape (..., words).
+        - rep_x, rep_z: Packed words to check against, shape (..., words).
+
+    Returns: Boolean array with the words axis reduced.
+    """
+    overlap = (x | z) & (rep_x | rep_z)
+    differ = (x ^ rep_x) | (z ^ rep_z)
+    return ~np.any(overlap & differ, axis=-1)
+
+
+def bitwise_group_indices(table: PauliTable) -> list[np.ndarray]:
+    """
+    Groups the rows of the table with the same first-fit strategy as
+    `bitwise_group`, one group at a time. Every remaining term is checked
+    against the accumulated representor of the group in a single vectorized
+    pass. Compatible terms whose support is already covered by the representor
+    do not change it and are accepted together, so a group needs at most one
+    pass per qubit that its representor grows by.
+
     Input:
-        - pauli_list: List of strings representing the pauli operator.
+        - table: Packed Pauli operators.
 
-    Returns: List of lists, each forming a set of commuting pauli operators.
+    Returns: List of index arrays into the table, one for each group.
     """
+    x, z = table.x, table.z
+    support = x | z
+
+    remaining = np.arange(table.num_terms)
     groups = []
-    for pauli in pauli_list:
-        for group in groups:
-            if commutes(group, pauli):
-                group.append(pauli)
+
+    while remaining.size > 0:
+        seed = remaining[0]
+        rep_x, rep_z = x[seed].copy(), z[seed].copy()
+        members = [remaining[:1]]
+        candidates = remaining[1:]
+
+        while candidates.size > 0:
+            compatible = candidates[
+                qubitwise_commutes(x[candidates], z[candidates], rep_x, rep_z)
+            ]
+            if compatible.size == 0:
                 break
-        else:
-            groups.append([pauli])
+
+            rep_support = rep_x | rep_z
+            covered = ~np.any(support[compatible] & ~rep_support, axis=-1)
+            if np.all(covered):
+                members.append(compatible)
+                break
+
+            # Everything before the first term that grows the representor is
+            # accepted as is, the rest has to be checked again.
+            first = int(np.argmin(covered))
+            members.append(compatible[: first + 1])
+            rep_x |= x[compatible[first]]
+            rep_z |= z[compatible[first]]
+
+            rest = compatible[first + 1 :]
+            rest_covered = covered[first + 1 :]
+            members.append(rest[rest_covered])
+            candidates = rest[~rest_covered]
+
+        group = np.sort(np.concatenate(members))
+        groups.append(group)
+
+        is_left = np.ones(table.num_terms, dtype=bool)
+        is_left[group] = False
+        remaining = remaining[is_left[remaining]]
+
     return groups
 
 
+def bitwise_group(pauli_list: Union[set[str], PauliTable]) -> list[set[str]]:
+    """Creating the pauli groups as a list of strings.
+    Input:
+        - pauli_list: List of strings representing the pauli operator, or the
+        packed table of the Hamiltonian.
+
+    Returns: List of lists, each forming a set of commuting pauli operators.
+    """
+    return Bitwise(pauli_list).groups
+
+
 def bitwise_representor(pauli_list: set[str]) -> str:
     """
     Get the Pauli string that represents the entire commuting Pauli set, we
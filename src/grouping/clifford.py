@@ -0,0 +1,179 @@
+import numpy as np
+from qiskit import QuantumCircuit
+
+# Gates are stored as the name along with the qubits they act on, so that the
+# same list can update a tableau and construct the circuit.
+Gate = tuple[str, tuple[int, ...]]
+
+
+def apply_gates(
+    gates: list[Gate], x_bits: np.ndarray, z_bits: np.ndarray, signs: np.ndarray
+):
+    """
+    Conjugates every row of the tableau by the gates, `P -> U P U^dag`, in
+    place. The rows are Hermitian Pauli operators `(-1)^sign X^x Z^z` where
+    `x = z = 1` represents `Y`, and the update rules are the ones from
+    Aaronson and Gottesman.
+
+    Inputs:
+        - gates: Gates in the order they are applied.
+        - x_bits, z_bits: Boolean arrays of shape (rows, qubits).
+        - signs: Boolean array of shape (rows,).
+    """
+    for name, qubits in gates:
+        match name:
+            case "h":
+                (a,) = qubits
+                signs ^= x_bits[:, a] & z_bits[:, a]
+                x_bits[:, a], z_bits[:, a] = z_bits[:, a].copy(), x_bits[:, a].copy()
+            case "s":
+                (a,) = qubits
+                signs ^= x_bits[:, a] & z_bits[:, a]
+                z_bits[:, a] ^= x_bits[:, a]
+            case "cx":
+                a, b = qubits
+                signs ^= x_bits[:, a] & z_bits[:, b] & ~(x_bits[:, b] ^ z_bits[:, a])
+                x_bits[:, b] ^= x_bits[:, a]
+                z_bits[:, a] ^= z_bits[:, b]
+            case "cz":
+                a, b = qubits
+                apply_gates(
+                    [("h", (b,)), ("cx", (a, b)), ("h", (b,))], x_bits, z_bits, signs
+                )
+            case _:
+                raise ValueError(f"Unsupported gate: {name}")
+
+
+def gates_circuit(gates: list[Gate], num_qubits: int) -> QuantumCircuit:
+    """
+    Constructs the circuit for a list of gates.
+    """
+    circuit = QuantumCircuit(num_qubits)
+    for name, qubits in gates:
+        getattr(circuit, name)(*qubits)
+    return circuit
+
+
+def _row_reduce(x_bits: np.ndarray, z_bits: np.ndarray) -> list[int]:
+    """
+    Brings the X part of the tableau to reduced row echelon form with row
+    operations on the whole rows, in place. Rows that become zero in the X
+    part are moved to the bottom.
+
+    Returns: Pivot column of each of the leading rows.
+    """
+    rows, qubits = x_bits.shape
+    pivots = []
+
+    for col in range(qubits):
+        row = len(pivots)
+        if row == rows:
+            break
+
+        candidates = np.flatnonzero(x_bits[row:, col])
+        if candidates.size == 0:
+            continue
+
+        swap = row + candidates[0]
+        x_bits[[row, swap]] = x_bits[[swap, row]]
+        z_bits[[row, swap]] = z_bits[[swap, row]]
+
+        others = np.flatnonzero(x_bits[:, col])
+        others = others[others != row]
+        x_bits[others] ^= x_bits[row]
+        z_bits[others] ^= z_bits[row]
+        pivots.append(col)
+
+    return pivots
+
+
+def independent_rows(
+    x_bits: np.ndarray, z_bits: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Finds a set of generators for the group spanned by the rows, with Gaussian
+    elimination over GF(2) of the symplectic vectors. Signs are ignored.
+
+    Returns: Tuple of boolean X and Z arrays of the generators.
+    """
+    tableau = np.concatenate([x_bits, z_bits], axis=1).copy()
+    rows, cols = tableau.shape
+    rank = 0
+
+    for col in range(cols):
+        if rank == rows:
+            break
+
+        candidates = rank + np.flatnonzero(tableau[rank:, col])
+        if candidates.size == 0:
+            continue
+
+        tableau[[rank, candidates[0]]] = tableau[[candidates[0], rank]]
+        below = rank + 1 + np.flatnonzero(tableau[rank + 1 :, col])
+        tableau[below] ^= tableau[rank]
+        rank += 1
+
+    qubits = x_bits.shape[1]
+    return tableau[:rank, :qubits], tableau[:rank, qubits:]
+
+
+def diagonalizing_gates(x_bits: np.ndarray, z_bits: np.ndarray) -> list[Gate]:
+    """
+    Synthesizes a Clifford circuit that simultaneously diagonalizes a set of
+    commuting Pauli operators, with symplectic Gaussian elimination on their
+    tableau:
+
+    1. Hadamards make the X part of the generators full rank.
+    2. CNOTs from the pivot columns clear the rest of the X part.
+    3. The Z part on the pivot columns is now symmetric, CZs clear the off
+    diagonal entries and phase gates the diagonal.
+    4. Hadamards on the pivot columns turn the remaining X into Z.
+
+    Inputs:
+        - x_bits, z_bits: Boolean arrays of shape (operators, qubits).
+
+    Returns: Gates in the order they are applied.
+
+    Raises:
+        - ValueError: if the operators do not commute.
+    """
+    x_bits, z_bits = independent_rows(x_bits, z_bits)
+    x_bits, z_bits = x_bits.copy(), z_bits.copy()
+    signs = np.zeros(x_bits.shape[0], dtype=bool)
+    gates: list[Gate] = []
+
+    def apply(new_gates: list[Gate]):
+        apply_gates(new_gates, x_bits, z_bits, signs)
+        gates.extend(new_gates)
+
+    rows = x_bits.shape[0]
+    pivots = _row_reduce(x_bits, z_bits)
+    while len(pivots) < rows:
+        # Commutation with the reduced rows guarantees that the Z part of the
+        # first row without X has support outside of the pivot columns.
+        z_only = z_bits[len(pivots)].copy()
+        z_only[pivots] = False
+        if not np.any(z_only):
+            raise ValueError("Operators in the group do not commute.")
+
+        apply([("h", (int(np.argmax(z_only)),))])
+        pivots = _row_reduce(x_bits, z_bits)
+
+    for row, pivot in enumerate(pivots):
+        for col in np.flatnonzero(x_bits[row]).tolist():
+            if col != pivot:
+                apply([("cx", (pivot, col))])
+
+    for row, pivot in enumerate(pivots):
+        for other in range(row + 1, rows):
+            if z_bits[row, pivots[other]]:
+                apply([("cz", (pivot, pivots[other]))])
+        if z_bits[row, pivot]:
+            apply([("s", (pivot,))])
+
+    apply([("h", (pivot,)) for pivot in pivots])
+
+    if np.any(x_bits):
+        raise ValueError("Operators in the group do not commute.")
+
+    return gates
@@ -0,0 +1,95 @@
+import time
+from typing import Union
+
+import numpy as np
+from qiskit import QuantumCircuit
+
+from .clifford import Gate, apply_gates, diagonalizing_gates, gates_circuit
+from .colouring import colour_groups
+from .grouper import Grouper
+from ..hamiltonian.table import PauliTable, symplectic_commutes
+
+
+class FullCommute(Grouper):
+    """
+    Grouper for general commutation, where the operators of a group only have
+    to commute with each other instead of qubit by qubit. The groups are found
+    by colouring the anti-commutation graph and each group is diagonalized by a
+    Clifford circuit, since a product of single qubit gates is not enough.
+    """
+
+    def __init__(
+        self, pauli_list: Union[set[str], PauliTable], strategy: str = "dsatur"
+    ):
+        super().__init__(pauli_list)
+
+        if isinstance(pauli_list, PauliTable):
+            table = pauli_list
+            labels = table.labels()
+        else:
+            labels = list(pauli_list)
+            table = PauliTable.from_labels(labels) if len(labels) > 0 else None
+
+        start = time.perf_counter()
+        self.group_indices: list[np.ndarray] = []
+        self.group_gates: list[list[Gate]] = []
+        self.map_group: dict[str, int] = {}
+        self.map_diag: dict[str, tuple[float, str]] = {}
+        self._circuits: dict[int, QuantumCircuit] = {}
+
+        if table is not None:
+            self._num_qubits = table.num_qubits
+            self.group_indices = colour_groups(table, symplectic_commutes, strategy)
+            self._commutable_sets = [
+                [labels[ind] for ind in group] for group in self.group_indices
+            ]
+            self._diagonalize_groups(table)
+
+        self.build_time = time.perf_counter() - start
+
+    def _diagonalize_groups(self, table: PauliTable):
+        x_bits, z_bits = table.x_bits(), table.z_bits()
+
+        for ind, group in enumerate(self.group_indices):
+            gates = diagonalizing_gates(x_bits[group], z_bits[group])
+            self.group_gates.append(gates)
+
+            # Conjugating the members gives their diagonal form along with signs
+            diag_x, diag_z = x_bits[group].copy(), z_bits[group].copy()
+            signs = np.zeros(group.size, dtype=bool)
+            apply_gates(gates, diag_x, diag_z, signs)
+
+            diagonal = PauliTable.from_bits(diag_x, diag_z, np.where(signs, -1.0, 1.0))
+            for pauli, (term, sign) in zip(
+                self._commutable_sets[ind], diagonal.items()
+            ):
+                self.map_group[pauli] = ind
+                self.map_diag[pauli] = (sign, term)
+
+    def diagonalize(self, pauli_op: str) -> tuple[float, str]:
+        """
+        Gets the operator after it has been diagonlized by the circuit of its
+        group, along with the sign picked up.
+        """
+        return self.map_diag[pauli_op]
+
+    def diagonalize_group(self, group: int, table: PauliTable) -> PauliTable:
+        """
+        Rows of a group conjugated by the Clifford circuit of the group, with
+        the signs folded into the coefficients.
+        """
+        diag_x, diag_z = table.x_bits(), table.z_bits()
+        signs = np.zeros(len(table), dtype=bool)
+        apply_gates(self.group_gates[group], diag_x, diag_z, signs)
+        return PauliTable.from_bits(
+            diag_x, diag_z, table.coeffs * np.where(signs, -1.0, 1.0)
+        )
+
+    def diagonal_circuit(self, pauli_op: str) -> QuantumCircuit:
+        """
+        Clifford circuit that diagonalizes the group of the given operator.
+        """
+        ind = self.map_group[pauli_op]
+        if ind not in self._circuits:
+            self._circuits[ind] = gates_circuit(self.group_gates[ind], self._num_qubits)
+        return self._circuits[ind]
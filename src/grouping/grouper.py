@@ -1,5 +1,11 @@
 from abc import abstractmethod
 
+import numpy as np
+from qiskit import QuantumCircuit
+
+from ..hamiltonian.table import PauliTable
+from ..utils import get_el
+
 
 class Grouper:
     """
@@ -8,11 +14,19 @@ class Grouper:
 
     def __init__(self, pauli_list: set[str]):
         self._commutable_sets = []
+        # Rows of the grouped table in every group, in the order of `groups`
+        self.group_indices: list[np.ndarray] = []
+        # Seconds spent on grouping the operators
+        self.build_time = 0.0
 
     @property
     def groups(self) -> list[set[str]]:
         return self._commutable_sets
 
+    @property
+    def num_groups(self) -> int:
+        return len(self._commutable_sets)
+
     @abstractmethod
     def diagonalize(self, pauli_op: str) -> tuple[float, str]:
         """
@@ -20,8 +34,22 @@ class Grouper:
         """
 
     @abstractmethod
-    def circuit(self, pauli_op: str) -> list[str]:
+    def diagonal_circuit(self, pauli_op: str) -> QuantumCircuit:
+        """
+        Circuit that diagonalizes the group of the given operator.
+        """
+
+    def group_circuit(self, group: int) -> QuantumCircuit:
+        """
+        Circuit that diagonalizes the group at the given index.
+        """
+        return self.diagonal_circuit(get_el(self.groups[group]))
+
+    def diagonalize_group(self, group: int, table: PauliTable) -> PauliTable:
         """
-        Calls the gate constructor with the representor string stored. This
-        makes it easier for the user to access.
+        Rows of a group once diagonalized by its circuit, with the signs picked
+        up folded into the coefficients. Groupers that track the Paulis as
+        packed rows override this to skip the strings.
         """
+        signs, terms = zip(*(self.diagonalize(pauli) for pauli in table.labels()))
+        return PauliTable.from_labels(list(terms), table.coeffs * np.array(signs))
@@ -1,5 +1,9 @@
 import pytest
+import numpy as np
+from ..hamiltonian import PauliTable
 from .bitwise import (
+    commutes,
+    qubitwise_commutes,
     bitwise_group,
     bitwise_representor,
     bitwise_gate,
@@ -71,3 +75,45 @@ def test_bitwise_conversion(pauli, diag):
 
     result = bitwise_grouper.diagonalize(pauli)
     assert result == diag
+
+
+@pytest.mark.parametrize("pauli_list,grouped", zip(pauli_lists[:-1], groupeds[:-1]))
+def test_commuting_table(pauli_list, grouped):
+    table = PauliTable.from_labels(pauli_list)
+
+    bitwise_grouper = Bitwise(table)
+    assert sorted(bitwise_grouper.groups) == sorted(grouped)
+
+
+def _first_fit(pauli_list):
+    groups = []
+    for pauli in pauli_list:
+        for group in groups:
+            if commutes(group, pauli):
+                group.append(pauli)
+                break
+        else:
+            groups.append([pauli])
+    return groups
+
+
+@pytest.mark.parametrize("qubits,size", [(3, 20), (6, 200), (70, 300)])
+def test_vectorized_matches_first_fit(qubits, size):
+    rng = np.random.default_rng(qubits)
+    # Sparse operators so that the groups are non trivial
+    chars = rng.choice(list("ixyz"), size=(size, qubits), p=[0.7, 0.1, 0.1, 0.1])
+    pauli_list = ["".join(row) for row in chars]
+
+    grouper = Bitwise(pauli_list)
+    assert grouper.groups == _first_fit(pauli_list)
+
+    for group in grouper.groups:
+        assert grouper.map_repr[group[0]] == bitwise_representor(group)
+
+
+def test_qubitwise_commutes():
+    table = PauliTable.from_labels(["xiz", "xyz", "zii", "iii"])
+    rep = PauliTable.from_labels(["xyi"])
+
+    result = qubitwise_commutes(table.x, table.z, rep.x[0], rep.z[0])
+    assert result.tolist() == [True, True, False, True]
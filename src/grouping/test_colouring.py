@@ -0,0 +1,81 @@
+import pytest
+import numpy as np
+from qiskit import QuantumCircuit
+
+from ..hamiltonian import PauliTable
+from ..ordering import lexico
+from ..trotter.simple import trotter
+from ..trotter_grouping.group_trotter import generic
+from ..utils import circuit_eq
+from .bitwise import Bitwise, commutes
+from .colouring import (
+    conflict_graph,
+    colour_groups,
+    Colouring,
+    LargestFirst,
+    DSatur,
+    RLF,
+)
+
+groupers = [LargestFirst, DSatur, RLF]
+
+
+def _random_paulis(qubits, size, seed):
+    rng = np.random.default_rng(seed)
+    chars = rng.choice(list("ixyz"), size=(size, qubits), p=[0.6, 0.2, 0.1, 0.1])
+    return list(dict.fromkeys("".join(row) for row in chars))
+
+
+def test_conflict_graph():
+    table = PauliTable.from_labels(["xi", "zi", "ix", "ii"])
+    indptr, indices = conflict_graph(table, chunk_size=1)
+
+    neighbours = [sorted(indices[indptr[v] : indptr[v + 1]]) for v in range(4)]
+    assert neighbours == [[1], [0], [], []]
+
+
+@pytest.mark.parametrize("grouper_class", groupers)
+@pytest.mark.parametrize("qubits,size", [(2, 10), (5, 60), (8, 200)])
+def test_valid_groups(grouper_class, qubits, size):
+    pauli_list = _random_paulis(qubits, size, seed=qubits)
+    grouper = grouper_class(pauli_list)
+
+    assert sorted(sum(grouper.groups, [])) == sorted(pauli_list)
+    assert grouper.num_groups == len(grouper.groups)
+    assert grouper.build_time >= 0.0
+
+    for group in grouper.groups:
+        for ind, pauli in enumerate(group):
+            assert commutes(group[:ind], pauli)
+
+
+@pytest.mark.parametrize("strategy", ["largest_first", "dsatur", "rlf"])
+def test_fewer_groups_than_first_fit(strategy):
+    # First-fit puts every `x` term with the `z` term after it.
+    pauli_list = ["xii", "izi", "iix", "zii", "ixi", "iiz", "xyi", "zzz"]
+    table = PauliTable.from_labels(pauli_list)
+
+    groups = colour_groups(table, strategy=strategy)
+    assert len(groups) < Bitwise(pauli_list).num_groups
+    assert len(groups) == Colouring(table, strategy).num_groups
+
+
+def test_unknown_strategy():
+    with pytest.raises(ValueError):
+        Colouring(["xx", "zz"], strategy="random")
+
+
+@pytest.mark.parametrize("grouper_class", groupers)
+def test_generic(grouper_class):
+    h = {"xx": 1.0, "zz": 2.0, "zi": 3.0, "iz": -1.0}
+    result = generic(grouper_class, lexico, h)
+
+    expected = QuantumCircuit(2)
+    expected = expected.compose(trotter({"xx": 1.0}))
+    expected = expected.compose(trotter({"zz": 2.0, "zi": 3.0, "iz": -1.0}))
+
+    reverse = QuantumCircuit(2)
+    reverse = reverse.compose(trotter({"zz": 2.0, "zi": 3.0, "iz": -1.0}))
+    reverse = reverse.compose(trotter({"xx": 1.0}))
+
+    assert circuit_eq(result, expected) or circuit_eq(result, reverse)
@@ -0,0 +1,135 @@
+import pytest
+import numpy as np
+from qiskit import QuantumCircuit
+from qiskit.quantum_info import Clifford, Pauli
+
+from ..hamiltonian import PauliTable, random_table, symplectic_commutes
+from ..ordering import lexico
+from ..trotter.simple import trotter
+from ..trotter_grouping.group_trotter import generic
+from ..utils import circuit_eq
+from .bitwise import Bitwise
+from .clifford import apply_gates, diagonalizing_gates, gates_circuit
+from .full import FullCommute
+
+
+def _random_paulis(qubits, size, seed):
+    rng = np.random.default_rng(seed)
+    chars = rng.choice(list("ixyz"), size=(size, qubits))
+    return list(dict.fromkeys("".join(row) for row in chars))
+
+
+def _commuting_paulis(qubits, size, seed):
+    commuting = []
+    for pauli in _random_paulis(qubits, size, seed):
+        table = PauliTable.from_labels(commuting + [pauli])
+        if np.all(symplectic_commutes(table.x[-1], table.z[-1], table.x, table.z)):
+            commuting.append(pauli)
+    return commuting
+
+
+commuting_sets = [
+    ["xx", "yy", "zz"],
+    ["xxi", "yyi", "zzi", "iiz", "zzz"],
+    ["xi", "ix", "xx", "ii"],
+    ["zz", "zi"],
+    _commuting_paulis(6, 200, seed=1),
+    _commuting_paulis(10, 500, seed=2),
+]
+
+
+@pytest.mark.parametrize("pauli_list", commuting_sets)
+def test_diagonalizing_gates(pauli_list):
+    table = PauliTable.from_labels(pauli_list)
+    gates = diagonalizing_gates(table.x_bits(), table.z_bits())
+    clifford = Clifford(gates_circuit(gates, table.num_qubits))
+
+    x_bits, z_bits = table.x_bits(), table.z_bits()
+    signs = np.zeros(len(pauli_list), dtype=bool)
+    apply_gates(gates, x_bits, z_bits, signs)
+    assert not np.any(x_bits)
+
+    for ind, pauli in enumerate(pauli_list):
+        expected = Pauli(pauli.upper()).evolve(clifford, frame="s")
+        result = Pauli((z_bits[ind], x_bits[ind]))
+        if signs[ind]:
+            result = -result
+        assert expected == result
+
+
+def test_non_commuting():
+    table = PauliTable.from_labels(["xi", "zi"])
+    with pytest.raises(ValueError):
+        diagonalizing_gates(table.x_bits(), table.z_bits())
+
+
+@pytest.mark.parametrize("qubits,size", [(2, 12), (4, 40), (6, 80)])
+def test_full_commute_groups(qubits, size):
+    pauli_list = _random_paulis(qubits, size, seed=size)
+    grouper = FullCommute(pauli_list)
+
+    assert sorted(sum(grouper.groups, [])) == sorted(pauli_list)
+    assert grouper.num_groups <= Bitwise(pauli_list).num_groups
+
+    for group in grouper.groups:
+        table = PauliTable.from_labels(group)
+        assert np.all(
+            symplectic_commutes(table.x[:, None], table.z[:, None], table.x, table.z)
+        )
+
+        clifford = Clifford(grouper.diagonal_circuit(group[0]))
+        for pauli in group:
+            sign, diag = grouper.diagonalize(pauli)
+            assert set(diag) <= {"i", "z"}
+
+            expected = Pauli(pauli.upper()).evolve(clifford, frame="s")
+            result = Pauli(diag.upper()) if sign > 0 else -Pauli(diag.upper())
+            assert expected == result
+
+
+@pytest.mark.parametrize("grouper_class", [Bitwise, FullCommute])
+def test_diagonalize_group(grouper_class):
+    table = random_table(5, 30, seed=6)
+    grouper = grouper_class(table)
+    for ind, rows in enumerate(grouper.group_indices):
+        diagonal = grouper.diagonalize_group(ind, table[rows])
+        assert not np.any(diagonal.x)
+        for pauli, coeff, (diag, diag_coeff) in zip(
+            table[rows].labels(), table[rows].coeffs, diagonal.items()
+        ):
+            sign, expected = grouper.diagonalize(pauli)
+            assert diag == expected and diag_coeff == sign * coeff
+
+
+def test_fewer_groups():
+    pauli_list = ["xx", "yy", "zz"]
+    assert FullCommute(pauli_list).num_groups == 1
+    assert Bitwise(pauli_list).num_groups == 3
+
+
+def test_no_qubitwise_circuit():
+    grouper = FullCommute(["xx", "yy"])
+    assert not hasattr(grouper, "circuit")
+    assert grouper.diagonal_circuit("xx").num_qubits == 2
+
+
+def test_generic_single_group():
+    h = {"xx": 1.0, "yy": -2.0, "zz": 0.5}
+    result = generic(FullCommute, lexico, h, t=0.7)
+    assert circuit_eq(result, trotter(h, t=0.7))
+
+
+def test_generic_multiple_groups():
+    h = {"xxi": 1.0, "yyi": -2.0, "izz": 0.5, "zxy": 0.3, "xzi": -0.7}
+    grouper = FullCommute(set(h.keys()))
+    result = generic(FullCommute, lexico, h, t=0.5, reps=2)
+
+    check = False
+    for order in [grouper.groups, grouper.groups[::-1]]:
+        expected = QuantumCircuit(3)
+        for _ in range(2):
+            for group in order:
+                expected = expected.compose(trotter({p: h[p] for p in group}, t=0.25))
+        check = check or circuit_eq(result, expected)
+
+    assert check
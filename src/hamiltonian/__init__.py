@@ -1 +1,2 @@
-from .random_hamiltonian import random_hamiltonian
+from .random_hamiltonian import random_hamiltonian, random_table, iter_random_tables
+from .table import PauliTable, as_table, as_dict, symplectic_commutes
@@ -0,0 +1,133 @@
+from typing import NamedTuple
+
+import numpy as np
+
+from .table import PauliTable, popcount, symplectic_commutes
+
+# Default number of operator pairs processed at a time
+CHUNK_SIZE = 1 << 20
+
+_PHASES = np.array([1, 1j, -1, -1j])
+
+
+class PauliSum(NamedTuple):
+    """
+    Sum of Pauli operators with complex coefficients, each row is the packed
+    X and Z words of a Hermitian Pauli operator as in `PauliTable`.
+    """
+
+    x: np.ndarray
+    z: np.ndarray
+    coeffs: np.ndarray
+
+    @classmethod
+    def from_table(cls, table: PauliTable) -> "PauliSum":
+        return cls(table.x, table.z, table.coeffs.astype(np.complex128))
+
+    def __len__(self) -> int:
+        return self.x.shape[0]
+
+    def norm_bound(self) -> float:
+        """
+        Sum of the absolute values of the coefficients, an upper bound of the
+        spectral norm.
+        """
+        return float(np.sum(np.abs(self.coeffs)))
+
+
+def pauli_products(
+    x1: np.ndarray, z1: np.ndarray, x2: np.ndarray, z2: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Vectorized products `P_1 P_2 = i^phase P` of Hermitian Pauli operators,
+    the arguments are broadcast against each other.
+
+    Returns: Packed words of `P` and the phase exponent modulo 4.
+    """
+    x, z = x1 ^ x2, z1 ^ z2
+    # Every Y contributes `i` to the Hermitian operator `i^#Y X^x Z^z`, and
+    # moving the Z of the first operator past the X of the second flips the sign.
+    phase = (
+        popcount(x1 & z1) + popcount(x2 & z2) + 2 * popcount(z1 & x2) - popcount(x & z)
+    )
+    return x, z, phase % 4
+
+
+def collect(terms: PauliSum) -> PauliSum:
+    """
+    Adds up the coefficients of repeated operators.
+    """
+    if len(terms) == 0:
+        return terms
+    rows = np.ascontiguousarray(np.concatenate([terms.x, terms.z], axis=1))
+    keys = rows.view(np.dtype((np.void, rows.dtype.itemsize * rows.shape[1])))
+    _, first, inverse = np.unique(keys.ravel(), return_index=True, return_inverse=True)
+    coeffs = np.zeros(first.size, dtype=np.complex128)
+    np.add.at(coeffs, inverse, terms.coeffs)
+    return PauliSum(terms.x[first], terms.z[first], coeffs)
+
+
+def _blocks(num_left: int, num_right: int, chunk_size: int):
+    rows = max(1, chunk_size // max(1, num_right))
+    for start in range(0, num_left, rows):
+        yield slice(start, min(start + rows, num_left))
+
+
+def _anticommuting(a: PauliSum, b: PauliSum, block: slice) -> np.ndarray:
+    return ~symplectic_commutes(
+        a.x[block, None, :], a.z[block, None, :], b.x[None, :, :], b.z[None, :, :]
+    )
+
+
+def commutator(
+    a: PauliSum, b: PauliSum, chunk_size: int = CHUNK_SIZE, reduce: bool = True
+) -> PauliSum:
+    """
+    Commutator `[A, B]`, only anticommuting pairs contribute `2 a b P_a P_b`.
+    The pairs are processed in blocks of at most `chunk_size`.
+
+    Inputs:
+        - a, b: Operators.
+        - chunk_size: Largest number of pairs checked at once.
+        - reduce: Add up repeated operators, which is only needed when the
+        same product can come from different pairs.
+
+    Returns: PauliSum of the commutator.
+    """
+    parts = []
+    for block in _blocks(len(a), len(b), chunk_size):
+        rows, cols = np.nonzero(_anticommuting(a, b, block))
+        if rows.size == 0:
+            continue
+        rows += block.start
+        x, z, phase = pauli_products(a.x[rows], a.z[rows], b.x[cols], b.z[cols])
+        coeffs = 2 * a.coeffs[rows] * b.coeffs[cols] * _PHASES[phase]
+        part = PauliSum(x, z, coeffs)
+        parts.append(collect(part) if reduce else part)
+
+    words = a.x.shape[1]
+    if len(parts) == 0:
+        empty = np.zeros((0, words), dtype=np.uint64)
+        return PauliSum(empty, empty, np.zeros(0, dtype=np.complex128))
+
+    result = PauliSum(
+        np.concatenate([part.x for part in parts]),
+        np.concatenate([part.z for part in parts]),
+        np.concatenate([part.coeffs for part in parts]),
+    )
+    return collect(result) if reduce and len(parts) > 1 else result
+
+
+def commutator_norm_bound(
+    a: PauliSum, b: PauliSum, chunk_size: int = CHUNK_SIZE
+) -> float:
+    """
+    Triangle inequality bound `sum 2 |a| |b|` over the anticommuting pairs of
+    `||[A, B]||`, without constructing the products.
+    """
+    abs_a, abs_b = np.abs(a.coeffs), np.abs(b.coeffs)
+    total = 0.0
+    for block in _blocks(len(a), len(b), chunk_size):
+        anti = _anticommuting(a, b, block)
+        total += 2 * float(abs_a[block] @ (anti @ abs_b))
+    return total
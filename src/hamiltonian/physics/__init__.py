@@ -0,0 +1,14 @@
+from .ising import ising_1d
+from .heisenberg import heisenberg_xxz
+from .lattice import (
+    Lattice,
+    chain,
+    cubic,
+    from_edges,
+    heisenberg,
+    hypercubic,
+    ising,
+    site_terms,
+    square,
+    xxz,
+)
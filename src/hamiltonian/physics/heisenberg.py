@@ -1,3 +1,6 @@
+from .lattice import chain, xxz
+
+
 def heisenberg_xxz(
     qubits: int, coupling_field: float, external_field: float, normalize=False
 ) -> dict[str, float]:
@@ -18,28 +21,7 @@ def heisenberg_xxz(
     if qubits <= 1:
         raise ValueError("Heisenberg XXZ model is not defined for one qubit")
 
-    ham: dict[str, float] = {}
-    i_n = ["i"] * qubits
-
-    for i in range(qubits - 1):
-        j = i + 1
-        p_i = i_n
-
-        p_i[i] = "x"
-        p_i[j] = "x"
-        ham["".join(p_i)] = coupling_field
-
-        p_i[i] = "y"
-        p_i[j] = "y"
-        ham["".join(p_i)] = coupling_field
-
-        p_i[i] = "z"
-        p_i[j] = "z"
-        ham["".join(p_i)] = external_field
-
-        # Reset to avoid large copies
-        p_i[i] = "i"
-        p_i[j] = "i"
+    ham = xxz(chain(qubits), coupling_field, external_field).to_dict()
 
     if normalize:
         norm = sum(ham.values())
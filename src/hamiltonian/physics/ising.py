@@ -1,3 +1,6 @@
+from .lattice import chain, ising
+
+
 def ising_1d(
     qubits: int, energy_prefactor: float, external_field: float, normalize=False
 ) -> dict[str, float]:
@@ -18,27 +21,7 @@ def ising_1d(
     if qubits <= 0:
         raise ValueError("Invalid number of qubits.")
 
-    ham: dict[str, float] = {}
-    i_n = ["i"] * qubits
-
-    for i in range(qubits - 1):
-        j = i + 1
-        p_i = i_n
-        p_i[i] = "z"
-        p_i[j] = "z"
-        ham["".join(p_i)] = energy_prefactor
-
-        # Reset to avoid copying
-        p_i[i] = "i"
-        p_i[j] = "i"
-
-    for i in range(qubits):
-        p_i = i_n
-        p_i[i] = "x"
-        ham["".join(p_i)] = external_field
-
-        # Reset to avoid copying
-        p_i[i] = "i"
+    ham = ising(chain(qubits), energy_prefactor, hx=external_field).to_dict()
 
     if normalize:
         norm = sum(ham.values())
@@ -0,0 +1,206 @@
+from typing import NamedTuple, Union
+
+import numpy as np
+
+from ..table import WORD_BITS, PauliTable, num_words
+
+# Coefficients are either shared by all the terms of a kind or given per term
+Coeff = Union[float, np.ndarray]
+
+
+class Lattice(NamedTuple):
+    """
+    Sites `0, ..., num_sites - 1` along with the pairs of interacting sites,
+    site `s` is qubit `s` of the Hamiltonian.
+    """
+
+    num_sites: int
+    edges: np.ndarray
+
+
+def from_edges(num_sites: int, edges) -> Lattice:
+    """
+    Lattice with an arbitrary list of edges.
+
+    Raises:
+        - ValueError: if an edge is a self loop or has a site out of range.
+    """
+    edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+    if num_sites <= 0:
+        raise ValueError("Invalid number of sites.")
+    if np.any((edges < 0) | (edges >= num_sites)):
+        raise ValueError("Edge has a site outside of the lattice.")
+    if np.any(edges[:, 0] == edges[:, 1]):
+        raise ValueError("Edges can not connect a site to itself.")
+    return Lattice(num_sites, edges)
+
+
+def hypercubic(
+    shape: tuple[int, ...], periodic: Union[bool, tuple[bool, ...]] = False
+) -> Lattice:
+    """
+    Nearest neighbour lattice of the given shape, sites are numbered in row
+    major order. Periodic boundaries only add the wrapping edge to dimensions
+    longer than 2, where it is not already an edge.
+
+    Inputs:
+        - shape: Number of sites along each dimension.
+        - periodic: Boundary condition for all, or each, of the dimensions.
+
+    Returns: Lattice
+    """
+    shape = tuple(int(length) for length in shape)
+    if len(shape) == 0 or any(length <= 0 for length in shape):
+        raise ValueError("Invalid lattice shape.")
+    if isinstance(periodic, bool):
+        periodic = (periodic,) * len(shape)
+    if len(periodic) != len(shape):
+        raise ValueError("Expected one boundary condition per dimension.")
+
+    sites = np.arange(int(np.prod(shape))).reshape(shape)
+    edges = []
+    for axis, length in enumerate(shape):
+        ends = np.roll(sites, -1, axis=axis)
+        if not (periodic[axis] and length > 2):
+            # Drops the wrapping edge from the last slice along the axis
+            keep = [slice(None)] * len(shape)
+            keep[axis] = slice(0, length - 1)
+            starts, ends = sites[tuple(keep)], ends[tuple(keep)]
+        else:
+            starts = sites
+        edges.append(np.stack([starts.ravel(), ends.ravel()], axis=1))
+
+    return Lattice(sites.size, np.concatenate(edges))
+
+
+def chain(length: int, periodic: bool = False) -> Lattice:
+    return hypercubic((length,), periodic)
+
+
+def square(rows: int, cols: int, periodic: bool = False) -> Lattice:
+    return hypercubic((rows, cols), periodic)
+
+
+def cubic(x: int, y: int, z: int, periodic: bool = False) -> Lattice:
+    return hypercubic((x, y, z), periodic)
+
+
+def site_terms(
+    num_sites: int, sites: np.ndarray, paulis: str, coeffs: Coeff
+) -> PauliTable:
+    """
+    Packs the terms that apply the same Pauli operators to different sites,
+    setting the bits of every column at once.
+
+    Inputs:
+        - num_sites: Number of qubits.
+        - sites: Integer array of shape (terms, len(paulis)).
+        - paulis: Pauli operator applied to each column of sites.
+        - coeffs: Coefficient of all the terms, or one per term.
+
+    Returns: PauliTable with one term per row of sites.
+    """
+    sites = np.asarray(sites, dtype=np.int64).reshape(-1, len(paulis))
+    num_terms = sites.shape[0]
+    x = np.zeros((num_terms, num_words(num_sites)), dtype=np.uint64)
+    z = np.zeros_like(x)
+    rows = np.arange(num_terms)
+
+    for col, pauli in enumerate(paulis.lower()):
+        words = sites[:, col] // WORD_BITS
+        masks = np.left_shift(
+            np.uint64(1), (sites[:, col] % WORD_BITS).astype(np.uint64)
+        )
+        if pauli in "xy":
+            x[rows, words] |= masks
+        if pauli in "zy":
+            z[rows, words] |= masks
+
+    coeffs = np.broadcast_to(np.asarray(coeffs, dtype=np.float64), (num_terms,))
+    return PauliTable(x, z, coeffs.copy(), num_sites)
+
+
+def _fields(
+    lattice: Lattice, hx: Union[Coeff, None], hz: Union[Coeff, None]
+) -> list[PauliTable]:
+    sites = np.arange(lattice.num_sites)[:, None]
+    return [
+        site_terms(lattice.num_sites, sites, pauli, field)
+        for pauli, field in (("x", hx), ("z", hz))
+        if field is not None
+    ]
+
+
+def _couplings(
+    lattice: Lattice, couplings: list[tuple[str, Coeff]]
+) -> list[PauliTable]:
+    return [
+        site_terms(lattice.num_sites, lattice.edges, pauli * 2, coupling)
+        for pauli, coupling in couplings
+        if lattice.edges.shape[0] > 0
+    ]
+
+
+def _combine(lattice: Lattice, tables: list[PauliTable]) -> PauliTable:
+    if len(tables) == 0:
+        return site_terms(lattice.num_sites, np.zeros((0, 1)), "i", 0.0)
+    return PauliTable.concatenate(tables)
+
+
+def ising(
+    lattice: Lattice,
+    j: Coeff,
+    hx: Union[Coeff, None] = None,
+    hz: Union[Coeff, None] = None,
+) -> PauliTable:
+    """
+    Ising model with transverse and longitudinal fields:
+
+    :math:`j sum_{<i, j>} Z_i Z_j + hx sum_i X_i + hz sum_i Z_i`
+
+    Inputs:
+        - lattice: Sites and interacting pairs.
+        - j: Coupling, shared or one per edge.
+        - hx, hz: Transverse and longitudinal fields, shared or one per site,
+        left out if None.
+
+    Returns: PauliTable with the couplings followed by the fields.
+    """
+    return _combine(lattice, _couplings(lattice, [("z", j)]) + _fields(lattice, hx, hz))
+
+
+def heisenberg(
+    lattice: Lattice,
+    jx: Coeff,
+    jy: Coeff,
+    jz: Coeff,
+    hx: Union[Coeff, None] = None,
+    hz: Union[Coeff, None] = None,
+) -> PauliTable:
+    """
+    XYZ Heisenberg model with external fields:
+
+    :math:`sum_{<i, j>} (jx X_i X_j + jy Y_i Y_j + jz Z_i Z_j) + hx sum_i X_i
+    + hz sum_i Z_i`
+
+    Inputs:
+        - lattice: Sites and interacting pairs.
+        - jx, jy, jz: Couplings, shared or one per edge.
+        - hx, hz: External fields, shared or one per site, left out if None.
+
+    Returns: PauliTable with the XX, YY and ZZ couplings followed by the fields.
+    """
+    couplings = [("x", jx), ("y", jy), ("z", jz)]
+    return _combine(lattice, _couplings(lattice, couplings) + _fields(lattice, hx, hz))
+
+
+def xxz(
+    lattice: Lattice,
+    j: Coeff,
+    jz: Coeff,
+    hz: Union[Coeff, None] = None,
+) -> PauliTable:
+    """
+    XXZ Heisenberg model, the XYZ model with `jx = jy = j`.
+    """
+    return heisenberg(lattice, j, j, jz, hz=hz)
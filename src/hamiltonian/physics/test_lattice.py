@@ -0,0 +1,105 @@
+import numpy as np
+import pytest
+
+from .lattice import (
+    chain,
+    cubic,
+    from_edges,
+    heisenberg,
+    hypercubic,
+    ising,
+    square,
+    xxz,
+)
+
+
+def _label(num_sites: int, ops: dict[int, str]) -> str:
+    # Site `s` is qubit `s`, which is position `n - 1 - s` of the label
+    chars = ["i"] * num_sites
+    for site, pauli in ops.items():
+        chars[num_sites - 1 - site] = pauli
+    return "".join(chars)
+
+
+@pytest.mark.parametrize(
+    "lattice,num_edges",
+    [
+        (chain(5), 4),
+        (chain(5, periodic=True), 5),
+        (chain(2, periodic=True), 1),
+        (chain(1, periodic=True), 0),
+        (square(3, 4), 3 * 3 + 2 * 4),
+        (square(3, 4, periodic=True), 2 * 12),
+        (hypercubic((2, 5), periodic=(False, True)), 5 + 2 * 5),
+        (cubic(2, 3, 4), 1 * 12 + 2 * 8 + 3 * 6),
+        (cubic(3, 3, 3, periodic=True), 3 * 27),
+    ],
+)
+def test_edges(lattice, num_edges):
+    edges = lattice.edges
+    assert edges.shape == (num_edges, 2)
+    assert np.all(edges[:, 0] != edges[:, 1])
+    # No edge appears twice, in either direction
+    assert len({tuple(sorted(edge)) for edge in edges.tolist()}) == num_edges
+
+
+def test_square_neighbours():
+    lattice = square(3, 3, periodic=True)
+    neighbours = {tuple(sorted(edge)) for edge in lattice.edges.tolist()}
+    # Site 4 is the center, site 0 wraps around to 2 and 6
+    assert {(1, 4), (3, 4), (4, 5), (4, 7)} <= neighbours
+    assert {(0, 2), (0, 6)} <= neighbours
+
+
+@pytest.mark.parametrize("shape", [(4,), (3, 3), (70,)])
+def test_ising(shape):
+    lattice = hypercubic(shape, periodic=True)
+    n = lattice.num_sites
+    ham = ising(lattice, 1.5, hx=-0.5, hz=0.25).to_dict()
+
+    expected = {}
+    for a, b in lattice.edges.tolist():
+        expected[_label(n, {a: "z", b: "z"})] = 1.5
+    for site in range(n):
+        expected[_label(n, {site: "x"})] = -0.5
+        expected[_label(n, {site: "z"})] = 0.25
+
+    assert ham == expected
+
+
+def test_heisenberg():
+    lattice = from_edges(4, [(0, 3), (1, 2)])
+    table = heisenberg(lattice, 1.0, 2.0, [3.0, 4.0], hx=np.arange(4.0))
+
+    expected = {
+        "xiix": 1.0,
+        "ixxi": 1.0,
+        "yiiy": 2.0,
+        "iyyi": 2.0,
+        "ziiz": 3.0,
+        "izzi": 4.0,
+        "iiix": 0.0,
+        "iixi": 1.0,
+        "ixii": 2.0,
+        "xiii": 3.0,
+    }
+    assert table.to_dict() == expected
+    assert xxz(lattice, 1.0, 3.0).to_dict() == heisenberg(lattice, 1, 1, 3).to_dict()
+
+
+def test_no_edges():
+    assert len(ising(chain(1), 1.0)) == 0
+    assert ising(chain(1), 1.0, hx=2.0).to_dict() == {"x": 2.0}
+
+
+@pytest.mark.parametrize("edges", [[(0, 0)], [(0, 3)], [(-1, 1)]])
+def test_invalid_edges(edges):
+    with pytest.raises(ValueError):
+        from_edges(3, edges)
+
+
+def test_invalid_shape():
+    with pytest.raises(ValueError):
+        hypercubic((3, 0))
+    with pytest.raises(ValueError):
+        hypercubic((3, 3), periodic=(True,))
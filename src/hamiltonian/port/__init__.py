@@ -1 +1,8 @@
 from .port import save_hamiltonian, load_hamiltonian
+from .binary import save_table, load_table, iter_table, read_header, content_hash
+from .stream import (
+    HamiltonianWriter,
+    iter_hamiltonian,
+    read_terms,
+    save_terms,
+)
@@ -0,0 +1,200 @@
+import hashlib
+import struct
+from typing import Iterator, Union
+
+import numpy as np
+from qiskit.quantum_info import SparsePauliOp
+
+from ..table import PauliTable, as_table, num_words
+
+# Layout of the file, every section is little endian and 8 byte aligned:
+#   header: magic, version, reserved, qubits, terms, SHA-256 of the sections
+#   x: uint64 words of shape (terms, words)
+#   z: uint64 words of shape (terms, words)
+#   coeffs: float64 of shape (terms,)
+MAGIC = b"PAULITAB"
+VERSION = 1
+_HEADER = struct.Struct("<8sIIQQ32s")
+HEADER_SIZE = _HEADER.size
+
+
+class Header:
+    """
+    Header of a binary Hamiltonian file.
+    """
+
+    def __init__(self, num_qubits: int, num_terms: int, digest: bytes):
+        self.num_qubits = num_qubits
+        self.num_terms = num_terms
+        self.digest = digest
+
+    @property
+    def num_words(self) -> int:
+        return num_words(self.num_qubits)
+
+    @property
+    def file_size(self) -> int:
+        return HEADER_SIZE + 8 * self.num_terms * (2 * self.num_words + 1)
+
+    def offsets(self) -> tuple[int, int, int]:
+        """
+        Byte offsets of the X words, the Z words and the coefficients.
+        """
+        plane = 8 * self.num_terms * self.num_words
+        return HEADER_SIZE, HEADER_SIZE + plane, HEADER_SIZE + 2 * plane
+
+
+def _sections(table: PauliTable) -> list[np.ndarray]:
+    return [
+        np.ascontiguousarray(table.x, dtype="<u8"),
+        np.ascontiguousarray(table.z, dtype="<u8"),
+        np.ascontiguousarray(table.coeffs, dtype="<f8"),
+    ]
+
+
+def content_hash(table: PauliTable) -> bytes:
+    """
+    SHA-256 of the packed words and the coefficients, in the order they are
+    stored in the file.
+    """
+    digest = hashlib.sha256()
+    for section in _sections(table):
+        digest.update(section.data)
+    return digest.digest()
+
+
+def save_table(
+    ham: Union[dict[str, float], PauliTable, SparsePauliOp], file: str
+) -> Header:
+    """
+    Writes the Hamiltonian in the binary format, the packed words and the
+    coefficients are written as they are stored in memory.
+
+    Inputs:
+        - ham: Hamiltonian in any of the supported formats.
+        - file: Path of the file.
+
+    Returns: Header of the written file.
+    """
+    table = as_table(ham)
+    sections = _sections(table)
+    header = Header(table.num_qubits, table.num_terms, content_hash(table))
+
+    try:
+        with open(file, "wb") as outfile:
+            outfile.write(
+                _HEADER.pack(
+                    MAGIC,
+                    VERSION,
+                    0,
+                    header.num_qubits,
+                    header.num_terms,
+                    header.digest,
+                )
+            )
+            for section in sections:
+                outfile.write(section.data)
+    except FileNotFoundError:
+        raise ValueError("File not found")
+
+    return header
+
+
+def read_header(file: str) -> Header:
+    """
+    Reads and validates the header of a binary Hamiltonian file.
+
+    Raises:
+        - ValueError: if the file does not exist, is not in the binary format
+        or is truncated.
+    """
+    try:
+        with open(file, "rb") as infile:
+            raw = infile.read(HEADER_SIZE)
+            infile.seek(0, 2)
+            size = infile.tell()
+    except FileNotFoundError:
+        raise ValueError("File not found")
+
+    if len(raw) < HEADER_SIZE:
+        raise ValueError("Incorrect format")
+
+    magic, version, _, num_qubits, num_terms, digest = _HEADER.unpack(raw)
+    if magic != MAGIC:
+        raise ValueError("Incorrect format")
+    if version != VERSION:
+        raise ValueError(f"Unsupported version: {version}")
+
+    header = Header(num_qubits, num_terms, digest)
+    if size != header.file_size:
+        raise ValueError("Incorrect format, file is truncated")
+
+    return header
+
+
+def load_table(file: str, mmap: bool = True, verify: bool = False) -> PauliTable:
+    """
+    Loads a Hamiltonian written by `save_table`. By default the arrays of the
+    table are read only memory maps of the file, so nothing is read until the
+    terms are used.
+
+    Inputs:
+        - file: Path of the file.
+        - mmap: Memory map the file instead of reading it.
+        - verify: Check the content hash, which reads the whole file.
+
+    Returns: PauliTable
+
+    Raises:
+        - ValueError: if the file is invalid or the hash does not match.
+    """
+    header = read_header(file)
+    shape = (header.num_terms, header.num_words)
+    x_offset, z_offset, coeff_offset = header.offsets()
+
+    if mmap and header.num_terms > 0:
+
+        def section(dtype, offset, shape):
+            return np.memmap(file, dtype=dtype, mode="r", offset=offset, shape=shape)
+
+    else:
+
+        def section(dtype, offset, shape):
+            count = int(np.prod(shape))
+            data = np.fromfile(file, dtype=dtype, count=count, offset=offset)
+            return data.reshape(shape)
+
+    table = PauliTable(
+        section("<u8", x_offset, shape),
+        section("<u8", z_offset, shape),
+        section("<f8", coeff_offset, (header.num_terms,)),
+        header.num_qubits,
+    )
+
+    if verify and content_hash(table) != header.digest:
+        raise ValueError("Content hash does not match, file is corrupted")
+
+    return table
+
+
+def iter_table(
+    file: str, chunk_size: int = 1 << 16, start: int = 0, stop: Union[int, None] = None
+) -> Iterator[PauliTable]:
+    """
+    Iterates over a range of terms of a binary Hamiltonian file in chunks.
+    Every chunk is a view of the memory map, so only the chunk is read.
+
+    Inputs:
+        - file: Path of the file.
+        - chunk_size: Maximum number of terms in every chunk.
+        - start, stop: Range of terms, the whole file by default.
+
+    Returns: Iterator over PauliTable chunks.
+    """
+    if chunk_size <= 0:
+        raise ValueError("Chunk size must be positive.")
+
+    table = load_table(file)
+    stop = table.num_terms if stop is None else min(stop, table.num_terms)
+    for begin in range(start, stop, chunk_size):
+        yield table[begin : min(begin + chunk_size, stop)]
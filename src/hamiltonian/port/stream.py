@@ -0,0 +1,204 @@
+import json
+import re
+from typing import Iterable, Iterator
+
+# Default number of terms in every batch
+BATCH_SIZE = 1 << 16
+# Number of characters read from the file at a time
+_BLOCK_SIZE = 1 << 16
+
+_WHITESPACE = re.compile(r"\s*")
+_NUMBER = re.compile(r"-?(?:[0-9]+(?:\.[0-9]*)?(?:[eE][-+]?[0-9]+)?|Infinity|NaN)")
+_DELIMITER = re.compile(r"[\s,}]")
+# Characters of a string up to its closing quote, with valid escapes only
+_STRING_CHARS = re.compile(r'(?:[^"\\\x00-\x1f]+|\\["\\/bfnrt]|\\u[0-9a-fA-F]{4})*')
+
+
+class _Reader:
+    """
+    Characters of a file read block by block, only the unparsed part of the
+    current block is kept.
+    """
+
+    def __init__(self, infile):
+        self._file = infile
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self) -> bool:
+        """
+        Reads the next block, returns False at the end of the file.
+        """
+        if self.eof:
+            return False
+        block = self._file.read(_BLOCK_SIZE)
+        if len(block) == 0:
+            self.eof = True
+            return False
+        self.buffer = self.buffer[self.pos :] + block
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """
+        Next character that is not whitespace, empty at the end of the file.
+        """
+        while True:
+            self.pos = _WHITESPACE.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer) or not self.fill():
+                return self.buffer[self.pos : self.pos + 1]
+
+    def expect(self, char: str):
+        if self.peek() != char:
+            raise ValueError("Incorrect format")
+        self.pos += 1
+
+    def string(self) -> str:
+        """
+        Next JSON string. The closing quote is found before decoding, so the
+        string is decoded once, and an invalid character or escape fails as
+        soon as its block is read rather than at the end of the file.
+        """
+        if self.peek() != '"':
+            raise ValueError("Incorrect format")
+        # Characters after the opening quote that are already scanned
+        scanned = 1
+        while True:
+            end = _STRING_CHARS.match(self.buffer, self.pos + scanned).end()
+            if end < len(self.buffer) and self.buffer[end] == '"':
+                break
+            # Only the end of the block, or an escape cut by it, may continue
+            if end + 6 <= len(self.buffer) or (
+                end < len(self.buffer) and self.buffer[end] != "\\"
+            ):
+                raise ValueError("Incorrect format")
+            scanned = end - self.pos
+            if not self.fill():
+                raise ValueError("Incorrect format")
+
+        value = json.loads(self.buffer[self.pos : end + 1])
+        self.pos = end + 1
+        return value
+
+    def number(self) -> float:
+        self.peek()
+        # The number may continue in the next block unless it is delimited
+        while _DELIMITER.search(self.buffer, self.pos) is None and self.fill():
+            pass
+
+        match = _NUMBER.match(self.buffer, self.pos)
+        if match is None:
+            raise ValueError("Incorrect format")
+        self.pos = match.end()
+        return float(json.loads(match.group()))
+
+
+def iter_hamiltonian(
+    file: str, batch_size: int = BATCH_SIZE
+) -> Iterator[list[tuple[str, float]]]:
+    """
+    Reads a JSON Hamiltonian written by `save_hamiltonian` incrementally, the
+    memory used is bounded by the batch size rather than the size of the file.
+
+    Inputs:
+        - file: Path of the JSON file.
+        - batch_size: Maximum number of terms in every batch.
+
+    Returns: Iterator over batches of `(pauli, coeff)` pairs, in file order.
+
+    Raises:
+        - ValueError: if the file does not exist or is not a JSON object of
+        numbers.
+    """
+    if batch_size <= 0:
+        raise ValueError("Batch size must be positive.")
+
+    try:
+        infile = open(file, "r")
+    except FileNotFoundError:
+        raise ValueError("File not found")
+
+    with infile:
+        reader = _Reader(infile)
+        reader.expect("{")
+        batch: list[tuple[str, float]] = []
+
+        if reader.peek() == "}":
+            reader.pos += 1
+        else:
+            while True:
+                pauli = reader.string()
+                reader.expect(":")
+                batch.append((pauli, reader.number()))
+                if len(batch) == batch_size:
+                    yield batch
+                    batch = []
+
+                if reader.peek() == "}":
+                    reader.pos += 1
+                    break
+                reader.expect(",")
+
+        if reader.peek() != "":
+            raise ValueError("Incorrect format")
+        if len(batch) > 0:
+            yield batch
+
+
+def read_terms(file: str, batch_size: int = BATCH_SIZE) -> Iterator[tuple[str, float]]:
+    """
+    Same as `iter_hamiltonian`, one term at a time. The iterator can be passed
+    wherever a Hamiltonian is expected.
+    """
+    for batch in iter_hamiltonian(file, batch_size):
+        yield from batch
+
+
+class HamiltonianWriter:
+    """
+    Writes the terms of a Hamiltonian to a JSON file as they are generated, in
+    the same format as `save_hamiltonian`. The JSON object is terminated when
+    the writer is closed, or on exit when used as a context manager.
+    """
+
+    def __init__(self, file: str):
+        try:
+            self._file = open(file, "w")
+        except FileNotFoundError:
+            raise ValueError("File not found")
+
+        self._file.write("{")
+        self.num_terms = 0
+
+    def write(self, pauli: str, coeff: float):
+        if self.num_terms > 0:
+            self._file.write(", ")
+        self._file.write(f"{json.dumps(pauli)}: {json.dumps(float(coeff))}")
+        self.num_terms += 1
+
+    def write_terms(self, terms: Iterable[tuple[str, float]]):
+        for pauli, coeff in terms:
+            self.write(pauli, coeff)
+
+    def close(self):
+        if not self._file.closed:
+            self._file.write("}")
+            self._file.close()
+
+    def __enter__(self) -> "HamiltonianWriter":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def save_terms(terms: Iterable[tuple[str, float]], file: str) -> int:
+    """
+    Writes `(pauli, coeff)` pairs to a JSON file without collecting them.
+
+    Returns: Number of terms written.
+    """
+    with HamiltonianWriter(file) as writer:
+        writer.write_terms(terms)
+    return writer.num_terms
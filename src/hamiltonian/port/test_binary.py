@@ -0,0 +1,87 @@
+import numpy as np
+import pytest
+
+from ..table import PauliTable
+from .binary import HEADER_SIZE, iter_table, load_table, read_header, save_table
+
+
+def _table(num_terms: int, num_qubits: int, seed: int = 0) -> PauliTable:
+    rng = np.random.default_rng(seed)
+    return PauliTable.from_bits(
+        rng.random((num_terms, num_qubits)) < 0.5,
+        rng.random((num_terms, num_qubits)) < 0.5,
+        rng.normal(size=num_terms),
+    )
+
+
+@pytest.mark.parametrize("num_qubits", [1, 64, 70])
+def test_round_trip(tmp_path, num_qubits):
+    file = str(tmp_path / "ham.bin")
+    table = _table(50, num_qubits)
+    header = save_table(table, file)
+
+    assert read_header(file).digest == header.digest
+    for mmap in [True, False]:
+        loaded = load_table(file, mmap=mmap, verify=True)
+        assert loaded.num_qubits == num_qubits
+        assert np.array_equal(loaded.x, table.x)
+        assert np.array_equal(loaded.z, table.z)
+        assert np.array_equal(loaded.coeffs, table.coeffs)
+
+
+def test_memory_map(tmp_path):
+    file = str(tmp_path / "ham.bin")
+    save_table({"xz": 1.0, "yi": -2.0}, file)
+    table = load_table(file)
+
+    # The table wraps the memory map without copying it
+    assert isinstance(table.x.base, np.memmap) or isinstance(table.x, np.memmap)
+    assert not table.coeffs.flags.writeable
+    assert table.to_dict() == {"xz": 1.0, "yi": -2.0}
+
+
+def test_chunks(tmp_path):
+    file = str(tmp_path / "ham.bin")
+    table = _table(10, 3)
+    save_table(table, file)
+
+    chunks = list(iter_table(file, chunk_size=4))
+    assert [len(chunk) for chunk in chunks] == [4, 4, 2]
+    assert sum((chunk.labels() for chunk in chunks), []) == table.labels()
+
+    chunks = list(iter_table(file, chunk_size=3, start=2, stop=7))
+    assert [len(chunk) for chunk in chunks] == [3, 2]
+    assert np.array_equal(np.concatenate([c.coeffs for c in chunks]), table.coeffs[2:7])
+
+
+def test_empty(tmp_path):
+    file = str(tmp_path / "ham.bin")
+    save_table(PauliTable(np.zeros((0, 1)), np.zeros((0, 1)), [], 3), file)
+    assert len(load_table(file, verify=True)) == 0
+
+
+def test_invalid(tmp_path):
+    file = str(tmp_path / "ham.bin")
+    save_table(_table(5, 4), file)
+    with open(file, "rb") as infile:
+        data = bytearray(infile.read())
+
+    with pytest.raises(ValueError):
+        load_table(str(tmp_path / "missing.bin"))
+
+    with open(file, "wb") as outfile:
+        outfile.write(data[:-8])
+    with pytest.raises(ValueError):
+        load_table(file)
+
+    with open(file, "wb") as outfile:
+        outfile.write(b"NOTPAULI" + data[8:])
+    with pytest.raises(ValueError):
+        load_table(file)
+
+    data[HEADER_SIZE] ^= 1
+    with open(file, "wb") as outfile:
+        outfile.write(data)
+    load_table(file)
+    with pytest.raises(ValueError):
+        load_table(file, verify=True)
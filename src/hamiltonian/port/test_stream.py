@@ -0,0 +1,112 @@
+import json
+
+import numpy as np
+import pytest
+
+from ...trotter.simple import trotter
+from ...utils import circuit_eq
+from ..table import as_table
+from . import stream
+from .port import save_hamiltonian
+from .stream import HamiltonianWriter, iter_hamiltonian, read_terms, save_terms
+
+
+def _hamiltonian(num_terms: int, seed: int = 0) -> dict[str, float]:
+    rng = np.random.default_rng(seed)
+    labels = ["".join(rng.choice(list("ixyz"), 6)) for _ in range(num_terms)]
+    return {
+        label: float(rng.normal() * 10.0 ** rng.integers(-8, 8)) for label in labels
+    }
+
+
+@pytest.mark.parametrize("block_size", [1, 7, 1 << 16])
+def test_read(tmp_path, monkeypatch, block_size):
+    monkeypatch.setattr(stream, "_BLOCK_SIZE", block_size)
+    file = str(tmp_path / "ham.json")
+    ham = _hamiltonian(100)
+    save_hamiltonian(ham, file)
+
+    batches = list(iter_hamiltonian(file, batch_size=30))
+    assert [len(batch) for batch in batches] == [30, 30, 30, len(ham) - 90]
+    assert dict(read_terms(file)) == ham
+
+
+def test_write(tmp_path):
+    file = str(tmp_path / "ham.json")
+    ham = _hamiltonian(20)
+    ham["zzzzzz"] = 3
+
+    assert save_terms(iter(ham.items()), file) == len(ham)
+    with open(file) as infile:
+        assert infile.read() == json.dumps(ham).replace(": 3}", ": 3.0}")
+
+    with HamiltonianWriter(file) as writer:
+        pass
+    assert list(iter_hamiltonian(file)) == []
+
+
+def test_formatting(tmp_path):
+    file = str(tmp_path / "ham.json")
+    with open(file, "w") as outfile:
+        outfile.write('\n{\n  "xz" :1e-3,\n"iy":-2 ,"zz": Infinity}\n')
+    assert list(read_terms(file)) == [("xz", 1e-3), ("iy", -2.0), ("zz", np.inf)]
+
+
+@pytest.mark.parametrize(
+    "content", ['["xz", 1.0]', '{"xz": 1.0', '{"xz" 1.0}', '{"xz": "a"}', "{}{}"]
+)
+def test_invalid(tmp_path, content):
+    file = str(tmp_path / "ham.json")
+    with open(file, "w") as outfile:
+        outfile.write(content)
+    with pytest.raises(ValueError):
+        list(iter_hamiltonian(file))
+
+
+def test_entry_points(tmp_path):
+    file = str(tmp_path / "ham.json")
+    ham = {"xxi": 1.0, "iyz": -0.5, "zzz": 0.25}
+    save_hamiltonian(ham, file)
+
+    table = as_table(read_terms(file))
+    assert table.to_dict() == ham
+    assert circuit_eq(trotter(read_terms(file), 1.0), trotter(ham, 1.0))
+
+
+@pytest.mark.parametrize("block_size", [1, 3, 1 << 16])
+def test_escapes(tmp_path, monkeypatch, block_size):
+    monkeypatch.setattr(stream, "_BLOCK_SIZE", block_size)
+    file = str(tmp_path / "ham.json")
+    ham = {'x"z\\\n': 1.0, "éy": -2.0, "zz": 0.5}
+    with open(file, "w") as outfile:
+        json.dump(ham, outfile)
+    assert dict(read_terms(file)) == ham
+
+
+@pytest.mark.parametrize("key", ['"x\\qz"', '"x\nz"', '"x\\u12g4"'])
+def test_invalid_string_fails_early(tmp_path, monkeypatch, key):
+    monkeypatch.setattr(stream, "_BLOCK_SIZE", 16)
+    file = str(tmp_path / "ham.json")
+    with open(file, "w") as outfile:
+        outfile.write("{" + key + ": 1.0" + " " * 10_000 + "}")
+
+    reads = []
+    original = stream._Reader.fill
+
+    def fill(self):
+        reads.append(None)
+        return original(self)
+
+    monkeypatch.setattr(stream._Reader, "fill", fill)
+    with pytest.raises(ValueError):
+        list(iter_hamiltonian(file))
+    # The rest of the file is never read
+    assert len(reads) < 5
+
+
+def test_unterminated_string(tmp_path):
+    file = str(tmp_path / "ham.json")
+    with open(file, "w") as outfile:
+        outfile.write('{"xz: 1.0}')
+    with pytest.raises(ValueError):
+        list(iter_hamiltonian(file))
@@ -1,12 +1,170 @@
-from qiskit.quantum_info.operators.symplectic.random import random_pauli_list
+import math
+from typing import Iterator, Union
+
 import numpy as np
 
+from .table import WORD_BITS, PauliTable, num_words
+
+Seed = Union[np.random.Generator, int, None]
+
+
+def _row_keys(x: np.ndarray, z: np.ndarray) -> list[bytes]:
+    """
+    Bytes of every packed row, equal exactly when the operators are equal.
+    """
+    rows = np.ascontiguousarray(np.concatenate([x, z], axis=1))
+    dtype = np.dtype((np.void, rows.shape[1] * rows.itemsize))
+    return rows.view(dtype).ravel().tolist()
+
+
+def num_operators(qubits: int, max_weight: Union[int, None] = None) -> int:
+    """
+    Number of distinct Pauli operators on the qubits acting non-trivially on
+    at most `max_weight` of them, including the identity.
+    """
+    if max_weight is None or max_weight >= qubits:
+        return 4**qubits
+    return sum(math.comb(qubits, k) * 3**k for k in range(max_weight + 1))
+
+
+def _draw_rows(
+    rng: np.random.Generator, qubits: int, count: int, max_weight: Union[int, None]
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Draws packed rows uniformly from the operators of weight at most
+    `max_weight`, or from all operators.
+    """
+    if max_weight is None or max_weight >= qubits:
+        words = num_words(qubits)
+        x = rng.integers(0, 2**64, size=(count, words), dtype=np.uint64)
+        z = rng.integers(0, 2**64, size=(count, words), dtype=np.uint64)
+        extra = words * WORD_BITS - qubits
+        if extra > 0:
+            mask = np.uint64((1 << (WORD_BITS - extra)) - 1)
+            x[:, -1] &= mask
+            z[:, -1] &= mask
+        return x, z
+
+    # The weight is drawn with the number of operators of that weight, then
+    # the qubits of the support and a non-identity Pauli for each of them.
+    probs = np.array(
+        [math.comb(qubits, k) * 3**k for k in range(max_weight + 1)], dtype=float
+    )
+    weights = rng.choice(max_weight + 1, size=count, p=probs / probs.sum())
+
+    # Distinct positions are drawn one at a time, the `r`-th free qubit is found
+    # by skipping over the sorted positions taken before it. The first `k` of
+    # them are a uniform subset of size `k`.
+    positions = np.zeros((count, max_weight), dtype=np.int64)
+    for col in range(max_weight):
+        pos = rng.integers(0, qubits - col, size=count)
+        taken = np.sort(positions[:, :col], axis=1)
+        for prev in range(col):
+            pos += pos >= taken[:, prev]
+        positions[:, col] = pos
+
+    codes = rng.integers(1, 4, size=(count, max_weight))
+    x = np.zeros((count, num_words(qubits)), dtype=np.uint64)
+    z = np.zeros_like(x)
+    rows = np.arange(count)
+    for col in range(max_weight):
+        active = col < weights
+        pos, code = positions[active, col], codes[active, col]
+        words = pos // WORD_BITS
+        masks = np.left_shift(np.uint64(1), (pos % WORD_BITS).astype(np.uint64))
+        x[rows[active], words] |= np.where(code != 2, masks, np.uint64(0))
+        z[rows[active], words] |= np.where(code != 1, masks, np.uint64(0))
+    return x, z
+
+
+def iter_random_tables(
+    qubits: int,
+    size: int,
+    chunk_size: int = 1 << 16,
+    seed: Seed = None,
+    max_weight: Union[int, None] = None,
+    low: float = -1.0,
+    high: float = 1.0,
+) -> Iterator[PauliTable]:
+    """
+    Generates a random Hamiltonian with exactly `size` distinct terms in
+    chunks. Rows are drawn directly as packed words, exact duplicates of
+    earlier terms are dropped and replaced with new draws, and coefficients
+    are uniform in `[low, high)`.
+
+    Inputs:
+        - qubits: Number of qubits.
+        - size: Number of distinct terms.
+        - chunk_size: Maximum number of terms in every chunk.
+        - seed: Generator or seed, a fresh generator is used by default.
+        - max_weight: Largest number of qubits a term acts on, unbounded by
+        default.
+        - low, high: Range of the coefficients.
+
+    Returns: Iterator over PauliTable chunks.
+
+    Raises:
+        - ValueError: if there are fewer than `size` distinct operators.
+    """
+    if qubits <= 0:
+        raise ValueError("Invalid number of qubits.")
+    if chunk_size <= 0:
+        raise ValueError("Chunk size must be positive.")
+    if max_weight is not None and max_weight < 0:
+        raise ValueError("Maximum weight must be non-negative.")
+    if size > num_operators(qubits, max_weight):
+        raise ValueError("Not enough distinct Pauli operators for the size.")
+
+    rng = np.random.default_rng(seed)
+    seen: set[bytes] = set()
+    remaining = size
+
+    while remaining > 0:
+        target = min(chunk_size, remaining)
+        xs, zs = [], []
+        found = 0
+
+        while found < target:
+            x, z = _draw_rows(rng, qubits, target - found, max_weight)
+
+            # First occurrence of every new row, in the order drawn
+            first = []
+            for ind, key in enumerate(_row_keys(x, z)):
+                if key not in seen:
+                    seen.add(key)
+                    first.append(ind)
+
+            xs.append(x[first])
+            zs.append(z[first])
+            found += len(first)
+
+        coeffs = rng.uniform(low, high, target)
+        remaining -= target
+        yield PauliTable(np.concatenate(xs), np.concatenate(zs), coeffs, qubits)
+
+
+def random_table(
+    qubits: int,
+    size: int,
+    seed: Seed = None,
+    max_weight: Union[int, None] = None,
+    low: float = -1.0,
+    high: float = 1.0,
+) -> PauliTable:
+    """
+    Same as `iter_random_tables`, with all the terms in a single table.
+    """
+    if size == 0:
+        empty = np.zeros((0, num_words(qubits)), dtype=np.uint64)
+        return PauliTable(empty, empty, [], qubits)
+    return PauliTable.concatenate(
+        list(iter_random_tables(qubits, size, size, seed, max_weight, low, high))
+    )
 
-def random_hamiltonian(qubits: int, size: int, seed: int) -> dict[str, float]:
-    np.random.seed(seed)
 
-    pauli_strs = [
-        str(x).lower() for x in random_pauli_list(qubits, size, seed, phase=False)
-    ]
-    coeffs = np.random.uniform(-1, 1, size)
-    return {p: c for p, c in zip(pauli_strs, coeffs)}
+def random_hamiltonian(qubits: int, size: int, seed: Seed) -> dict[str, float]:
+    """
+    Random Hamiltonian in dictionary form with exactly `size` distinct terms
+    and coefficients uniform in `[-1, 1)`, drawn from a local generator.
+    """
+    return random_table(qubits, size, seed).to_dict()
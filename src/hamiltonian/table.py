@@ -0,0 +1,357 @@
+from typing import Iterable, Iterator, Union
+
+import numpy as np
+from qiskit.quantum_info import SparsePauliOp
+
+# Characters indexed by the symplectic code `x + 2 * z` of a single qubit.
+_LABEL_CHARS = np.frombuffer(b"ixzy", dtype=np.uint8)
+
+# Bits set in every byte value, used for counting bits of packed words.
+_POPCOUNT = np.array([bin(x).count("1") for x in range(256)], dtype=np.uint8)
+
+WORD_BITS = 64
+
+
+def num_words(num_qubits: int) -> int:
+    """
+    Number of uint64 words needed to store one bit per qubit.
+    """
+    return max(1, (num_qubits + WORD_BITS - 1) // WORD_BITS)
+
+
+def pack_bits(bits: np.ndarray) -> np.ndarray:
+    """
+    Packs a boolean array of shape (terms, qubits) into uint64 words of shape
+    (terms, words). Bit `j % 64` of word `j // 64` stores qubit `j`.
+
+    Inputs:
+        - bits: Boolean array, column `j` represents qubit `j`.
+
+    Returns: Packed uint64 array.
+    """
+    bits = np.asarray(bits, dtype=bool)
+    terms, qubits = bits.shape
+    words = num_words(qubits)
+
+    padded = np.zeros((terms, words * WORD_BITS), dtype=bool)
+    padded[:, :qubits] = bits
+    packed = np.packbits(padded, axis=1, bitorder="little")
+    return np.ascontiguousarray(packed).view("<u8").astype(np.uint64, copy=False)
+
+
+def unpack_bits(words: np.ndarray, num_qubits: int) -> np.ndarray:
+    """
+    Inverse of `pack_bits`.
+
+    Inputs:
+        - words: Packed uint64 array of shape (terms, words).
+        - num_qubits: Number of qubits to unpack.
+
+    Returns: Boolean array of shape (terms, qubits).
+    """
+    as_bytes = np.ascontiguousarray(words, dtype="<u8").view(np.uint8)
+    bits = np.unpackbits(as_bytes, axis=-1, bitorder="little")
+    return bits[..., :num_qubits].astype(bool)
+
+
+def popcount(words: np.ndarray) -> np.ndarray:
+    """
+    Counts the set bits of packed rows, summing over the last axis.
+
+    Inputs:
+        - words: uint64 array of any shape.
+
+    Returns: Integer array with the last axis reduced.
+    """
+    words = np.ascontiguousarray(words, dtype=np.uint64)
+    as_bytes = words.view(np.uint8).reshape(words.shape[:-1] + (-1,))
+    return _POPCOUNT[as_bytes].sum(axis=-1, dtype=np.int64)
+
+
+def symplectic_commutes(
+    x: np.ndarray, z: np.ndarray, other_x: np.ndarray, other_z: np.ndarray
+) -> np.ndarray:
+    """
+    Vectorized check of whether Pauli operators commute, which is the case when
+    their symplectic inner product is even. The arguments are broadcast against
+    each other.
+
+    Inputs:
+        - x, z: Packed words of the operators, shape (..., words).
+        - other_x, other_z: Packed words to check against, shape (..., words).
+
+    Returns: Boolean array with the words axis reduced.
+    """
+    return popcount((x & other_z) ^ (z & other_x)) % 2 == 0
+
+
+class PauliTable:
+    """
+    Packed symplectic representation of a Hamiltonian in the Pauli basis. Each
+    term is stored as a row of X and Z bit words along with a real coefficient,
+    so that commutation checks and conversions can be vectorized instead of
+    looping over characters.
+
+    The string labels follow the Qiskit convention that is used by the rest of
+    the project: the character at position `i` acts on qubit `n - 1 - i`.
+    """
+
+    def __init__(
+        self, x: np.ndarray, z: np.ndarray, coeffs: np.ndarray, num_qubits: int
+    ):
+        x = np.asarray(x, dtype=np.uint64)
+        z = np.asarray(z, dtype=np.uint64)
+        coeffs = np.asarray(coeffs, dtype=np.float64)
+
+        if x.ndim != 2 or x.shape != z.shape:
+            raise ValueError("X and Z words must be 2D arrays of the same shape.")
+        if x.shape[1] != num_words(num_qubits):
+            raise ValueError("Number of words does not match the number of qubits.")
+        if coeffs.shape != (x.shape[0],):
+            raise ValueError("Expected one coefficient for each term.")
+
+        self.x = x
+        self.z = z
+        self.coeffs = coeffs
+        self._num_qubits = num_qubits
+
+    @property
+    def num_qubits(self) -> int:
+        return self._num_qubits
+
+    @property
+    def num_terms(self) -> int:
+        return self.x.shape[0]
+
+    def __len__(self) -> int:
+        return self.num_terms
+
+    def __getitem__(self, key) -> "PauliTable":
+        if isinstance(key, (int, np.integer)):
+            key = [key]
+        return PauliTable(self.x[key], self.z[key], self.coeffs[key], self.num_qubits)
+
+    def __repr__(self) -> str:
+        return f"PauliTable(num_qubits={self.num_qubits}, num_terms={self.num_terms})"
+
+    @classmethod
+    def from_bits(
+        cls, x_bits: np.ndarray, z_bits: np.ndarray, coeffs: np.ndarray
+    ) -> "PauliTable":
+        """
+        Constructs the table from unpacked boolean arrays of shape
+        (terms, qubits) where column `j` represents qubit `j`.
+        """
+        x_bits = np.asarray(x_bits, dtype=bool)
+        return cls(pack_bits(x_bits), pack_bits(z_bits), coeffs, x_bits.shape[1])
+
+    @classmethod
+    def from_labels(
+        cls, labels: list[str], coeffs: Union[Iterable[float], None] = None
+    ) -> "PauliTable":
+        """
+        Constructs the table from Pauli strings, the characters are not case
+        sensitive.
+
+        Inputs:
+            - labels: List of Pauli strings of equal length.
+            - coeffs: Coefficient for each label, defaults to ones.
+
+        Returns: PauliTable
+
+        Raises:
+            - ValueError: if the labels are empty, of unequal length or contain
+            characters other than `i`, `x`, `y` and `z`.
+        """
+        labels = list(labels)
+        if len(labels) == 0:
+            raise ValueError("Invalid Hamiltonian, no Pauli elements found")
+
+        num_qubits = len(labels[0])
+        if any(len(label) != num_qubits for label in labels):
+            raise ValueError("All Pauli operators must act on the same qubits.")
+
+        if coeffs is None:
+            coeffs = np.ones(len(labels))
+        coeffs = np.fromiter(coeffs, dtype=np.float64, count=len(labels))
+
+        chars = np.frombuffer("".join(labels).encode("ascii"), dtype=np.uint8)
+        chars = (chars | 0x20).reshape(len(labels), num_qubits)
+
+        is_x = chars == ord("x")
+        is_y = chars == ord("y")
+        is_z = chars == ord("z")
+        if not np.all(is_x | is_y | is_z | (chars == ord("i"))):
+            raise ValueError("Pauli strings can only contain i, x, y and z.")
+
+        # Position `i` of the label is qubit `n - 1 - i`.
+        x_bits = (is_x | is_y)[:, ::-1]
+        z_bits = (is_z | is_y)[:, ::-1]
+        return cls.from_bits(x_bits, z_bits, coeffs)
+
+    @classmethod
+    def from_dict(cls, hamiltonian: dict[str, float]) -> "PauliTable":
+        """
+        Converts the dictionary format to the packed table.
+
+        Inputs:
+            - hamiltonian: Hamiltonian in Pauli basis
+
+        Returns: PauliTable
+        """
+        return cls.from_labels(list(hamiltonian.keys()), hamiltonian.values())
+
+    @classmethod
+    def from_terms(
+        cls, terms: Iterable[tuple[str, float]], batch_size: int = 1 << 16
+    ) -> "PauliTable":
+        """
+        Constructs the table from an iterable of `(pauli, coeff)` pairs, such as
+        a streaming reader. Terms are packed in batches, so only the packed
+        table and a single batch of strings are held at once.
+
+        Raises:
+            - ValueError: if there are no terms or they are of unequal length.
+        """
+        tables = []
+        labels: list[str] = []
+        coeffs: list[float] = []
+
+        def flush():
+            table = cls.from_labels(labels, coeffs)
+            if len(tables) > 0 and table.num_qubits != tables[0].num_qubits:
+                raise ValueError("All Pauli operators must act on the same qubits.")
+            tables.append(table)
+            labels.clear()
+            coeffs.clear()
+
+        for pauli, coeff in terms:
+            labels.append(pauli)
+            coeffs.append(coeff)
+            if len(labels) == batch_size:
+                flush()
+        if len(labels) > 0 or len(tables) == 0:
+            flush()
+
+        return cls.concatenate(tables)
+
+    @classmethod
+    def concatenate(cls, tables: list["PauliTable"]) -> "PauliTable":
+        """
+        Stacks the terms of tables on the same number of qubits, in order.
+
+        Raises:
+            - ValueError: if no tables are given or their qubits differ.
+        """
+        if len(tables) == 0:
+            raise ValueError("Invalid Hamiltonian, no Pauli elements found")
+        if any(table.num_qubits != tables[0].num_qubits for table in tables):
+            raise ValueError("All Pauli operators must act on the same qubits.")
+        if len(tables) == 1:
+            return tables[0]
+
+        return cls(
+            np.concatenate([table.x for table in tables]),
+            np.concatenate([table.z for table in tables]),
+            np.concatenate([table.coeffs for table in tables]),
+            tables[0].num_qubits,
+        )
+
+    @classmethod
+    def from_sparse_pauli_op(cls, op: SparsePauliOp) -> "PauliTable":
+        """
+        Converts a `SparsePauliOp` with real coefficients to the packed table.
+
+        Raises:
+            - ValueError: if any of the coefficients is complex.
+        """
+        coeffs = op.coeffs * (-1j) ** op.paulis.phase
+        if not np.allclose(coeffs.imag, 0.0):
+            raise ValueError("Hamiltonian must have real coefficients.")
+
+        return cls.from_bits(op.paulis.x, op.paulis.z, coeffs.real)
+
+    def x_bits(self) -> np.ndarray:
+        return unpack_bits(self.x, self.num_qubits)
+
+    def z_bits(self) -> np.ndarray:
+        return unpack_bits(self.z, self.num_qubits)
+
+    def support(self) -> np.ndarray:
+        """
+        Packed mask of the qubits each term acts on non-trivially.
+        """
+        return self.x | self.z
+
+    def weights(self) -> np.ndarray:
+        """
+        Number of qubits each term acts on non-trivially.
+        """
+        return popcount(self.support())
+
+    def labels(self) -> list[str]:
+        """
+        Lowercase Pauli strings of all the terms, in order.
+        """
+        if self.num_terms == 0:
+            return []
+
+        codes = self.x_bits().astype(np.uint8) + 2 * self.z_bits().astype(np.uint8)
+        chars = np.ascontiguousarray(_LABEL_CHARS[codes][:, ::-1])
+        return chars.view(f"S{self.num_qubits}").ravel().astype(str).tolist()
+
+    def items(self) -> Iterator[tuple[str, float]]:
+        return zip(self.labels(), self.coeffs.tolist())
+
+    def to_dict(self) -> dict[str, float]:
+        """
+        Converts the table to the dictionary format, coefficients of repeated
+        terms are added up.
+        """
+        ham: dict[str, float] = {}
+        for pauli, coeff in self.items():
+            ham[pauli] = ham.get(pauli, 0.0) + coeff
+        return ham
+
+    def to_sparse_pauli_op(self) -> SparsePauliOp:
+        labels = [label.upper() for label in self.labels()]
+        return SparsePauliOp(labels, self.coeffs)
+
+
+def as_table(
+    hamiltonian: Union[
+        dict[str, float], PauliTable, SparsePauliOp, Iterable[tuple[str, float]]
+    ],
+) -> PauliTable:
+    """
+    Accepts any of the supported Hamiltonian formats and returns the packed
+    table, without copying if a table was given. Any other iterable is read as
+    `(pauli, coeff)` pairs.
+
+    Raises:
+        - TypeError: if the format is not supported.
+    """
+    if isinstance(hamiltonian, PauliTable):
+        return hamiltonian
+    if isinstance(hamiltonian, SparsePauliOp):
+        return PauliTable.from_sparse_pauli_op(hamiltonian)
+    if isinstance(hamiltonian, dict):
+        return PauliTable.from_dict(hamiltonian)
+    if isinstance(hamiltonian, Iterable) and not isinstance(hamiltonian, str):
+        return PauliTable.from_terms(hamiltonian)
+
+    raise TypeError(f"Unsupported Hamiltonian format: {type(hamiltonian)}")
+
+
+def as_dict(
+    hamiltonian: Union[
+        dict[str, float], PauliTable, SparsePauliOp, Iterable[tuple[str, float]]
+    ],
+) -> dict:
+    """
+    Accepts any of the supported Hamiltonian formats and returns the dictionary
+    format, without copying if a dictionary was given.
+    """
+    if isinstance(hamiltonian, dict):
+        return hamiltonian
+    return as_table(hamiltonian).to_dict()
@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+from qiskit.quantum_info import SparsePauliOp
+
+from .algebra import (
+    PauliSum,
+    collect,
+    commutator,
+    commutator_norm_bound,
+    pauli_products,
+)
+from .random_hamiltonian import random_table
+from .table import PauliTable
+
+
+def _to_op(terms: PauliSum, num_qubits: int) -> SparsePauliOp:
+    labels = PauliTable(terms.x, terms.z, np.zeros(len(terms)), num_qubits).labels()
+    if len(labels) == 0:
+        return SparsePauliOp("I" * num_qubits, 0)
+    return SparsePauliOp([label.upper() for label in labels], terms.coeffs)
+
+
+def test_pauli_products():
+    table = random_table(3, 20, seed=1)
+    x, z, phase = pauli_products(
+        table.x[:, None, :], table.z[:, None, :], table.x[None], table.z[None]
+    )
+    labels = table.labels()
+    for i in range(len(table)):
+        for j in range(len(table)):
+            expected = SparsePauliOp(labels[i].upper()) @ SparsePauliOp(
+                labels[j].upper()
+            )
+            product = PauliTable(x[i, j][None], z[i, j][None], [1.0], 3).labels()[0]
+            assert expected.paulis[0].to_label().lstrip("-i") == product.upper()
+            assert np.isclose(expected.coeffs[0], 1j ** phase[i, j])
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1 << 20])
+def test_commutator(chunk_size):
+    a = PauliSum.from_table(random_table(4, 12, seed=2))
+    b = PauliSum.from_table(random_table(4, 9, seed=3))
+    expected = (_to_op(a, 4) @ _to_op(b, 4) - _to_op(b, 4) @ _to_op(a, 4)).simplify()
+
+    result = commutator(a, b, chunk_size)
+    assert _to_op(result, 4).simplify().equiv(expected)
+    assert result.norm_bound() == pytest.approx(np.sum(np.abs(expected.coeffs)))
+    assert result.norm_bound() <= commutator_norm_bound(a, b, chunk_size) + 1e-12
+
+
+def test_collect():
+    table = PauliTable.from_labels(["xz", "zz", "xz"], [1.0, 2.0, -0.5])
+    result = collect(PauliSum.from_table(table))
+    assert len(result) == 2
+    assert sorted(np.abs(result.coeffs)) == [0.5, 2.0]
+
+    # Commuting operators have a vanishing commutator
+    terms = PauliSum.from_table(PauliTable.from_labels(["zz", "zi"]))
+    assert len(commutator(terms, terms)) == 0
+    assert commutator_norm_bound(terms, terms) == 0.0
@@ -1,5 +1,11 @@
+import numpy as np
 import pytest
-from .random_hamiltonian import random_hamiltonian
+from .random_hamiltonian import (
+    iter_random_tables,
+    num_operators,
+    random_hamiltonian,
+    random_table,
+)
 
 
 # Have number of qubits large enough to have size number of unique Pauli ops.
@@ -20,3 +26,53 @@ def test_gate_count_simple(size, qubit):
         for char in p:
             assert char in paulis
         assert -1 <= c <= 1
+
+
+def test_exact_size():
+    # Every operator on two qubits, so duplicates are certain to be drawn
+    ham = random_hamiltonian(2, 16, 0)
+    assert len(ham) == 16
+
+    with pytest.raises(ValueError):
+        random_table(2, 17)
+
+
+def test_seed():
+    state = np.random.get_state()[1].copy()
+    assert random_table(20, 50, 3).to_dict() == random_table(20, 50, 3).to_dict()
+    table = random_table(20, 50, np.random.default_rng(3))
+    assert table.to_dict() == random_table(20, 50, 3).to_dict()
+
+    # The global generator is left alone
+    assert np.array_equal(np.random.get_state()[1], state)
+
+
+@pytest.mark.parametrize("qubits,max_weight", [(5, 0), (5, 2), (70, 3), (130, 1)])
+def test_max_weight(qubits, max_weight):
+    size = min(200, num_operators(qubits, max_weight))
+    table = random_table(qubits, size, 1, max_weight=max_weight)
+
+    assert len(set(table.labels())) == size
+    assert np.all(table.weights() <= max_weight)
+    assert table.x_bits().shape == (size, qubits)
+
+
+def test_chunks():
+    chunks = list(iter_random_tables(70, 1000, chunk_size=300, seed=5))
+    assert [len(chunk) for chunk in chunks] == [300, 300, 300, 100]
+
+    labels = sum((chunk.labels() for chunk in chunks), [])
+    assert len(set(labels)) == 1000
+
+
+def test_every_operator():
+    # Every operator stays reachable until it is drawn, across chunks
+    chunks = list(iter_random_tables(3, 64, chunk_size=5, seed=2))
+    labels = sum((chunk.labels() for chunk in chunks), [])
+    assert len(set(labels)) == 64
+
+
+def test_num_operators():
+    assert num_operators(3) == 64
+    assert num_operators(3, 1) == 1 + 3 * 3
+    assert num_operators(3, 5) == 64
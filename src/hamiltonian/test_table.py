@@ -0,0 +1,95 @@
+import pytest
+import numpy as np
+from qiskit.quantum_info import SparsePauliOp
+
+from .convert import to_pauli_op
+from .table import PauliTable, as_table, pack_bits, unpack_bits, popcount
+
+# More than one word worth of qubits
+_rng = np.random.default_rng(42)
+wide_ham = {
+    "".join(_rng.choice(list("ixyz"), size=70)): float(c)
+    for c in _rng.uniform(-1, 1, 20)
+}
+
+hamiltonians = [
+    {"x": 1.0, "z": -1.0},
+    {"xxx": 1.0, "xyz": -1.0, "iii": 1.0},
+    {"xiizi": 1.0, "iyiiy": 2.0},
+    wide_ham,
+]
+
+
+@pytest.mark.parametrize("h", hamiltonians)
+def test_dict_round_trip(h):
+    table = PauliTable.from_dict(h)
+    assert table.num_terms == len(h)
+    assert table.labels() == list(h.keys())
+    assert table.to_dict() == h
+
+
+@pytest.mark.parametrize("h", hamiltonians)
+def test_sparse_pauli_op_round_trip(h):
+    op = to_pauli_op(h)
+    table = as_table(op)
+    assert table.to_dict() == pytest.approx(h)
+    assert table.to_sparse_pauli_op() == op
+
+
+def test_qubit_convention():
+    # The first character acts on the last qubit, same as Qiskit
+    table = PauliTable.from_dict({"xiz": 1.0})
+    assert table.x_bits().tolist() == [[False, False, True]]
+    assert table.z_bits().tolist() == [[True, False, False]]
+
+    op = SparsePauliOp(["XIZ"])
+    assert np.array_equal(op.paulis.x, table.x_bits())
+    assert np.array_equal(op.paulis.z, table.z_bits())
+
+
+def test_weights():
+    table = PauliTable.from_dict({"xiz": 1.0, "iii": 2.0, "yyy": 3.0})
+    assert table.weights().tolist() == [2, 0, 3]
+
+
+@pytest.mark.parametrize("qubits", [1, 63, 64, 65, 130])
+def test_pack_round_trip(qubits):
+    rng = np.random.default_rng(0)
+    bits = rng.integers(0, 2, size=(10, qubits)).astype(bool)
+    packed = pack_bits(bits)
+
+    assert packed.dtype == np.uint64
+    assert np.array_equal(unpack_bits(packed, qubits), bits)
+    assert np.array_equal(popcount(packed), bits.sum(axis=1))
+
+
+def test_slicing():
+    table = PauliTable.from_dict({"xi": 1.0, "iz": 2.0, "yy": 3.0})
+    assert table[1:].to_dict() == {"iz": 2.0, "yy": 3.0}
+    assert table[np.array([2, 0])].labels() == ["yy", "xi"]
+    assert table[0].to_dict() == {"xi": 1.0}
+
+
+invalid_labels = [[], ["xx", "x"], ["xa"]]
+
+
+@pytest.mark.parametrize("labels", invalid_labels)
+def test_invalid_labels(labels):
+    with pytest.raises(ValueError):
+        PauliTable.from_labels(labels)
+
+
+def test_complex_coefficients():
+    with pytest.raises(ValueError):
+        as_table(SparsePauliOp(["XX"], [1j]))
+
+
+def test_from_terms():
+    ham = {"xyz": 1.0, "iiz": -2.0, "zzi": 0.5, "yyy": 4.0, "xii": -1.0}
+    table = PauliTable.from_terms(iter(ham.items()), batch_size=2)
+    assert table.to_dict() == ham
+
+    with pytest.raises(ValueError):
+        PauliTable.from_terms(iter([]))
+    with pytest.raises(ValueError):
+        PauliTable.from_terms([("xy", 1.0), ("xyz", 1.0)], batch_size=1)
@@ -1 +1,10 @@
-from .lexico import lexico
+from .lexico import lexico, lexico_order
+from .hamming import (
+    greedy,
+    gray,
+    two_opt,
+    greedy_order,
+    gray_order,
+    two_opt_order,
+    path_length,
+)
@@ -0,0 +1,165 @@
+from typing import Union
+
+import numpy as np
+
+from ..hamiltonian.table import WORD_BITS, PauliTable, popcount
+from ..utils.trace import traced
+
+# Largest number of improving passes of `two_opt_order` over the whole path
+MAX_ROUNDS = 16
+
+
+def path_length(table: PauliTable) -> int:
+    """
+    Hamming length of the path through the supports of the terms in order,
+    starting and ending at the empty support. This is the number of CNOTs that
+    add or remove qubits from a parity ladder shared by consecutive terms.
+    """
+    support = table.support()
+    empty = np.zeros((1, support.shape[1]), dtype=np.uint64)
+    path = np.concatenate([empty, support, empty])
+    return int(np.sum(popcount(path[1:] ^ path[:-1])))
+
+
+def greedy_order(table: PauliTable) -> np.ndarray:
+    """
+    Nearest neighbour path through the supports of the terms in Hamming
+    distance, starting from the lightest term.
+    """
+    support = table.support()
+    if len(table) == 0:
+        return np.zeros(0, dtype=np.int64)
+
+    remaining = np.ones(len(table), dtype=bool)
+    current = int(np.argmin(popcount(support)))
+    order = [current]
+    remaining[current] = False
+
+    for _ in range(len(table) - 1):
+        rest = np.flatnonzero(remaining)
+        distances = popcount(support[rest] ^ support[current])
+        current = int(rest[np.argmin(distances)])
+        order.append(current)
+        remaining[current] = False
+
+    return np.array(order, dtype=np.int64)
+
+
+def _inverse_gray(value: int, num_bits: int) -> int:
+    shift = 1
+    while shift < num_bits:
+        value ^= value >> shift
+        shift <<= 1
+    return value
+
+
+def gray_order(table: PauliTable) -> np.ndarray:
+    """
+    Orders the supports of the terms as they appear in the binary reflected
+    Gray code, where consecutive codes differ on a single qubit.
+    """
+    ranks = []
+    for words in table.support().tolist():
+        value = sum(word << (WORD_BITS * ind) for ind, word in enumerate(words))
+        ranks.append(_inverse_gray(value, table.num_qubits))
+    return np.array(sorted(range(len(table)), key=ranks.__getitem__), dtype=np.int64)
+
+
+def two_opt_order(
+    table: PauliTable,
+    order: Union[np.ndarray, None] = None,
+    rounds: int = MAX_ROUNDS,
+) -> np.ndarray:
+    """
+    Refines a path through the supports of the terms with 2-opt moves, which
+    reverse a segment of the path whenever that shortens it, until no move
+    does or `rounds` passes were made. The path starts and ends at the empty
+    support as in `path_length`.
+
+    Inputs:
+        - table: Terms to order.
+        - order: Initial path, `greedy_order` by default.
+        - rounds: Largest number of passes over the path.
+
+    Returns: Indices of the terms in the refined order.
+    """
+    order = greedy_order(table) if order is None else np.array(order, dtype=np.int64)
+    if len(order) < 2:
+        return order
+
+    support = table.support()
+    empty = np.zeros((1, support.shape[1]), dtype=np.uint64)
+
+    def nodes():
+        # Nodes of the path, the empty support at both ends
+        path = np.concatenate([empty, support[order], empty])
+        return path, popcount(path[1:] ^ path[:-1])
+
+    for _ in range(rounds):
+        improved = False
+        path, edges = nodes()
+        for i in range(len(order)):
+            # Reversing nodes i + 1..j replaces the edges (i, i + 1) and
+            # (j, j + 1) by (i, j) and (i + 1, j + 1)
+            js = np.arange(i + 1, len(order) + 1)
+            gain = (
+                edges[i]
+                + edges[js]
+                - popcount(path[js] ^ path[i])
+                - popcount(path[js + 1] ^ path[i + 1])
+            )
+            best = int(np.argmax(gain))
+            if gain[best] > 0:
+                j = int(js[best])
+                order[i:j] = order[i:j][::-1]
+                path, edges = nodes()
+                improved = True
+
+        if not improved:
+            break
+
+    return order
+
+
+def _ordered(
+    ops: Union[set[str], PauliTable], order_fn
+) -> Union[list[str], PauliTable]:
+    if isinstance(ops, PauliTable):
+        return ops[order_fn(ops)]
+
+    # Sorted first so that ties are broken the same way for every set
+    labels = sorted(ops)
+    if len(labels) == 0:
+        return []
+    order = order_fn(PauliTable.from_labels(labels))
+    return [labels[ind] for ind in order]
+
+
+@traced("ordering.greedy")
+def greedy(ops: Union[set[str], PauliTable]) -> Union[list[str], PauliTable]:
+    """
+    Orders the terms along a nearest neighbour path in the Hamming distance of
+    their supports, which are the Z masks of the terms once a group is
+    diagonalized qubit-wise. Consecutive terms then share most of their parity
+    ladders.
+
+    A `PauliTable` is ordered without constructing the strings and the reordered
+    table is returned.
+    """
+    return _ordered(ops, greedy_order)
+
+
+@traced("ordering.gray")
+def gray(ops: Union[set[str], PauliTable]) -> Union[list[str], PauliTable]:
+    """
+    Orders the terms by the position of their supports in the Gray code.
+    """
+    return _ordered(ops, gray_order)
+
+
+@traced("ordering.two_opt")
+def two_opt(ops: Union[set[str], PauliTable]) -> Union[list[str], PauliTable]:
+    """
+    Orders the terms along the nearest neighbour path refined with 2-opt moves.
+    """
+    return _ordered(ops, two_opt_order)
@@ -1,6 +1,36 @@
-def lexico(ops: set[str]) -> list[str]:
+from typing import Union
+
+import numpy as np
+
+from ..hamiltonian.table import PauliTable
+from ..utils.trace import traced
+
+
+@traced("ordering.lexico")
+def lexico(ops: Union[set[str], PauliTable]) -> Union[list[str], PauliTable]:
     """
     The given operators that are diagonalized already will be ordered qubitwise
     which comes out to be same strategy as lexicographic ordering.
+
+    A `PauliTable` is ordered without constructing the strings and the reordered
+    table is returned.
     """
+    if isinstance(ops, PauliTable):
+        return ops[lexico_order(ops)]
     return sorted(ops)
+
+
+def lexico_order(table: PauliTable) -> np.ndarray:
+    """
+    Indices that sort the table in the same order as sorting the lowercase
+    labels would, where `i < x < y < z`.
+    """
+    x_bits = table.x_bits().astype(np.uint8)
+    z_bits = table.z_bits().astype(np.uint8)
+
+    # Rank of each character: i -> 0, x -> 1, y -> 2, z -> 3
+    ranks = 2 * z_bits + (x_bits ^ z_bits)
+
+    # The last key is the primary one, which is qubit `n - 1`: the first
+    # character of the label.
+    return np.lexsort(ranks.T)
@@ -1,5 +1,6 @@
 import pytest
 from .lexico import lexico
+from ..hamiltonian import PauliTable
 
 
 pauli_lists = [["ziz", "iiz", "zzz"]]
@@ -11,3 +12,12 @@ def test_op_order(pauli_list, ordered):
     result = lexico(pauli_list)
     for a, b in zip(result, ordered):
         assert a == b
+
+
+def test_op_order_table():
+    pauli_list = ["zyx", "ziz", "iiz", "zzz", "xyi", "yyy", "ixy"]
+    table = PauliTable.from_labels(pauli_list, range(len(pauli_list)))
+
+    result = lexico(table)
+    assert result.labels() == sorted(pauli_list)
+    assert result.coeffs.tolist() == [pauli_list.index(p) for p in sorted(pauli_list)]
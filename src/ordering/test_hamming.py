@@ -0,0 +1,59 @@
+import itertools
+
+import numpy as np
+import pytest
+
+from .hamming import (
+    gray,
+    greedy,
+    greedy_order,
+    path_length,
+    two_opt,
+    two_opt_order,
+)
+from .lexico import lexico
+from ..hamiltonian import PauliTable
+
+
+def _random_group(seed, num_qubits=10, num_terms=200):
+    rng = np.random.default_rng(seed)
+    return {"".join(rng.choice(["i", "z"], num_qubits)) for _ in range(num_terms)}
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_shorter_paths(seed):
+    group = _random_group(seed)
+    table = PauliTable.from_labels(sorted(group))
+    lexico_length = path_length(PauliTable.from_labels(lexico(group)))
+
+    for orderer in (greedy, gray, two_opt):
+        ordered = orderer(group)
+        assert sorted(ordered) == sorted(group)
+        assert path_length(PauliTable.from_labels(ordered)) <= lexico_length
+
+    start = greedy_order(table)
+    refined = two_opt_order(table, start.copy())
+    assert sorted(refined.tolist()) == list(range(len(table)))
+    assert path_length(table[refined]) <= path_length(table[start])
+
+
+def test_gray():
+    # Every support of three qubits, visited one flip at a time
+    group = {"".join(p) for p in itertools.product("iz", repeat=3)}
+    ordered = gray(group)
+    assert ordered[0] == "iii"
+    assert path_length(PauliTable.from_labels(ordered)) == 8
+
+    # Tables are reordered as a whole, the supports of x and y count as well
+    table = PauliTable.from_labels(["xx", "ii", "iy", "zi"], [1.0, 2.0, 3.0, 4.0])
+    result = gray(table)
+    assert result.labels() == ["ii", "iy", "xx", "zi"]
+    assert result.coeffs.tolist() == [2.0, 3.0, 1.0, 4.0]
+
+
+def test_small():
+    assert greedy(set()) == []
+    assert two_opt({"zz"}) == ["zz"]
+    assert path_length(PauliTable.from_labels(["zzi", "zzz"])) == 2 + 1 + 3
+    # The lightest term comes first, then the closest ones
+    assert greedy({"zzzz", "ziii", "zzii", "zizz"}) == ["ziii", "zzii", "zzzz", "zizz"]
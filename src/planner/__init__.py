@@ -0,0 +1 @@
+from .planner import METHODS, CostModel, Plan, Planner, plan
@@ -0,0 +1,324 @@
+import math
+from typing import NamedTuple, Union
+
+import numpy as np
+from qiskit import QuantumCircuit
+
+from ..benchmark.resources import (
+    Resources,
+    generic_depth,
+    generic_resources,
+    schedule_depth,
+    term_counts,
+    trotter_depth,
+    trotter_resources,
+)
+from ..benchmark.resources.resources import trotter_blocks
+from ..grouping.bitwise import Bitwise
+from ..hamiltonian.table import PauliTable, as_table
+from ..ordering import lexico
+from ..qdrift.sampler import Seed
+from ..qdrift.simple import qdrift
+from ..synthesis.repeated import RepeatedCircuit
+from ..trotter.error import (
+    CommutatorNorms,
+    commutator_norms,
+    group_stages,
+    overlap_norms,
+)
+from ..trotter.simple import trotter
+from ..trotter_grouping.group_trotter import generic
+from ..utils.trace import span, traced
+
+METHODS = ("trotter", "bitwise", "qdrift")
+
+# Largest number of operator pairs for the commutator norms, beyond it the
+# norms are bounded from the supports of the terms.
+MAX_PAIRS = 1 << 24
+
+# Largest Hamiltonian that is grouped to plan `bitwise`
+MAX_GROUP_TERMS = 1 << 14
+
+
+class CostModel(NamedTuple):
+    """
+    Weights of the cost of a circuit after `decompose`: per two qubit gate, per
+    rotation by an arbitrary angle, per single qubit Clifford gate and per layer
+    of depth. The depth is only estimated when its weight is not zero.
+
+    Only the gates are weighed, not the norm of the error: the Trotter bounds
+    are in spectral norm while the QDRIFT bound is in diamond norm, so plans
+    of both kinds that reach the same `eps` are compared as if the norms were
+    interchangeable. A spectral error `δ` is at most `2 δ` in diamond norm.
+    """
+
+    two_qubit: float = 1.0
+    rotation: float = 1.0
+    clifford: float = 0.0
+    depth: float = 0.0
+
+    def cost(self, resources: Resources, depth: Union[int, None] = None) -> float:
+        two_qubit = sum(
+            count for name, count in resources.counts.items() if name in ("cx", "cz")
+        )
+        single = sum(resources.counts.values()) - two_qubit
+        cost = (
+            self.two_qubit * two_qubit
+            + self.rotation * resources.rotations
+            + self.clifford * (single - resources.rotations)
+        )
+        if depth is not None:
+            cost += self.depth * depth
+        return cost
+
+
+class Plan(NamedTuple):
+    """
+    Configuration of a method that reaches the target error `eps` at time `t`.
+    `reps` is the number of Trotter steps, or the number of QDRIFT samples that
+    is built as is, and `error` the bound it reaches, in spectral norm for the
+    Trotter methods and in diamond norm for QDRIFT. The resources are the gate counts of the
+    synthesized terms before the cancellations of `decompose`, and the depth
+    is only estimated when the cost model weighs it.
+    """
+
+    method: str
+    t: float
+    eps: float
+    reps: int
+    error: float
+    resources: Resources
+    depth: Union[int, None]
+    cost: float
+
+
+def _scale(resources: Resources, factor: float) -> Resources:
+    counts = {name: round(count * factor) for name, count in resources.counts.items()}
+    return Resources(counts, round(resources.rotations * factor))
+
+
+class Planner:
+    """
+    Chooses the cheapest method and number of steps that simulates a
+    Hamiltonian to a target error, without building any circuit. Everything
+    that does not depend on the time or the error, the commutator norms, the
+    grouping and the cost of a single step, is computed once per method, so a
+    sweep over `t` or `eps` only evaluates closed forms.
+
+    The Trotter methods use the first order commutator bound, from the exact
+    norms when the number of pairs of terms is at most `max_pairs` and from
+    `overlap_norms` otherwise. QDRIFT uses `2 λ^2 t^2 / N` for `N` samples,
+    a diamond norm bound that is compared to the spectral norm ones as is.
+    `bitwise` is only planned for Hamiltonians with at most `max_group_terms`
+    terms, since the grouping dominates beyond it.
+    """
+
+    def __init__(
+        self,
+        h: dict[str, float] | PauliTable,
+        methods: tuple[str, ...] = METHODS,
+        cost_model: Union[CostModel, None] = None,
+        ladder: str = "chain",
+        max_pairs: int = MAX_PAIRS,
+        max_group_terms: int = MAX_GROUP_TERMS,
+    ):
+        unknown = set(methods) - set(METHODS)
+        if len(unknown) > 0:
+            raise ValueError(f"Unknown methods: {sorted(unknown)}")
+
+        self.table = as_table(h)
+        if len(self.table) == 0:
+            raise ValueError("Input Hamiltonian was empty.")
+
+        self.methods = [
+            method
+            for method in methods
+            if method != "bitwise" or len(self.table) <= max_group_terms
+        ]
+        if len(self.methods) == 0:
+            raise ValueError("None of the methods can be planned.")
+        self.cost_model = CostModel() if cost_model is None else cost_model
+        self.ladder = ladder
+        self.max_pairs = max_pairs
+
+        self._grouper: Union[Bitwise, None] = None
+        self._norms: dict[str, CommutatorNorms] = {}
+        self._steps: dict[str, tuple[Resources, Union[int, None]]] = {}
+
+    @property
+    def grouper(self) -> Bitwise:
+        if self._grouper is None:
+            self._grouper = Bitwise(self.table)
+        return self._grouper
+
+    def _same_grouper(self, _: PauliTable) -> Bitwise:
+        return self.grouper
+
+    def norms(self, method: str) -> CommutatorNorms:
+        """
+        First order commutator norms of a Trotter method.
+        """
+        if method not in self._norms:
+            with span("planner.norms"):
+                if method == "trotter":
+                    table, stages = self.table, [1] * len(self.table)
+                else:
+                    table, stages = group_stages(self.grouper, self.table)
+
+                later = len(table) - np.cumsum(stages)
+                pairs = int(np.dot(stages, later))
+                if pairs <= self.max_pairs:
+                    norms = commutator_norms(table, stages)
+                else:
+                    norms = overlap_norms(table, stages)
+            self._norms[method] = norms
+        return self._norms[method]
+
+    def step(self, method: str) -> tuple[Resources, Union[int, None]]:
+        """
+        Resources and depth of a single step of a Trotter method, or the
+        expected resources and depth of a single QDRIFT sample.
+        """
+        if method in self._steps:
+            return self._steps[method]
+
+        with_depth = self.cost_model.depth != 0
+        depth = None
+        with span("planner.step"):
+            if method == "trotter":
+                resources = trotter_resources(
+                    self.table, 1, self.ladder, optimize=False
+                )
+                if with_depth:
+                    depth = trotter_depth(self.table, 1, self.ladder).depth
+            elif method == "bitwise":
+                args = (self._same_grouper, lexico, self.table, 1, self.ladder)
+                resources = generic_resources(*args, optimize=False)
+                if with_depth:
+                    depth = generic_depth(*args).depth
+            else:
+                # Samples are drawn with probability proportional to the weights
+                weights = np.abs(self.table.coeffs)
+                probs = weights / np.sum(weights)
+                per_term = term_counts(self.table)
+                counts = {
+                    name: float(probs @ count) for name, count in per_term.items()
+                }
+                is_rotation = per_term["rz"] > per_term["s"]
+                resources = Resources(counts, float(np.sum(probs[is_rotation])))
+                if with_depth:
+                    depths = [
+                        schedule_depth([block], self.table.num_qubits).depth
+                        for block in trotter_blocks(self.table, self.ladder)
+                    ]
+                    depth = float(probs @ np.array(depths))
+
+        self._steps[method] = (resources, depth)
+        return self._steps[method]
+
+    def candidate(self, method: str, t: float, eps: float) -> Plan:
+        """
+        Cheapest configuration of a single method. The bounds decrease with the
+        number of steps or samples, so the smallest number that reaches `eps`
+        is found in closed form.
+
+        Raises:
+            - ValueError: if the method is unknown or `eps` is not positive.
+        """
+        if method not in METHODS:
+            raise ValueError(f"Unknown method: {method}")
+        if eps <= 0:
+            raise ValueError("Error must be positive.")
+
+        if method == "qdrift":
+            lambd = float(np.sum(np.abs(self.table.coeffs)))
+            numerator = 2 * lambd**2 * t**2
+            reps = math.ceil(numerator / eps)
+            error = numerator / reps if reps > 0 else 0.0
+        else:
+            norms = self.norms(method)
+            reps = norms.reps_for(t, eps)
+            error = norms.error(t, reps)
+
+        resources, depth = self.step(method)
+        resources = _scale(resources, reps)
+        if depth is not None:
+            # Steps never overlap in this bound
+            depth = round(depth * reps)
+        cost = self.cost_model.cost(resources, depth)
+        return Plan(method, t, eps, reps, error, resources, depth, cost)
+
+    @traced("planner.candidates")
+    def candidates(self, t: float, eps: float) -> list[Plan]:
+        """
+        Configurations of every method, from the cheapest.
+        """
+        plans = [self.candidate(method, t, eps) for method in self.methods]
+        return sorted(plans, key=lambda plan: plan.cost)
+
+    def plan(self, t: float, eps: float) -> Plan:
+        """
+        Cheapest configuration that simulates the Hamiltonian for time `t` with
+        at most error `eps`.
+        """
+        return self.candidates(t, eps)[0]
+
+    def build(
+        self, plan: Plan, rng: Seed = None, lazy: bool = False
+    ) -> QuantumCircuit | RepeatedCircuit:
+        """
+        Builds the circuit of a plan. `rng` seeds the QDRIFT samples and `lazy`
+        returns a single step of the Trotter methods with the repetition count.
+        """
+        if plan.method == "trotter":
+            return trotter(self.table, plan.t, plan.reps, self.ladder, lazy=lazy)
+        if plan.method == "bitwise":
+            return generic(
+                self._same_grouper,
+                lexico,
+                self.table,
+                plan.t,
+                plan.reps,
+                self.ladder,
+                lazy=lazy,
+            )
+        return qdrift(
+            self.table, plan.t, plan.eps, self.ladder, rng=rng, samples=plan.reps
+        )
+
+
+def plan(
+    h: dict[str, float] | PauliTable,
+    t: float,
+    eps: float,
+    methods: tuple[str, ...] = METHODS,
+    cost_model: Union[CostModel, None] = None,
+    ladder: str = "chain",
+    build: bool = False,
+    rng: Seed = None,
+) -> Plan | tuple[Plan, QuantumCircuit]:
+    """
+    Chooses the cheapest method and number of steps or samples that simulates
+    the Hamiltonian for time `t` with at most error `eps`.
+
+    Inputs:
+        - h: Hamiltonian in Pauli basis along with coefficients, or PauliTable.
+        - t: Time
+        - eps: Target error in spectral norm, or diamond norm for QDRIFT.
+        - methods: Methods to consider, out of `METHODS`.
+        - cost_model: Weights of the gates and depth, CostModel() by default.
+        - ladder: Shape of the CNOT parity ladder, `chain` or `tree`.
+        - build: Also build the circuit of the chosen plan.
+        - rng: Generator or seed of the QDRIFT samples.
+
+    Returns: Plan, along with its circuit if `build` is set.
+
+    Raises:
+        - ValueError: if the Hamiltonian is empty, a method is unknown or `eps`
+        is not positive.
+    """
+    planner = Planner(h, methods, cost_model, ladder)
+    best = planner.plan(t, eps)
+    if build:
+        return best, planner.build(best, rng)
+    return best
@@ -0,0 +1,99 @@
+import math
+
+import pytest
+
+from .planner import CostModel, Planner, plan
+from ..hamiltonian.random_hamiltonian import random_table
+from ..qdrift.simple import num_samples, qdrift, qdrift_samples
+from ..trotter.error import trotter_norms
+from ..trotter.simple import trotter
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_candidates(seed):
+    h = random_table(5, 20, seed=seed)
+    planner = Planner(h)
+    candidates = planner.candidates(0.5, 0.01)
+    assert [c.method for c in candidates] != []
+    assert sorted(c.cost for c in candidates) == [c.cost for c in candidates]
+    assert planner.plan(0.5, 0.01) == candidates[0]
+
+    for candidate in candidates:
+        assert candidate.error <= 0.01
+        assert candidate.cost == CostModel().cost(candidate.resources)
+
+    # The fewest steps that reach the target
+    trotter_plan = planner.candidate("trotter", 0.5, 0.01)
+    norms = trotter_norms(h)
+    assert norms.error(0.5, trotter_plan.reps) <= 0.01
+    assert trotter_plan.reps == 1 or norms.error(0.5, trotter_plan.reps - 1) > 0.01
+
+
+def test_build():
+    h = random_table(4, 12, seed=3)
+    planner = Planner(h)
+
+    trotter_plan = planner.candidate("trotter", 0.3, 0.05)
+    circuit = planner.build(trotter_plan)
+    assert circuit == trotter(h, 0.3, trotter_plan.reps)
+    assert circuit.count_ops()["cx"] == trotter_plan.resources.counts["cx"]
+
+    bitwise_plan = planner.candidate("bitwise", 0.3, 0.05)
+    lazy = planner.build(bitwise_plan, lazy=True)
+    assert lazy.reps == bitwise_plan.reps
+
+    qdrift_plan = planner.candidate("qdrift", 0.3, 0.05)
+    lambd = sum(abs(c) for c in h.coeffs)
+    assert num_samples(h, 0.3, 0.05) <= qdrift_plan.reps
+    assert qdrift_plan.error == pytest.approx(
+        2 * lambd**2 * 0.3**2 / qdrift_plan.reps
+    )
+    circuit = planner.build(qdrift_plan, rng=1)
+    inds = qdrift_samples(h, 0.3, rng=1, samples=qdrift_plan.reps)
+    assert len(inds) == qdrift_plan.reps
+    assert circuit == qdrift(h, 0.3, rng=1, samples=qdrift_plan.reps)
+
+    best, circuit = plan(h, 0.3, 0.05, build=True, rng=1)
+    assert best == planner.plan(0.3, 0.05)
+    assert circuit.num_qubits == 4
+
+
+def test_bounds():
+    h = random_table(5, 30, seed=4)
+    exact = Planner(h).candidate("trotter", 1.0, 0.01)
+    overlap = Planner(h, max_pairs=0).candidate("trotter", 1.0, 0.01)
+    assert overlap.reps >= exact.reps
+    assert overlap.error <= 0.01
+
+    # Grouping is skipped for large Hamiltonians
+    assert Planner(h, max_group_terms=10).methods == ["trotter", "qdrift"]
+    assert Planner(h, methods=("bitwise",)).plan(1.0, 0.01).method == "bitwise"
+
+
+def test_cost_model():
+    h = random_table(4, 10, seed=5)
+    model = CostModel(two_qubit=0.0, rotation=0.0, depth=1.0)
+    for candidate in Planner(h, cost_model=model).candidates(1.0, 0.1):
+        assert candidate.depth is not None
+        assert candidate.cost == candidate.depth
+
+    # Only the commuting terms of a single qubit
+    commuting = {"zi": 1.0, "iz": 0.5}
+    best = plan(commuting, 10.0, 1e-6, methods=("trotter", "qdrift"))
+    assert best.method == "trotter"
+    assert best.reps == 1
+    assert best.error == 0.0
+    assert plan(commuting, 0.0, 0.1, methods=("qdrift",)).reps == 0
+
+
+def test_invalid():
+    h = random_table(3, 5, seed=6)
+    with pytest.raises(ValueError):
+        Planner({})
+    with pytest.raises(ValueError):
+        Planner(h, methods=("trotter", "exact"))
+    with pytest.raises(ValueError):
+        Planner(h, methods=("bitwise",), max_group_terms=1)
+    with pytest.raises(ValueError):
+        Planner(h).plan(1.0, 0.0)
+    assert math.isfinite(Planner(h).plan(1.0, 1e-3).cost)
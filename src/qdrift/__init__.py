@@ -1 +1,3 @@
-from .simple import qdrift
+from .simple import qdrift, qdrift_samples
+from .sampler import AliasSampler
+from .ensemble import QDriftEnsemble
@@ -0,0 +1,161 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Union
+
+import numpy as np
+from qiskit import QuantumCircuit
+
+from ..hamiltonian.table import PauliTable, as_table
+from ..synthesis.builder import CircuitBuilder
+from ..synthesis.cache import TEMPLATE_CACHE, TemplateCache
+from ..synthesis.rotation import Op
+from .sampler import CHUNK_SIZE, AliasSampler
+from .simple import num_samples
+
+
+class _Sampling:
+    """
+    Everything a worker needs to draw a QDRIFT sample, shared once per process
+    rather than sent with every task.
+    """
+
+    def __init__(
+        self,
+        sampler: Union[AliasSampler, None],
+        num_samples: int,
+        ops: list[list[Op]],
+        factors: np.ndarray,
+        num_qubits: int,
+        chunk_size: int,
+    ):
+        self.sampler = sampler
+        self.num_samples = num_samples
+        self.ops = ops
+        self.factors = factors
+        self.num_qubits = num_qubits
+        self.chunk_size = chunk_size
+
+    def indices(self, seed: np.random.SeedSequence) -> np.ndarray:
+        if self.sampler is None:
+            return np.zeros(0, dtype=np.uint8)
+        return self.sampler.sample(self.num_samples, np.random.default_rng(seed))
+
+    def circuit(self, seed: np.random.SeedSequence) -> QuantumCircuit:
+        builder = CircuitBuilder(self.num_qubits)
+        if self.sampler is None:
+            return builder.build()
+
+        rng = np.random.default_rng(seed)
+        for chunk in self.sampler.stream(self.num_samples, rng, self.chunk_size):
+            for ind in chunk.tolist():
+                builder.append_rotation(self.ops[ind], self.factors[ind])
+        return builder.build()
+
+
+_WORKER_SAMPLING: Union[_Sampling, None] = None
+
+
+def _init_worker(sampling: _Sampling):
+    global _WORKER_SAMPLING
+    _WORKER_SAMPLING = sampling
+
+
+def _worker_indices(seed: np.random.SeedSequence) -> np.ndarray:
+    return _WORKER_SAMPLING.indices(seed)
+
+
+def _worker_circuit(seed: np.random.SeedSequence) -> QuantumCircuit:
+    return _WORKER_SAMPLING.circuit(seed)
+
+
+class QDriftEnsemble:
+    """
+    Independent QDRIFT samples of the same Hamiltonian. The sampling
+    distribution and the rotation of every term are computed once, then the
+    samples are drawn over a pool of processes.
+
+    Sample `i` always uses the `i`-th child of the seed sequence, so the
+    ensemble is reproducible regardless of the number of workers, and sample
+    `i` equals `qdrift(h, t, eps, rng=np.random.default_rng(child_i))`.
+    """
+
+    def __init__(
+        self,
+        h: dict[str, float] | PauliTable,
+        t: float = 1.0,
+        eps: float = 1.0,
+        ladder: str = "chain",
+        cache: Union[TemplateCache, None] = None,
+        chunk_size: int = CHUNK_SIZE,
+    ):
+        cache = TEMPLATE_CACHE if cache is None else cache
+        table = as_table(h)
+        coeffs = table.coeffs
+        lambd = np.sum(np.abs(coeffs))
+
+        self.table = table
+        self.num_samples = num_samples(table, t, eps)
+
+        if self.num_samples == 0:
+            sampler, factors = None, np.zeros(len(table))
+        else:
+            sampler = AliasSampler(np.abs(coeffs))
+            factors = lambd * t / self.num_samples * np.sign(coeffs)
+
+        ops = [cache.get_row(table, ind, ladder).ops for ind in range(len(table))]
+        self._sampling = _Sampling(
+            sampler, self.num_samples, ops, factors, table.num_qubits, chunk_size
+        )
+
+    def _run(self, single, worker, num: int, seed, workers: Union[int, None]):
+        if num < 0:
+            raise ValueError("Number of samples must be non-negative.")
+
+        seeds = np.random.SeedSequence(seed).spawn(num)
+        workers = os.cpu_count() if workers is None else workers
+        workers = min(workers, num)
+
+        if workers <= 1:
+            return [single(child) for child in seeds]
+
+        # Several samples per task amortize the inter-process communication
+        chunksize = max(1, num // (4 * workers))
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(self._sampling,)
+        ) as executor:
+            return list(executor.map(worker, seeds, chunksize=chunksize))
+
+    def indices(
+        self, num: int, seed=None, workers: Union[int, None] = None
+    ) -> list[np.ndarray]:
+        """
+        Samples the term indices of every circuit in the ensemble.
+
+        Inputs:
+            - num: Number of independent samples.
+            - seed: Entropy of the root seed sequence, fresh by default.
+            - workers: Number of processes, all the cores by default and in
+            process if 1.
+
+        Returns: List of compact index arrays, one per sample.
+        """
+        return self._run(self._sampling.indices, _worker_indices, num, seed, workers)
+
+    def circuits(
+        self, num: int, seed=None, workers: Union[int, None] = None
+    ) -> list[QuantumCircuit]:
+        """
+        Same as `indices`, but every sample is built into its circuit by the
+        worker that drew it.
+        """
+        return self._run(self._sampling.circuit, _worker_circuit, num, seed, workers)
+
+    def circuit(self, indices: np.ndarray) -> QuantumCircuit:
+        """
+        Builds the circuit of a sample returned by `indices`.
+        """
+        sampling = self._sampling
+        builder = CircuitBuilder(sampling.num_qubits)
+        for ind in np.asarray(indices).tolist():
+            builder.append_rotation(sampling.ops[ind], sampling.factors[ind])
+        return builder.build()
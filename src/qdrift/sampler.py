@@ -0,0 +1,87 @@
+from typing import Iterator, Union
+
+import numpy as np
+
+# Default number of samples drawn at once when streaming
+CHUNK_SIZE = 1 << 16
+
+Seed = Union[np.random.Generator, int, None]
+
+
+class AliasSampler:
+    """
+    Walker alias table over a discrete distribution. The table is built once in
+    `O(L)` for `L` outcomes, after which every sample costs a single uniform
+    number, a comparison and a lookup, independent of `L`.
+    """
+
+    def __init__(self, weights: np.ndarray):
+        weights = np.asarray(weights, dtype=float)
+        if weights.ndim != 1 or weights.size == 0:
+            raise ValueError("Weights must be a non-empty 1-D array.")
+        if np.any(weights < 0) or not np.all(np.isfinite(weights)):
+            raise ValueError("Weights must be finite and non-negative.")
+
+        total = np.sum(weights)
+        if total == 0:
+            raise ValueError("Weights must not all be zero.")
+
+        size = weights.size
+        scaled = weights * (size / total)
+        prob = np.ones(size)
+        alias = np.arange(size)
+
+        # Vose's method, every column is split between one light outcome and
+        # the heavy outcome that fills the rest of it.
+        small = np.flatnonzero(scaled < 1.0).tolist()
+        large = np.flatnonzero(scaled >= 1.0).tolist()
+        while small and large:
+            light = small.pop()
+            heavy = large[-1]
+            prob[light] = scaled[light]
+            alias[light] = heavy
+            scaled[heavy] -= 1.0 - scaled[light]
+            if scaled[heavy] < 1.0:
+                small.append(large.pop())
+
+        # Leftovers are only due to rounding and are kept with probability 1
+        self.prob = prob
+        self.alias = alias
+        # Indices are returned in the smallest type that fits, 10^7 samples
+        # over fewer than 2^16 terms only take 20 MB.
+        self.dtype = np.min_scalar_type(size - 1)
+
+    def __len__(self) -> int:
+        return self.prob.size
+
+    def sample(self, size: int, rng: Seed = None) -> np.ndarray:
+        """
+        Draws outcomes independently.
+
+        Inputs:
+            - size: Number of samples.
+            - rng: Generator or seed, a fresh generator is used by default.
+
+        Returns: Array of outcome indices of type `dtype`.
+        """
+        rng = np.random.default_rng(rng)
+        draws = rng.random(size) * len(self)
+        cols = draws.astype(np.intp)
+        # Guards against `random() * L` rounding up to `L`
+        np.minimum(cols, len(self) - 1, out=cols)
+        inds = np.where(draws - cols < self.prob[cols], cols, self.alias[cols])
+        return inds.astype(self.dtype)
+
+    def stream(
+        self, size: int, rng: Seed = None, chunk_size: int = CHUNK_SIZE
+    ) -> Iterator[np.ndarray]:
+        """
+        Same as `sample`, but yields the samples in chunks of at most
+        `chunk_size`, so that only one chunk is held at a time.
+        """
+        if chunk_size <= 0:
+            raise ValueError("Chunk size must be positive.")
+
+        rng = np.random.default_rng(rng)
+        for start in range(0, size, chunk_size):
+            yield self.sample(min(chunk_size, size - start), rng)
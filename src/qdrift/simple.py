@@ -1,53 +1,137 @@
+from typing import Iterator, Union
+
 from qiskit import QuantumCircuit
-from ..trotter import trotter_from_term
+from ..hamiltonian.table import PauliTable, as_table
+from ..synthesis.builder import CircuitBuilder
+from ..synthesis.cache import TEMPLATE_CACHE, TemplateCache
+from ..utils.trace import span, traced
+from .sampler import CHUNK_SIZE, AliasSampler, Seed
 import numpy as np
 
 
-def qdrift(h: dict[str, float], t: float = 1.0, eps: float = 1.0) -> QuantumCircuit:
+def num_samples(h: dict[str, float] | PauliTable, t: float = 1.0, eps: float = 1.0):
+    """
+    Number of terms `N = 2 λ² t² / ε` sampled by QDRIFT, where `λ` is the sum
+    of the absolute values of the coefficients.
+    """
+    lambd = np.sum(np.abs(as_table(h).coeffs))
+    return int(2 * (lambd**2) * (t**2) // eps)
+
+
+def qdrift_samples(
+    h: dict[str, float] | PauliTable,
+    t: float = 1.0,
+    eps: float = 1.0,
+    rng: Seed = None,
+    chunk_size: Union[int, None] = None,
+    samples: Union[int, None] = None,
+) -> np.ndarray | Iterator[np.ndarray]:
+    """
+    Samples the terms of the Hamiltonian for QDRIFT with probability
+    proportional to the absolute value of their coefficients, using an alias
+    table.
+
+    Input:
+        - h: Hamiltonian in Pauli basis along with coefficients, or PauliTable
+        - t: Time
+        - eps: Error factor for QDRIFT.
+        - rng: Generator or seed, a fresh generator is used by default.
+        - chunk_size: If given, the samples are streamed in chunks of this size.
+        - samples: Number of samples, instead of the one derived from `eps`.
+    Returns: Array of term indices, or an iterator over chunks of it.
+    """
+    table = as_table(h)
+    N = num_samples(table, t, eps) if samples is None else samples
+
+    if len(table) == 0 or N == 0:
+        sampler = None
+    else:
+        sampler = AliasSampler(np.abs(table.coeffs))
+
+    if chunk_size is None:
+        if sampler is None:
+            return np.zeros(0, dtype=np.uint8)
+        return sampler.sample(N, rng)
+
+    if sampler is None:
+        return iter([])
+    return sampler.stream(N, rng, chunk_size)
+
+
+@traced("qdrift")
+def qdrift(
+    h: dict[str, float] | PauliTable,
+    t: float = 1.0,
+    eps: float = 1.0,
+    ladder: str = "chain",
+    cache: Union[TemplateCache, None] = None,
+    rng: Seed = None,
+    chunk_size: int = CHUNK_SIZE,
+    samples: Union[int, None] = None,
+) -> QuantumCircuit:
     """
     API that takes Hamiltonian in a familiar format along with time and creates
-    circuit that simulates the same using simple Trotterization.
+    circuit that simulates the same using QDRIFT.
 
     Input:
-        - h: Hamiltonian in Pauli basis along with coefficients
+        - h: Hamiltonian in Pauli basis along with coefficients, or PauliTable
         - t: Time
         - eps: Error factor for QDRIFT.
+        - ladder: Shape of the CNOT parity ladder, `chain` or `tree`.
+        - cache: Rotation templates to reuse, defaults to the shared cache.
+        - rng: Generator or seed, a fresh generator is used by default.
+        - chunk_size: Number of terms sampled at a time.
+        - samples: Number of samples, instead of the one derived from `eps`.
     Returns: Quantum Circuit for simulation
     """
 
-    paulis = list(h.keys())
-    num_qubits = len(paulis[0])
-    coeffs = np.array([h[pauli] for pauli in paulis])
-    weights = np.abs(coeffs)
-    lambd = np.sum(weights)
+    cache = TEMPLATE_CACHE if cache is None else cache
+    table = as_table(h)
+    num_qubits = table.num_qubits
+    coeffs = table.coeffs
+    lambd = np.sum(np.abs(coeffs))
+
+    builder = CircuitBuilder(num_qubits)
 
-    N = int(2 * (lambd**2) * (t**2) // eps)
-    factor = lambd * t / N
+    N = num_samples(table, t, eps) if samples is None else samples
+    if N == 0:
+        return builder.build()
 
-    pauli_ops = [trotter_from_term((pauli, factor)) for pauli in paulis]
-    sampled_inds = np.random.choice(len(pauli_ops), size=N, p=weights / lambd)
-    sampled_terms = [pauli_ops[ind] for ind in sampled_inds]
+    # Every sampled term evolves for the same time, with the sign of its
+    # coefficient.
+    factors = lambd * t / N * np.sign(coeffs)
 
-    final_circuit = QuantumCircuit(num_qubits)
+    # Every term is looked up once, sampled terms only emit the operations
+    with span("qdrift.synthesis"):
+        templates = [cache.get_row(table, ind, ladder) for ind in range(len(table))]
 
-    for term in sampled_terms:
-        final_circuit = final_circuit.compose(term)
+    # Sampling is timed apart from the composition of every streamed chunk
+    chunks = qdrift_samples(table, t, eps, rng, chunk_size, N)
+    while True:
+        with span("qdrift.sample"):
+            chunk = next(chunks, None)
+        if chunk is None:
+            break
+        with span("qdrift.compose"):
+            for ind in chunk.tolist():
+                builder.append_template(templates[ind], factors[ind])
 
-    return final_circuit
+    return builder.build()
 
 
-def qdrift_error(h: dict[str, float], t: float, r: int) -> float:
+def qdrift_error(h: dict[str, float] | PauliTable, t: float, r: int) -> float:
     """
     API to determine the analytical error for the QDRIFT protocol based on the
     formula given in the arxiv submission.
 
     Input:
-        - h: Hamiltonian in Pauli basis along with coefficients.
+        - h: Hamiltonian in Pauli basis along with coefficients, or PauliTable
         - t: Time
         - r: The multiplicative factor w.r.t the number of terms in `h`.
     """
-    l = len(h.keys())
-    coeffs = np.array(h.values())
+    table = as_table(h)
+    l = len(table)
+    coeffs = table.coeffs
     weights = np.abs(coeffs)
     lambd = np.sum(weights)
 
@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+
+from ..utils import circuit_eq
+from .ensemble import QDriftEnsemble
+from .simple import qdrift, qdrift_samples
+
+h = {"xxi": 1.0, "iyz": -0.5, "zzz": 0.25}
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_matches_qdrift(workers):
+    ensemble = QDriftEnsemble(h, 1.5)
+    circuits = ensemble.circuits(3, seed=7, workers=workers)
+    indices = ensemble.indices(3, seed=7, workers=workers)
+
+    for child, circuit, inds in zip(
+        np.random.SeedSequence(7).spawn(3), circuits, indices
+    ):
+        rng = np.random.default_rng(child)
+        assert np.array_equal(inds, qdrift_samples(h, 1.5, rng=child))
+        assert circuit_eq(circuit, qdrift(h, 1.5, rng=rng))
+        assert circuit_eq(circuit, ensemble.circuit(inds))
+
+
+def test_independent_of_workers():
+    ensemble = QDriftEnsemble(h, 1.0)
+    serial = ensemble.indices(5, seed=3, workers=1)
+    parallel = ensemble.indices(5, seed=3, workers=3)
+
+    assert all(np.array_equal(a, b) for a, b in zip(serial, parallel))
+    assert not np.array_equal(serial[0], serial[1])
+
+
+def test_empty():
+    ensemble = QDriftEnsemble({"xx": 0.1}, 1.0)
+    assert ensemble.num_samples == 0
+    assert [c.size() for c in ensemble.circuits(2, workers=1)] == [0, 0]
+    assert ensemble.circuits(0) == []
+
+    with pytest.raises(ValueError):
+        ensemble.indices(-1)
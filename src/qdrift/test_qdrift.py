@@ -1,6 +1,7 @@
 from qiskit import QuantumCircuit
+from qiskit.quantum_info import Operator
 from ..utils import circuit_eq
-from .simple import qdrift
+from .simple import qdrift, qdrift_samples
 from ..trotter.simple import trotter
 
 import numpy as np
@@ -11,23 +12,17 @@ hamiltonians = [
     {"xi": 1.0},
 ]
 
-order_list = [
-    ["iy", "iy", "iy", "iy", "xx", "iy", "xx", "iy"],
-    ["xi", "xi"],
-]
-
-
-@pytest.mark.parametrize("h,order", zip(hamiltonians, order_list))
-def test_qdrift(h, order):
-    # Setting random seed for testing
-    np.random.seed(0)
 
-    result = qdrift(h, 1.0)
+@pytest.mark.parametrize("h", hamiltonians)
+def test_qdrift(h):
+    result = qdrift(h, 1.0, rng=0)
+    order = [list(h.keys())[ind] for ind in qdrift_samples(h, 1.0, rng=0)]
     num_qubits = len(list(h.keys())[0])
 
     lambd = sum(list(h.values()))
     N = 2 * (lambd**2)
     factor = lambd / N
+    assert len(order) == N
 
     # It is equivalent of constructing individual term exponentiated and then
     # concatanating them.
@@ -38,3 +33,27 @@ def test_qdrift(h, order):
         expected = expected.compose(cur)
 
     assert circuit_eq(expected, result)
+
+
+def test_negative_coefficients():
+    # Only one term, so the sampled circuit is deterministic
+    h = {"xz": -0.75}
+    result = qdrift(h, 2.0, eps=0.5, rng=1)
+    assert Operator(result).equiv(Operator(trotter(h, 2.0)))
+
+
+def test_no_samples():
+    h = {"xz": 0.1, "zi": 0.1}
+    assert qdrift_samples(h, 1.0).size == 0
+    assert list(qdrift_samples(h, 1.0, chunk_size=4)) == []
+    assert qdrift(h, 1.0).size() == 0
+
+
+def test_streaming():
+    h = {"xx": 3.0, "iy": -1.0, "zz": 0.5}
+    samples = qdrift_samples(h, 1.0, rng=5)
+    chunks = list(qdrift_samples(h, 1.0, rng=5, chunk_size=7))
+
+    assert all(len(chunk) <= 7 for chunk in chunks)
+    assert np.array_equal(np.concatenate(chunks), samples)
+    assert circuit_eq(qdrift(h, 1.0, rng=5, chunk_size=7), qdrift(h, 1.0, rng=5))
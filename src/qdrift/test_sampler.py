@@ -0,0 +1,41 @@
+import numpy as np
+import pytest
+
+from .sampler import AliasSampler
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_distribution(seed):
+    rng = np.random.default_rng(seed)
+    weights = rng.random(50) ** 4
+    weights[[3, 17]] = 0.0
+    sampler = AliasSampler(weights)
+
+    # Total probability of every outcome in the table is exact
+    mass = sampler.prob.copy()
+    np.add.at(mass, sampler.alias, 1.0 - sampler.prob)
+    assert np.allclose(mass / len(weights), weights / np.sum(weights))
+
+    samples = sampler.sample(200_000, rng)
+    freqs = np.bincount(samples, minlength=len(weights)) / samples.size
+    assert freqs[3] == freqs[17] == 0
+    assert np.allclose(freqs, weights / np.sum(weights), atol=5e-3)
+
+
+def test_compact_indices():
+    assert AliasSampler(np.ones(200)).sample(10, 0).dtype == np.uint8
+    assert AliasSampler(np.ones(300)).sample(10, 0).dtype == np.uint16
+
+
+def test_stream():
+    sampler = AliasSampler([1.0, 2.0, 3.0])
+    chunks = list(sampler.stream(10, 0, chunk_size=4))
+
+    assert [len(chunk) for chunk in chunks] == [4, 4, 2]
+    assert np.array_equal(np.concatenate(chunks), sampler.sample(10, 0))
+
+
+@pytest.mark.parametrize("weights", [[], [0.0, 0.0], [1.0, -1.0], [[1.0]]])
+def test_invalid_weights(weights):
+    with pytest.raises(ValueError):
+        AliasSampler(weights)
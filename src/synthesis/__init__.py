@@ -0,0 +1,10 @@
+from .rotation import (
+    rotation_ops,
+    rotation_ops_from_bits,
+    append_pauli_evolution,
+    pauli_evolution,
+)
+from .builder import CircuitBuilder
+from .cache import RotationTemplate, TemplateCache, TEMPLATE_CACHE
+from .repeated import RepeatedCircuit, depth_matrix
+from .diagonal import DIAGONAL_SYNTHESES, DiagonalTemplate, shared_ladder_ops
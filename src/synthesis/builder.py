@@ -0,0 +1,99 @@
+from qiskit import QuantumCircuit
+from qiskit.circuit import CircuitInstruction
+from qiskit.circuit.library import CXGate, CZGate, HGate, RZGate, SdgGate, SGate
+
+from .rotation import Op, rotation_ops
+
+# Gates without parameters are immutable, a single instance is shared by every
+# instruction.
+_GATES = {
+    "h": HGate(),
+    "s": SGate(),
+    "sdg": SdgGate(),
+    "cx": CXGate(),
+    "cz": CZGate(),
+}
+
+
+class CircuitBuilder:
+    """
+    Assembles a circuit by appending instructions in place. Repeatedly calling
+    `compose` copies the whole accumulated circuit each time, so building from
+    `N` pieces costs `O(N^2)`, the builder keeps it linear in the gate count.
+    The same builder is used by all the product formulas.
+    """
+
+    def __init__(self, num_qubits: int):
+        self._circuit = QuantumCircuit(num_qubits)
+        self._qubits = self._circuit.qubits
+
+    @property
+    def num_qubits(self) -> int:
+        return self._circuit.num_qubits
+
+    def _append(self, operation, qubits: tuple[int, ...]):
+        bits = tuple(self._qubits[qubit] for qubit in qubits)
+        self._circuit._append(CircuitInstruction(operation, bits, ()))
+
+    def append_ops(self, ops: list[Op], angle: float):
+        """
+        Appends synthesized operations, the `rz` gates are given the angle.
+        """
+        for name, qubits in ops:
+            if name == "rz":
+                self._append(RZGate(angle), qubits)
+            else:
+                self._append(_GATES[name], qubits)
+
+    def append_evolution(self, term: tuple[str, float], ladder: str = "chain"):
+        """
+        Appends `exp(-i c P)` for the term `(P, c)`.
+        """
+        pauli, coeff = term
+        self.append_rotation(rotation_ops(pauli, ladder), coeff)
+
+    def append_rotation(self, ops: list[Op], coeff: float):
+        """
+        Appends `exp(-i c P)` given the operations synthesized for `P`, the
+        identity only contributes a global phase.
+        """
+        if len(ops) == 0:
+            self._circuit.global_phase -= coeff
+        self.append_ops(ops, 2 * coeff)
+
+    def append_template(self, template, coeff: float):
+        """
+        Appends a cached rotation template with the coefficient bound.
+        """
+        self.append_rotation(template.ops, coeff)
+
+    def append_diagonal(self, template, coeffs: list[float]):
+        """
+        Appends a synthesized sequence of diagonal terms, `exp(-i c P)` for the
+        coefficient of every term in order.
+        """
+        angles = iter([2 * coeffs[ind] for ind in template.rotated])
+        for name, qubits in template.ops:
+            if name == "rz":
+                self._append(RZGate(next(angles)), qubits)
+            else:
+                self._append(_GATES[name], qubits)
+        for ind in template.identities:
+            self._circuit.global_phase -= coeffs[ind]
+
+    def compose(self, circuit: QuantumCircuit):
+        """
+        Appends all the instructions of the circuit, acting on the same number
+        of qubits, without copying the accumulated circuit.
+        """
+        mapping = dict(zip(circuit.qubits, self._qubits))
+        for instruction in circuit.data:
+            bits = tuple(mapping[qubit] for qubit in instruction.qubits)
+            self._circuit._append(CircuitInstruction(instruction.operation, bits, ()))
+        self._circuit.global_phase += circuit.global_phase
+
+    def build(self) -> QuantumCircuit:
+        """
+        Returns the assembled circuit, the builder should not be used after.
+        """
+        return self._circuit
@@ -0,0 +1,130 @@
+from collections import OrderedDict
+from typing import NamedTuple, Union
+
+from qiskit import QuantumCircuit
+from qiskit.circuit import Parameter
+
+from ..hamiltonian.table import PauliTable, unpack_bits
+from .rotation import Op, append_ops, rotation_ops, rotation_ops_from_bits
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class RotationTemplate:
+    """
+    Synthesized rotation `exp(-i c P)` of a single Pauli operator, where the
+    coefficient is left symbolic and bound when the template is used.
+    """
+
+    def __init__(self, ops: list[Op], num_qubits: int):
+        self.ops = ops
+        self.num_qubits = num_qubits
+        self._circuit: Union[QuantumCircuit, None] = None
+
+    @property
+    def is_identity(self) -> bool:
+        return len(self.ops) == 0
+
+    def circuit(self) -> QuantumCircuit:
+        """
+        Parameterized circuit of the template, with the RZ angle `2c` as the
+        only parameter.
+        """
+        if self._circuit is None:
+            angle = Parameter("θ")
+            self._circuit = QuantumCircuit(self.num_qubits)
+            append_ops(self._circuit, self.ops, angle)
+        return self._circuit
+
+    def bind(self, coeff: float) -> QuantumCircuit:
+        """
+        Circuit for `exp(-i c P)` with the coefficient bound.
+        """
+        circuit = self.circuit()
+        if self.is_identity:
+            circuit = circuit.copy()
+            circuit.global_phase -= coeff
+            return circuit
+        return circuit.assign_parameters([2 * coeff])
+
+
+class TemplateCache:
+    """
+    Bounded cache of rotation templates keyed by the Pauli operator and the
+    synthesis options. The least recently used template is evicted once the
+    cache is full.
+    """
+
+    def __init__(self, maxsize: int = 4096):
+        if maxsize <= 0:
+            raise ValueError("Cache size must be positive.")
+
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._templates: OrderedDict = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._templates)
+
+    def _lookup(self, key) -> Union[RotationTemplate, None]:
+        template = self._templates.get(key)
+        if template is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._templates.move_to_end(key)
+        return template
+
+    def _insert(self, key, template: RotationTemplate) -> RotationTemplate:
+        self._templates[key] = template
+        if len(self._templates) > self.maxsize:
+            self._templates.popitem(last=False)
+        return template
+
+    def get(self, pauli: str, ladder: str = "chain") -> RotationTemplate:
+        """
+        Template for a Pauli string, synthesized on a miss.
+        """
+        key = (pauli.lower(), ladder)
+        template = self._lookup(key)
+        if template is None:
+            template = self._insert(
+                key, RotationTemplate(rotation_ops(pauli, ladder), len(pauli))
+            )
+        return template
+
+    def get_row(
+        self, table: PauliTable, ind: int, ladder: str = "chain"
+    ) -> RotationTemplate:
+        """
+        Template for a row of the table, keyed by its packed words so that the
+        string is never constructed.
+        """
+        x_row, z_row = table.x[ind], table.z[ind]
+        key = (x_row.tobytes(), z_row.tobytes(), table.num_qubits, ladder)
+        template = self._lookup(key)
+        if template is None:
+            x_bits = unpack_bits(x_row[None, :], table.num_qubits)[0]
+            z_bits = unpack_bits(z_row[None, :], table.num_qubits)[0]
+            ops = rotation_ops_from_bits(x_bits, z_bits, ladder)
+            template = self._insert(key, RotationTemplate(ops, table.num_qubits))
+        return template
+
+    def info(self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self))
+
+    def clear(self):
+        self._templates.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+# Shared by all the product formulas unless a cache is passed explicitly
+TEMPLATE_CACHE = TemplateCache()
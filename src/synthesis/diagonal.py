@@ -0,0 +1,212 @@
+from typing import Union
+
+import numpy as np
+
+from ..hamiltonian.table import pack_bits, popcount
+from .rotation import Op
+
+DIAGONAL_SYNTHESES = ["ladder", "phase_polynomial"]
+
+
+def _supports(terms: list[str]) -> list[list[int]]:
+    """
+    Qubits of every diagonal Pauli string, where the character at position `i`
+    acts on qubit `n - 1 - i`.
+
+    Raises:
+        - ValueError: if a term is not diagonal.
+    """
+    supports = []
+    for term in terms:
+        term = term.lower()
+        if any(p not in "iz" for p in term):
+            raise ValueError(f"Term is not diagonal: {term}")
+        n = len(term)
+        supports.append(sorted(n - 1 - i for i, p in enumerate(term) if p == "z"))
+    return supports
+
+
+def _next_target(supports: list[list[int]], start: int) -> int:
+    """
+    Qubit of the term at `start` that stays in the support of the most of the
+    following terms, identities aside, the highest one on ties.
+    """
+    candidates = set(supports[start])
+    for support in supports[start + 1 :]:
+        if len(support) == 0:
+            continue
+        shared = candidates.intersection(support)
+        if len(shared) == 0:
+            break
+        candidates = shared
+    return max(candidates)
+
+
+def shared_ladder_ops(supports: list[list[int]]) -> list[Op]:
+    """
+    Operations that exponentiate a sequence of diagonal Pauli operators with a
+    single parity ladder carried from one term to the next. The target holds
+    the parity of the current term, the next term is reached with a CNOT for
+    every qubit where the supports differ, and the ladder is only uncomputed
+    when the next term does not act on the target. Consecutive terms with close
+    supports thus share most of their CNOTs.
+
+    Inputs:
+        - supports: Qubits of every term, in order.
+
+    Returns: List of operations with one `rz` for every non-identity term, in
+    order.
+    """
+    ops: list[Op] = []
+    parity: set[int] = set()
+    target = None
+
+    def uncompute():
+        ops.extend(("cx", (qubit, target)) for qubit in sorted(parity - {target}))
+
+    for ind, support in enumerate(supports):
+        if len(support) == 0:
+            continue
+        if target not in support:
+            if target is not None:
+                uncompute()
+            target = _next_target(supports, ind)
+            parity = {target}
+
+        changed = parity.symmetric_difference(support)
+        ops.extend(("cx", (qubit, target)) for qubit in sorted(changed))
+        parity = set(support)
+        ops.append(("rz", (target,)))
+
+    if target is not None:
+        uncompute()
+    return ops
+
+
+def _restore(state: list[int], ops: list[Op]):
+    """
+    CNOTs that bring every qubit back to its own value by Gauss-Jordan
+    elimination, `state[q]` is the mask of the inputs whose parity qubit `q`
+    holds.
+    """
+    for col in range(len(state)):
+        bit = 1 << col
+        if not state[col] & bit:
+            pivot = next(row for row in range(col + 1, len(state)) if state[row] & bit)
+            ops.append(("cx", (pivot, col)))
+            state[col] ^= state[pivot]
+        for row in range(len(state)):
+            if row != col and state[row] & bit:
+                ops.append(("cx", (col, row)))
+                state[row] ^= state[col]
+
+
+def phase_polynomial_ops(
+    supports: list[list[int]], num_qubits: int
+) -> tuple[list[Op], list[int]]:
+    """
+    Operations that exponentiate a set of diagonal Pauli operators as a single
+    phase polynomial, with the Gray-synth parity network of Amy, Azimzadeh and
+    Mosca. The parities of all the terms are split recursively on the qubit
+    that best separates them, and CNOTs are added so that the terms that share
+    a prefix of the splits are reached one after the other, every parity
+    getting its `rz` on the qubit where it first appears. The linear map left
+    by the network is undone by Gauss-Jordan elimination.
+
+    Inputs:
+        - supports: Qubits of every term.
+        - num_qubits: Number of qubits.
+
+    Returns: List of operations and the index of the term of every `rz`, in
+    order. Terms with the same support are rotated one after the other.
+    """
+    pending: dict[int, list[int]] = {}
+    for ind, support in enumerate(supports):
+        if len(support) > 0:
+            pending.setdefault(sum(1 << qubit for qubit in support), []).append(ind)
+
+    ops: list[Op] = []
+    rotated: list[int] = []
+    state = [1 << qubit for qubit in range(num_qubits)]
+
+    def rotate(qubit: int):
+        for ind in pending.pop(state[qubit], []):
+            ops.append(("rz", (qubit,)))
+            rotated.append(ind)
+
+    for qubit in range(num_qubits):
+        rotate(qubit)
+
+    # Parities are kept as packed masks over the inputs, along with the qubits
+    # that are left to split on and the qubit that collects them. Column `q` of
+    # the inverse of the linear map of the network expresses them over the
+    # current values of the qubits.
+    inverse = pack_bits(np.eye(num_qubits, dtype=bool))
+    bits = [[(mask >> qubit) & 1 for qubit in range(num_qubits)] for mask in pending]
+    columns = pack_bits(np.array(bits, dtype=bool).reshape(-1, num_qubits))
+    stack: list[tuple[np.ndarray, list[int], Union[int, None]]] = [
+        (columns, list(range(num_qubits)), None)
+    ]
+    while len(stack) > 0:
+        columns, rows, target = stack.pop()
+        if len(columns) == 0:
+            continue
+        current = (popcount(columns[:, None, :] & inverse[None, :, :]) & 1).astype(bool)
+
+        if target is not None:
+            # Qubits in every parity are added to the target
+            while True:
+                common = np.flatnonzero(np.all(current, axis=0))
+                common = common[common != target]
+                if len(common) == 0:
+                    break
+                row = int(common[0])
+                ops.append(("cx", (row, target)))
+                state[target] ^= state[row]
+                rotate(target)
+                inverse[row] ^= inverse[target]
+                current[:, row] ^= current[:, target]
+
+            # A single parity is left on the target alone
+            if len(columns) == 1:
+                continue
+
+        if len(rows) == 0:
+            continue
+
+        ones = np.sum(current[:, rows], axis=0)
+        split = rows[int(np.argmax(np.maximum(ones, len(columns) - ones)))]
+        is_one = current[:, split]
+        rest = [row for row in rows if row != split]
+        stack.append((columns[is_one], rest, split if target is None else target))
+        stack.append((columns[~is_one], rest, target))
+
+    _restore(state, ops)
+    return ops, rotated
+
+
+class DiagonalTemplate:
+    """
+    Synthesized operations of a sequence of commuting diagonal terms, bound to
+    the coefficients of the terms when appended. `rotated` holds the indices of
+    the terms that get an `rz`, in the order of the operations, every other
+    term is the identity and only contributes a global phase.
+    """
+
+    def __init__(self, terms: list[str], synthesis: str = "ladder"):
+        supports = _supports(terms)
+        match synthesis:
+            case "ladder":
+                self.ops = shared_ladder_ops(supports)
+                rotated = [ind for ind, support in enumerate(supports) if support]
+            case "phase_polynomial":
+                num_qubits = len(terms[0]) if len(terms) > 0 else 0
+                self.ops, rotated = phase_polynomial_ops(supports, num_qubits)
+            case _:
+                raise ValueError(
+                    f"Unknown synthesis: {synthesis}, expected one of "
+                    f"{DIAGONAL_SYNTHESES}"
+                )
+        self.num_qubits = len(terms[0]) if len(terms) > 0 else 0
+        self.rotated = rotated
+        self.identities = [ind for ind, support in enumerate(supports) if not support]
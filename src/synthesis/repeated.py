@@ -0,0 +1,109 @@
+import numpy as np
+from qiskit import QuantumCircuit
+
+from .builder import CircuitBuilder
+
+
+def _max_plus(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    Matrix product in the (max, +) semiring.
+    """
+    return np.max(a[:, :, None] + b[None, :, :], axis=1)
+
+
+def depth_matrix(circuit: QuantumCircuit) -> np.ndarray:
+    """
+    Longest path, in number of operations, from the start of every qubit to the
+    end of every qubit through the circuit, `-inf` when there is no path. The
+    ready times of the qubits after the circuit are `max_p (ready_p + D[p, q])`,
+    so concatenating circuits multiplies their matrices in the (max, +)
+    semiring.
+
+    Inputs:
+        - circuit: Circuit without classical bits.
+
+    Returns: Matrix `D` of shape (qubits, qubits).
+    """
+    num_qubits = circuit.num_qubits
+    paths = np.full((num_qubits, num_qubits), -np.inf)
+    np.fill_diagonal(paths, 0.0)
+
+    # Column `q` holds the longest path from every start to the end of qubit `q`
+    for instruction in circuit.data:
+        if getattr(instruction.operation, "_directive", False):
+            continue
+
+        qubits = [circuit.find_bit(qubit).index for qubit in instruction.qubits]
+        longest = np.max(paths[:, qubits], axis=1) + 1
+        paths[:, qubits] = longest[:, None]
+
+    return paths
+
+
+class RepeatedCircuit:
+    """
+    A single step of a product formula repeated `reps` times. Memory stays the
+    size of one step, while gate counts and depth are computed without
+    unrolling the repetitions.
+    """
+
+    def __init__(self, step: QuantumCircuit, reps: int):
+        if reps < 1:
+            raise ValueError("Number of repetitions must be positive.")
+
+        self.step = step
+        self.reps = reps
+
+    @property
+    def num_qubits(self) -> int:
+        return self.step.num_qubits
+
+    def count_ops(self) -> dict[str, int]:
+        return {
+            name: count * self.reps for name, count in self.step.count_ops().items()
+        }
+
+    def size(self) -> int:
+        return self.step.size() * self.reps
+
+    def depth(self) -> int:
+        """
+        Exact depth of the unrolled circuit, the depth matrix of the step is
+        raised to the power `reps` with repeated squaring.
+        """
+        if self.num_qubits == 0:
+            return 0
+
+        step = depth_matrix(self.step)
+        total = None
+        reps = self.reps
+        while reps > 0:
+            if reps & 1:
+                total = step if total is None else _max_plus(total, step)
+            reps >>= 1
+            if reps > 0:
+                step = _max_plus(step, step)
+
+        return int(np.max(total))
+
+    def to_circuit(self) -> QuantumCircuit:
+        """
+        Unrolls all the repetitions into a single circuit.
+        """
+        builder = CircuitBuilder(self.num_qubits)
+        for _ in range(self.reps):
+            builder.compose(self.step)
+        return builder.build()
+
+    def to_for_loop(self) -> QuantumCircuit:
+        """
+        Circuit with a single `for_loop` instruction over the step, the global
+        phase of the repetitions is kept outside of the loop.
+        """
+        body = self.step.copy()
+        body.global_phase = 0
+
+        circuit = QuantumCircuit(self.num_qubits)
+        circuit.for_loop(range(self.reps), None, body, circuit.qubits, [])
+        circuit.global_phase = self.step.global_phase * self.reps
+        return circuit
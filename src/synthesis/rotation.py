@@ -0,0 +1,138 @@
+import numpy as np
+from qiskit import QuantumCircuit
+
+# Operations are stored as the gate name along with the qubits, the single `rz`
+# of a rotation takes the angle when the operations are emitted.
+Op = tuple[str, tuple[int, ...]]
+
+LADDERS = ["chain", "tree"]
+
+
+def _ladder(qubits: list[int], ladder: str) -> tuple[list[Op], int]:
+    """
+    CNOTs that compute the parity of the qubits onto a single target.
+
+    Returns: List of CNOTs and the target qubit holding the parity.
+    """
+    cnots: list[Op] = []
+
+    match ladder:
+        case "chain":
+            for control, target in zip(qubits, qubits[1:]):
+                cnots.append(("cx", (control, target)))
+            return cnots, qubits[-1]
+        case "tree":
+            # Pairs are combined level by level, giving logarithmic depth
+            level = qubits
+            while len(level) > 1:
+                combined = []
+                for control, target in zip(level[::2], level[1::2]):
+                    cnots.append(("cx", (control, target)))
+                    combined.append(target)
+                if len(level) % 2 == 1:
+                    combined.append(level[-1])
+                level = combined
+            return cnots, level[0]
+        case _:
+            raise ValueError(f"Unknown ladder: {ladder}, expected one of {LADDERS}")
+
+
+def rotation_ops_from_bits(
+    x_bits: np.ndarray, z_bits: np.ndarray, ladder: str = "chain"
+) -> list[Op]:
+    """
+    Operations that exponentiate a single Pauli operator: basis change to Z on
+    every qubit in the support, CNOT ladder computing the parity, rotation on
+    the target of the ladder and the uncomputation.
+
+    Inputs:
+        - x_bits, z_bits: Boolean arrays where index `j` represents qubit `j`.
+        - ladder: Shape of the parity ladder, `chain` or `tree`.
+
+    Returns: List of operations, with a single `rz` unless the operator is the
+    identity, in which case it is empty.
+    """
+    x_bits = np.asarray(x_bits, dtype=bool)
+    z_bits = np.asarray(z_bits, dtype=bool)
+    qubits = np.flatnonzero(x_bits | z_bits).tolist()
+    if len(qubits) == 0:
+        return []
+
+    basis: list[Op] = []
+    unbasis: list[Op] = []
+    for qubit in qubits:
+        if x_bits[qubit] and z_bits[qubit]:
+            basis.extend([("sdg", (qubit,)), ("h", (qubit,))])
+            unbasis.extend([("h", (qubit,)), ("s", (qubit,))])
+        elif x_bits[qubit]:
+            basis.append(("h", (qubit,)))
+            unbasis.append(("h", (qubit,)))
+
+    cnots, target = _ladder(qubits, ladder)
+    return basis + cnots + [("rz", (target,))] + cnots[::-1] + unbasis
+
+
+def rotation_ops(pauli: str, ladder: str = "chain") -> list[Op]:
+    """
+    Same as `rotation_ops_from_bits` for a Pauli string, where the character at
+    position `i` acts on qubit `n - 1 - i`.
+    """
+    pauli = pauli.lower()[::-1]
+    x_bits = np.array([p in "xy" for p in pauli], dtype=bool)
+    z_bits = np.array([p in "zy" for p in pauli], dtype=bool)
+    return rotation_ops_from_bits(x_bits, z_bits, ladder)
+
+
+def circuit_ops(circuit: QuantumCircuit) -> list[Op]:
+    """
+    Operations of the gates in a circuit, with the qubits as indices.
+    """
+    return [
+        (
+            instruction.operation.name,
+            tuple(circuit.find_bit(qubit).index for qubit in instruction.qubits),
+        )
+        for instruction in circuit.data
+    ]
+
+
+def append_ops(circuit: QuantumCircuit, ops: list[Op], angle: float):
+    """
+    Appends the operations to the circuit in place, the `rz` gates are given
+    the angle.
+    """
+    for name, qubits in ops:
+        if name == "rz":
+            circuit.rz(angle, qubits[0])
+        else:
+            getattr(circuit, name)(*qubits)
+
+
+def append_pauli_evolution(
+    circuit: QuantumCircuit, term: tuple[str, float], ladder: str = "chain"
+):
+    """
+    Appends `exp(-i c P)` for the term `(P, c)` to the circuit in place. The
+    identity only contributes a global phase.
+    """
+    pauli, coeff = term
+    ops = rotation_ops(pauli, ladder)
+    if len(ops) == 0:
+        circuit.global_phase -= coeff
+    append_ops(circuit, ops, 2 * coeff)
+
+
+def pauli_evolution(term: tuple[str, float], ladder: str = "chain") -> QuantumCircuit:
+    """
+    Synthesizes the circuit for `exp(-i c P)` directly from the term `(P, c)`,
+    without going through `qiskit.opflow`.
+
+    Inputs:
+        - term: Pair of Pauli string and the coefficient.
+        - ladder: Shape of the parity ladder, `chain` or `tree`.
+
+    Returns: QuantumCircuit for the evolution.
+    """
+    circuit = QuantumCircuit(len(term[0]))
+    append_pauli_evolution(circuit, term, ladder)
+    return circuit
@@ -0,0 +1,49 @@
+import pytest
+from qiskit import QuantumCircuit
+from qiskit.quantum_info import Operator
+
+from .builder import CircuitBuilder
+from .rotation import pauli_evolution, rotation_ops
+
+terms_list = [
+    [("xy", 1.0), ("iy", 2.0)],
+    [("xi", 1.0), ("iy", 2.0), ("xi", 3.0), ("ii", -1.0)],
+    [("xyz", 0.1), ("zzz", -0.2), ("yiy", 0.3)],
+]
+
+
+@pytest.mark.parametrize("ladder", ["chain", "tree"])
+@pytest.mark.parametrize("terms", terms_list)
+def test_append_evolution(terms, ladder):
+    num_qubits = len(terms[0][0])
+    builder = CircuitBuilder(num_qubits)
+
+    expected = QuantumCircuit(num_qubits)
+    for term in terms:
+        builder.append_evolution(term, ladder)
+        expected = expected.compose(pauli_evolution(term, ladder))
+
+    result = builder.build()
+    assert Operator(result) == Operator(expected)
+    assert result.count_ops() == expected.count_ops()
+
+
+def test_compose():
+    piece = QuantumCircuit(3)
+    piece.h(0)
+    piece.cx(0, 2)
+    piece.rz(0.5, 2)
+    piece.global_phase = 0.25
+
+    builder = CircuitBuilder(3)
+    builder.append_ops(rotation_ops("xiz"), 0.3)
+    builder.compose(piece)
+    builder.compose(piece)
+
+    expected = QuantumCircuit(3)
+    expected = expected.compose(pauli_evolution(("xiz", 0.15)))
+    expected = expected.compose(piece)
+    expected = expected.compose(piece)
+
+    assert Operator(builder.build()) == Operator(expected)
+    assert len(piece.data) == 3
@@ -0,0 +1,69 @@
+import pytest
+from qiskit.quantum_info import Operator
+
+from ..hamiltonian import PauliTable
+from ..trotter.simple import trotter
+from .cache import TemplateCache
+from .rotation import pauli_evolution
+
+
+def test_hits_and_misses():
+    cache = TemplateCache()
+    first = cache.get("xyz")
+    second = cache.get("XYZ")
+    cache.get("xyz", ladder="tree")
+
+    assert first is second
+    assert cache.info() == (1, 2, 4096, 2)
+
+    cache.clear()
+    assert cache.info() == (0, 0, 4096, 0)
+
+
+def test_lru_eviction():
+    cache = TemplateCache(maxsize=2)
+    cache.get("xx")
+    cache.get("yy")
+    cache.get("xx")
+    cache.get("zz")
+
+    # `yy` was the least recently used
+    assert len(cache) == 2
+    cache.get("xx")
+    cache.get("yy")
+    assert cache.info().hits == 2
+    assert cache.info().misses == 4
+
+
+@pytest.mark.parametrize("term", [("xyz", 0.3), ("iiz", -1.0), ("ii", 0.5)])
+def test_bind(term):
+    template = TemplateCache().get(term[0])
+
+    assert len(template.circuit().parameters) == (0 if term[0] == "ii" else 1)
+    assert Operator(template.bind(term[1])) == Operator(pauli_evolution(term))
+
+
+def test_rows_share_templates():
+    cache = TemplateCache()
+    table = PauliTable.from_labels(["xyz", "zzi", "xyz"])
+
+    templates = [cache.get_row(table, ind) for ind in range(len(table))]
+    assert templates[0] is templates[2]
+    assert templates[0].ops == cache.get("xyz").ops
+    assert cache.info().misses == 3
+
+
+def test_time_sweep_reuses_templates():
+    cache = TemplateCache()
+    h = {"xx": 1.0, "zi": 0.5, "iy": -0.2}
+
+    for t in [0.1, 0.2, 0.3, 0.4]:
+        trotter(h, t, reps=2, cache=cache)
+
+    assert cache.info().misses == 3
+    assert cache.info().hits == 9
+
+
+def test_invalid_size():
+    with pytest.raises(ValueError):
+        TemplateCache(maxsize=0)
@@ -0,0 +1,92 @@
+import numpy as np
+import pytest
+from qiskit.quantum_info import Operator
+
+from ..utils import circuit_eq
+
+from .builder import CircuitBuilder
+from .diagonal import (
+    DIAGONAL_SYNTHESES,
+    DiagonalTemplate,
+    phase_polynomial_ops,
+    shared_ladder_ops,
+)
+from .rotation import pauli_evolution
+
+groups = [
+    ["zzi", "zzz", "izz", "ziz"],
+    ["zii", "iii", "iiz", "zzz", "zzi"],
+    ["izzi", "zzii", "iizz", "zizi", "zzzz", "izii"],
+]
+
+
+@pytest.mark.parametrize("synthesis", DIAGONAL_SYNTHESES)
+@pytest.mark.parametrize("terms", groups)
+def test_matches_rotations(terms, synthesis):
+    coeffs = np.linspace(-0.7, 0.9, len(terms)).tolist()
+    builder = CircuitBuilder(len(terms[0]))
+    builder.append_diagonal(DiagonalTemplate(terms, synthesis), coeffs)
+    circuit = builder.build()
+
+    expected = pauli_evolution((terms[0], coeffs[0]))
+    for term, coeff in zip(terms[1:], coeffs[1:]):
+        expected = expected.compose(pauli_evolution((term, coeff)))
+
+    assert Operator(circuit).equiv(Operator(expected))
+    assert np.allclose(Operator(circuit).data, Operator(expected).data)
+
+
+def test_shared_ladder():
+    # The target stays on qubit 1, only the qubits that change are added
+    ops = shared_ladder_ops([[0, 1], [0, 1, 2], [1, 2]])
+    assert ops == [
+        ("cx", (0, 1)),
+        ("rz", (1,)),
+        ("cx", (2, 1)),
+        ("rz", (1,)),
+        ("cx", (0, 1)),
+        ("rz", (1,)),
+        ("cx", (2, 1)),
+    ]
+    # The ladder is uncomputed when the target is left
+    ops = shared_ladder_ops([[0, 1], [2]])
+    assert ops == [("cx", (0, 1)), ("rz", (1,)), ("cx", (0, 1)), ("rz", (2,))]
+    assert shared_ladder_ops([[], []]) == []
+
+    template = DiagonalTemplate(["iz", "ii", "zz"])
+    assert template.rotated == [0, 2]
+    assert template.identities == [1]
+
+    with pytest.raises(ValueError):
+        DiagonalTemplate(["zx"])
+    with pytest.raises(ValueError):
+        DiagonalTemplate(["zz"], "tree")
+
+
+def test_phase_polynomial():
+    # Every parity of three qubits, a phase polynomial needs far fewer CNOTs
+    # than a ladder per term
+    supports = [[q for q in range(3) if mask >> q & 1] for mask in range(1, 8)]
+    ops, rotated = phase_polynomial_ops(supports, 3)
+    assert sorted(rotated) == list(range(7))
+    assert sum(name == "cx" for name, _ in ops) < sum(
+        2 * (len(support) - 1) for support in supports
+    )
+
+    # Repeated supports are rotated one after the other
+    _, rotated = phase_polynomial_ops([[0, 1], [], [0, 1]], 2)
+    assert rotated == [0, 2]
+    assert phase_polynomial_ops([[], []], 2) == ([], [])
+
+
+def test_phase_polynomial_words():
+    # Parities across more than one packed word
+    rng = np.random.default_rng(3)
+    terms = ["".join(rng.choice(["i", "z"], 70, p=[0.9, 0.1])) for _ in range(30)]
+    coeffs = rng.normal(size=30).tolist()
+    circuits = []
+    for synthesis in DIAGONAL_SYNTHESES:
+        builder = CircuitBuilder(70)
+        builder.append_diagonal(DiagonalTemplate(terms, synthesis), coeffs)
+        circuits.append(builder.build())
+    assert circuit_eq(*circuits, method="pauli")
@@ -0,0 +1,83 @@
+import pytest
+import numpy as np
+from qiskit import QuantumCircuit
+from qiskit.circuit.random import random_circuit
+from qiskit.quantum_info import Operator
+
+from ..benchmark.decompose import decompose
+from ..grouping import Bitwise
+from ..ordering import lexico
+from ..trotter.simple import trotter
+from ..trotter_grouping.group_trotter import generic
+from ..utils import circuit_eq
+from ..utils.gate_count import gate_count
+from .repeated import RepeatedCircuit, depth_matrix
+
+
+@pytest.mark.parametrize("reps", [1, 2, 3, 7, 16])
+@pytest.mark.parametrize("seed", range(5))
+def test_depth_and_counts(seed, reps):
+    step = random_circuit(5, 6, max_operands=3, seed=seed)
+    repeated = RepeatedCircuit(step, reps)
+    unrolled = repeated.to_circuit()
+
+    assert repeated.depth() == unrolled.depth()
+    assert repeated.count_ops() == dict(unrolled.count_ops())
+    assert repeated.size() == unrolled.size()
+
+
+def test_depth_overlapping_steps():
+    # Consecutive steps overlap, so the depth is not `reps` times the step
+    step = QuantumCircuit(2)
+    step.h(0)
+    step.cx(0, 1)
+    step.h(1)
+
+    assert depth_matrix(step).tolist() == [[2, 3], [1, 2]]
+    assert RepeatedCircuit(step, 4).depth() == 9
+    assert RepeatedCircuit(step, 4).to_circuit().depth() == 9
+
+
+def test_for_loop():
+    step = QuantumCircuit(2)
+    step.h(0)
+    step.cx(0, 1)
+    step.global_phase = 0.5
+
+    circuit = RepeatedCircuit(step, 1000).to_for_loop()
+    assert len(circuit.data) == 1
+    assert circuit.data[0].operation.name == "for_loop"
+    assert circuit.global_phase == pytest.approx(500 % (2 * np.pi))
+
+
+def test_invalid_reps():
+    with pytest.raises(ValueError):
+        RepeatedCircuit(QuantumCircuit(1), 0)
+
+
+h = {"xiizi": 1.0, "iyiiy": 2.0, "zzizz": -0.5}
+
+
+@pytest.mark.parametrize("reps", [1, 3])
+def test_lazy_trotter(reps):
+    repeated = trotter(h, 1.0, reps=reps, lazy=True)
+    unrolled = trotter(h, 1.0, reps=reps)
+
+    assert repeated.reps == reps
+    assert Operator(repeated.to_circuit()) == Operator(unrolled)
+    assert gate_count(repeated) == gate_count(unrolled)
+    assert repeated.depth() == unrolled.depth()
+
+
+@pytest.mark.parametrize("reps", [1, 3])
+def test_lazy_generic(reps):
+    repeated = generic(Bitwise, lexico, h, reps=reps, lazy=True)
+    assert circuit_eq(repeated.to_circuit(), generic(Bitwise, lexico, h, reps=reps))
+
+
+def test_lazy_decompose():
+    repeated = decompose(trotter(h, 1.0, reps=100, lazy=True))
+
+    assert isinstance(repeated, RepeatedCircuit)
+    assert repeated.reps == 100
+    assert circuit_eq(repeated.step, trotter(h, 0.01))
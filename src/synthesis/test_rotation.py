@@ -0,0 +1,59 @@
+import pytest
+from qiskit import QuantumCircuit
+from qiskit.circuit.library import PauliEvolutionGate
+from qiskit.quantum_info import Operator, SparsePauliOp
+
+from ..hamiltonian import PauliTable
+from .rotation import pauli_evolution, rotation_ops, rotation_ops_from_bits
+
+terms = [
+    ("x", 0.3),
+    ("xy", 1.0),
+    ("iy", 2.0),
+    ("zz", -3.0),
+    ("ii", -1.0),
+    ("xiizi", 0.7),
+    ("yzxiy", -0.4),
+]
+
+
+def _expected(term):
+    pauli, coeff = term
+    circuit = QuantumCircuit(len(pauli))
+    gate = PauliEvolutionGate(SparsePauliOp(pauli.upper()), time=coeff)
+    circuit.append(gate, range(len(pauli)))
+    return Operator(circuit)
+
+
+@pytest.mark.parametrize("ladder", ["chain", "tree"])
+@pytest.mark.parametrize("term", terms)
+def test_pauli_evolution(term, ladder):
+    result = pauli_evolution(term, ladder)
+
+    # Exact, including the global phase
+    assert Operator(result) == _expected(term)
+
+
+@pytest.mark.parametrize("ladder", ["chain", "tree"])
+def test_ops_from_packed_row(ladder):
+    table = PauliTable.from_labels(["yzxiy", "iiixz"])
+    x_bits, z_bits = table.x_bits(), table.z_bits()
+
+    for ind, pauli in enumerate(table.labels()):
+        result = rotation_ops_from_bits(x_bits[ind], z_bits[ind], ladder)
+        assert result == rotation_ops(pauli, ladder)
+
+
+def test_tree_depth():
+    term = ("z" * 16, 1.0)
+    chain = pauli_evolution(term, "chain")
+    tree = pauli_evolution(term, "tree")
+
+    assert chain.count_ops()["cx"] == tree.count_ops()["cx"] == 30
+    assert chain.depth() == 31
+    assert tree.depth() == 9
+
+
+def test_unknown_ladder():
+    with pytest.raises(ValueError):
+        pauli_evolution(("xx", 1.0), "star")
@@ -1 +1,12 @@
 from .simple import trotter, trotter_from_terms, trotter_from_term
+from .suzuki import suzuki_schedule, merge_stages
+from .error import (
+    CommutatorNorms,
+    commutator_norms,
+    trotter_norms,
+    grouped_norms,
+    group_stages,
+    overlap_norms,
+    trotter_error,
+    bitwise_error,
+)
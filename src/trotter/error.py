@@ -0,0 +1,234 @@
+import math
+from typing import Callable, NamedTuple, Union
+
+import numpy as np
+
+from ..grouping.bitwise import Bitwise
+from ..grouping.grouper import Grouper
+from ..hamiltonian.algebra import (
+    CHUNK_SIZE,
+    PauliSum,
+    commutator,
+    commutator_norm_bound,
+)
+from ..hamiltonian.table import PauliTable, as_table
+
+
+class CommutatorNorms(NamedTuple):
+    """
+    Commutator norms of a product formula whose exponentials `H_1, ..., H_Γ`
+    are applied in order, with `L_γ = H_{γ+1} + ... + H_Γ`:
+
+        - first: `sum_γ ||[L_γ, H_γ]||`
+        - nested: `sum_γ ||[L_γ, [L_γ, H_γ]]||`
+        - inner: `sum_γ ||[H_γ, [H_γ, L_γ]]||`
+
+    Every norm is bounded by the sum of the absolute values of the Pauli
+    coefficients of the commutator, after adding up repeated operators. The
+    nested norms are only computed for second order bounds.
+    """
+
+    first: float
+    nested: float = math.nan
+    inner: float = math.nan
+
+    def error(self, t: float, reps: int = 1, order: int = 1) -> float:
+        """
+        Bound of the spectral norm error of `reps` steps of the first order
+        formula, `t^2 / (2 r) first`, or of the second order symmetric
+        formula, `t^3 / r^2 (nested / 12 + inner / 24)`.
+        """
+        if reps <= 0:
+            raise ValueError("Number of repetitions must be positive.")
+        if order == 1:
+            return t**2 / (2 * reps) * self.first
+        if order == 2:
+            if math.isnan(self.nested):
+                raise ValueError("Second order norms were not computed.")
+            return abs(t) ** 3 / reps**2 * (self.nested / 12 + self.inner / 24)
+        raise ValueError("Only first and second order bounds are supported.")
+
+    def reps_for(self, t: float, eps: float, order: int = 1) -> int:
+        """
+        Smallest number of repetitions whose error bound is at most `eps`.
+        """
+        if eps <= 0:
+            raise ValueError("Error must be positive.")
+        if order == 1:
+            reps = t**2 * self.first / (2 * eps)
+        elif order == 2:
+            reps = math.sqrt(self.error(t, 1, 2) / eps)
+        else:
+            raise ValueError("Only first and second order bounds are supported.")
+        return max(1, math.ceil(reps))
+
+
+def commutator_norms(
+    table: PauliTable,
+    stages: Union[list[int], None] = None,
+    order: int = 1,
+    chunk_size: int = CHUNK_SIZE,
+) -> CommutatorNorms:
+    """
+    Computes the commutator norms of the product formula that exponentiates
+    consecutive rows of the table together, in order. The rows of a stage must
+    commute, so that its exponential is exact.
+
+    Inputs:
+        - table: Terms in the order of the formula.
+        - stages: Number of rows of every stage, one row per stage by default.
+        - order: 1 only computes `first`, 2 also the nested norms.
+        - chunk_size: Largest number of operator pairs processed at once.
+
+    Returns: CommutatorNorms
+
+    Raises:
+        - ValueError: if the stages do not cover the table.
+
+    The first order norms take `O(Γ^2)` pairs, the nested norms `O(Γ^3)`.
+    """
+    if stages is None:
+        stages = [1] * len(table)
+    if sum(stages) != len(table) or any(size <= 0 for size in stages):
+        raise ValueError("Stages must be positive and cover the table.")
+    if order not in (1, 2):
+        raise ValueError("Only first and second order bounds are supported.")
+
+    terms = PauliSum.from_table(table)
+    first = nested = inner = 0.0
+
+    end = len(table)
+    for size in reversed(stages):
+        start = end - size
+        stage = PauliSum(
+            terms.x[start:end], terms.z[start:end], terms.coeffs[start:end]
+        )
+        later = PauliSum(terms.x[end:], terms.z[end:], terms.coeffs[end:])
+        end = start
+        if len(later) == 0:
+            continue
+
+        # Products with a single operator are all distinct
+        inner_comm = commutator(later, stage, chunk_size, reduce=size > 1)
+        first += inner_comm.norm_bound()
+
+        if order == 2 and len(inner_comm) > 0:
+            nested += commutator_norm_bound(later, inner_comm, chunk_size)
+            inner += commutator(stage, inner_comm, chunk_size).norm_bound()
+
+    if order == 1:
+        return CommutatorNorms(first)
+    return CommutatorNorms(first, nested, inner)
+
+
+def overlap_norms(
+    table: PauliTable, stages: Union[list[int], None] = None
+) -> CommutatorNorms:
+    """
+    First order norms bounded from the supports alone, in `O(Γ n)` instead of
+    the `O(Γ^2)` pairs of `commutator_norms`. Two Pauli operators only
+    anticommute if they act differently on a qubit where neither is the
+    identity, so every row contributes `2 |c|` times the smaller of the weight
+    of the later rows and the weight of the later rows that differ from it on
+    each qubit of its support.
+
+    Inputs:
+        - table: Terms in the order of the formula.
+        - stages: Number of rows of every stage, one row per stage by default.
+
+    Returns: CommutatorNorms with only `first`.
+
+    Raises:
+        - ValueError: if the stages do not cover the table.
+    """
+    if stages is None:
+        stages = [1] * len(table)
+    if sum(stages) != len(table) or any(size <= 0 for size in stages):
+        raise ValueError("Stages must be positive and cover the table.")
+    if len(table) == 0:
+        return CommutatorNorms(0.0)
+
+    # Rows are compared against the suffix that starts after their stage
+    ends = np.repeat(np.cumsum(stages), stages)
+    weights = np.abs(table.coeffs)
+
+    def suffix(values: np.ndarray) -> np.ndarray:
+        sums = np.zeros(len(values) + 1)
+        sums[:-1] = np.cumsum(values[::-1])[::-1]
+        return sums[ends]
+
+    overlap = np.zeros(len(table))
+    for qubit in range(table.num_qubits):
+        word, bit = divmod(qubit, 64)
+        x = (table.x[:, word] >> np.uint64(bit)) & np.uint64(1)
+        z = (table.z[:, word] >> np.uint64(bit)) & np.uint64(1)
+        # 0 is the identity, then X, Z and Y
+        letter = (x + 2 * z).astype(np.int64)
+        acting = letter > 0
+        later = suffix(weights * acting)
+        for code in (1, 2, 3):
+            same = letter == code
+            later[same] -= suffix(weights * same)[same]
+        overlap += np.where(acting, later, 0.0)
+
+    first = 2 * weights @ np.minimum(overlap, suffix(weights))
+    return CommutatorNorms(float(first))
+
+
+def trotter_norms(
+    h: dict[str, float] | PauliTable, order: int = 1, chunk_size: int = CHUNK_SIZE
+) -> CommutatorNorms:
+    """
+    Commutator norms of `trotter`, which exponentiates the terms one at a time
+    in the order of the table.
+    """
+    return commutator_norms(as_table(h), None, order, chunk_size)
+
+
+def group_stages(
+    grouper: Grouper, h: dict[str, float] | PauliTable
+) -> tuple[PauliTable, list[int]]:
+    """
+    Terms of the Hamiltonian in the order of the groups, along with the size of
+    every group, as the stages of `commutator_norms`. The grouper has to be
+    built from the table of the Hamiltonian, its groups are rows of it.
+    """
+    table = as_table(h)
+    groups = grouper.group_indices
+    rows = np.concatenate(groups) if len(groups) > 0 else np.zeros(0, dtype=int)
+    return table[rows], [len(group) for group in groups]
+
+
+def grouped_norms(
+    grouper_class: Callable[[PauliTable], Grouper],
+    h: dict[str, float] | PauliTable,
+    order: int = 1,
+    chunk_size: int = CHUNK_SIZE,
+) -> CommutatorNorms:
+    """
+    Commutator norms of `generic` with the same grouper, where every group is
+    exponentiated exactly and the groups are applied in order.
+    """
+    table = as_table(h)
+    table, stages = group_stages(grouper_class(table), table)
+    return commutator_norms(table, stages, order, chunk_size)
+
+
+def trotter_error(
+    h: dict[str, float] | PauliTable, t: float = 1.0, reps: int = 1, order: int = 1
+) -> float:
+    """
+    Commutator bound of the error of `trotter(h, t, reps, order=order)` for
+    orders 1 and 2.
+    """
+    return trotter_norms(h, order).error(t, reps, order)
+
+
+def bitwise_error(
+    h: dict[str, float] | PauliTable, t: float = 1.0, reps: int = 1, order: int = 1
+) -> float:
+    """
+    Commutator bound of the error of `bitwise_simple(h, t, reps, order=order)`
+    for orders 1 and 2.
+    """
+    return grouped_norms(Bitwise, h, order).error(t, reps, order)
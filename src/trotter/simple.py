@@ -1,9 +1,20 @@
+from typing import Union
+
 from qiskit import QuantumCircuit
-from qiskit.opflow import PauliTrotterEvolution, X, Y, Z, I  # For `eval`
-from ..utils.repr import qiskit_string_repr, qiskit_string_repr_pauli
+from ..hamiltonian.table import PauliTable, as_table
+from ..synthesis.builder import CircuitBuilder
+from ..synthesis.cache import TEMPLATE_CACHE, TemplateCache
+from ..synthesis.repeated import RepeatedCircuit
+from ..utils.trace import span, traced
+from .suzuki import suzuki_schedule
 
 
-def trotter_from_terms(terms: list[tuple[str, float]]) -> QuantumCircuit:
+@traced("trotter.trotter_from_terms")
+def trotter_from_terms(
+    terms: list[tuple[str, float]],
+    ladder: str = "chain",
+    cache: Union[TemplateCache, None] = None,
+) -> QuantumCircuit:
     """
     API that takes a list of terms that must be exponentiated in the specific
     order, that may or may not have repetitions. The coefficients are assumed
@@ -11,43 +22,82 @@ def trotter_from_terms(terms: list[tuple[str, float]]) -> QuantumCircuit:
 
     Input:
         - terms: list of pairs of pauli operator and the coefficient.
+        - ladder: Shape of the CNOT parity ladder, `chain` or `tree`.
+        - cache: Rotation templates to reuse, defaults to the shared cache.
     Returns: Quantum Circuit with exponentiation in the defined ordered.
     """
-    num_qubits = len(terms[0][0])
-    final_circuit = QuantumCircuit(num_qubits)
+    cache = TEMPLATE_CACHE if cache is None else cache
+    builder = CircuitBuilder(len(terms[0][0]))
 
-    for term in terms:
-        final_circuit = final_circuit.compose(trotter_from_term(term))
+    for pauli, coeff in terms:
+        builder.append_template(cache.get(pauli, ladder), coeff)
 
-    return final_circuit
+    return builder.build()
 
 
-def trotter_from_term(term: tuple[str, float]) -> QuantumCircuit:
-    pauli_op = eval(qiskit_string_repr_pauli(term))
-    evolution_op = pauli_op.exp_i()
-    trotterized_op = PauliTrotterEvolution(trotter_mode="trotter").convert(evolution_op)
-    return trotterized_op.to_circuit()
+@traced("trotter.trotter_from_term")
+def trotter_from_term(
+    term: tuple[str, float],
+    ladder: str = "chain",
+    cache: Union[TemplateCache, None] = None,
+) -> QuantumCircuit:
+    """
+    Circuit for `exp(-i c P)` of a single term `(P, c)`, synthesized natively
+    as a basis change, CNOT parity ladder and a single RZ rotation.
+    """
+    return trotter_from_terms([term], ladder, cache)
 
 
-def trotter(h: dict[str, float], t: float = 1.0, reps: int = 1) -> QuantumCircuit:
+@traced("trotter")
+def trotter(
+    h: dict[str, float] | PauliTable,
+    t: float = 1.0,
+    reps: int = 1,
+    ladder: str = "chain",
+    cache: Union[TemplateCache, None] = None,
+    lazy: bool = False,
+    order: int = 1,
+) -> QuantumCircuit | RepeatedCircuit:
     """
     API that takes Hamiltonian in a familiar format along with time and creates
     circuit that simulates the same using simple Trotterization.
 
     Input:
-        - h: Hamiltonian in Pauli basis along with coefficients
+        - h: Hamiltonian in Pauli basis along with coefficients, or PauliTable
         - t: Time
         - reps: The number of times to repeat trotterization steps.
+        - ladder: Shape of the CNOT parity ladder, `chain` or `tree`.
+        - cache: Rotation templates to reuse, defaults to the shared cache.
+        - lazy: Return a single step with the repetition count instead of
+        unrolling all the repetitions.
+        - order: Order of the Suzuki formula, 1 for Lie-Trotter or even.
     Returns: Quantum Circuit for simulation
+
+    The half-steps of higher orders that meet at the boundary between steps
+    are merged in the unrolled circuit, the lazy step keeps them apart so that
+    it can be repeated.
     """
-    hamiltonian = eval(qiskit_string_repr(h))
+    cache = TEMPLATE_CACHE if cache is None else cache
+    table = as_table(h)
+
+    merge = order > 1 and not lazy
+    schedule = suzuki_schedule(len(table), order, reps if merge else 1)
 
-    # evolution operator
-    evolution_op = ((t / reps) * hamiltonian).exp_i()
+    # Every term is looked up once and bound for each of its stages
+    with span("trotter.synthesis"):
+        templates = [cache.get_row(table, ind, ladder) for ind in range(len(table))]
 
-    # into circuit
-    trotterized_op = PauliTrotterEvolution(trotter_mode="trotter", reps=reps).convert(
-        evolution_op
-    )
+    with span("trotter.compose"):
+        coeffs = table.coeffs.tolist()
+        builder = CircuitBuilder(table.num_qubits)
+        for ind, fraction in schedule:
+            builder.append_template(templates[ind], coeffs[ind] * t / reps * fraction)
+        step = builder.build()
 
-    return trotterized_op.to_circuit()
+    if merge:
+        return step
+    repeated = RepeatedCircuit(step, reps)
+    if lazy:
+        return repeated
+    with span("trotter.unroll"):
+        return repeated.to_circuit()
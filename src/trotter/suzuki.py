@@ -0,0 +1,65 @@
+from typing import Iterable
+
+# An exponential of a stage, a term or a group, for a fraction of the step time
+Stage = tuple[int, float]
+
+
+def suzuki_fraction(order: int) -> float:
+    """
+    Fraction `p_k = 1 / (4 - 4^{1 / (2k - 1)})` of the outer formulas in the
+    recursion of the `2k`-th order Suzuki formula.
+    """
+    return 1 / (4 - 4 ** (1 / (order - 1)))
+
+
+def _suzuki(order: int, stages: range, fraction: float) -> list[Stage]:
+    if order == 1:
+        return [(stage, fraction) for stage in stages]
+    if order == 2:
+        half = [(stage, fraction / 2) for stage in stages]
+        return half + half[::-1]
+
+    # S_2k(τ) = S_{2k-2}(p τ)^2 S_{2k-2}((1 - 4p) τ) S_{2k-2}(p τ)^2
+    p = suzuki_fraction(order)
+    outer = _suzuki(order - 2, stages, p * fraction)
+    return outer * 2 + _suzuki(order - 2, stages, (1 - 4 * p) * fraction) + outer * 2
+
+
+def merge_stages(schedule: Iterable[Stage]) -> list[Stage]:
+    """
+    Merges adjacent exponentials of the same stage into one, which is exact
+    since a stage commutes with itself.
+    """
+    merged: list[Stage] = []
+    for stage, fraction in schedule:
+        if len(merged) > 0 and merged[-1][0] == stage:
+            merged[-1] = (stage, merged[-1][1] + fraction)
+        else:
+            merged.append((stage, fraction))
+    return merged
+
+
+def suzuki_schedule(num_stages: int, order: int = 2, reps: int = 1) -> list[Stage]:
+    """
+    Exponentials of `reps` steps of the Suzuki product formula of the given
+    order, as pairs of the stage index and the fraction of the step time. Order
+    1 is Lie-Trotter, order 2 the symmetric formula and every even order above
+    is built recursively from the one two orders below. The half-steps that
+    meet, in the middle of the symmetric formula, between the recursive parts
+    and at the boundary between steps, are merged.
+
+    Inputs:
+        - num_stages: Number of stages, every one exponentiated exactly.
+        - order: 1 or an even order.
+        - reps: Number of steps.
+
+    Returns: List of (stage, fraction) in the order they are applied.
+
+    Raises:
+        - ValueError: if the order is not 1 or even, or `reps` is not positive.
+    """
+    if order < 1 or (order > 1 and order % 2 == 1):
+        raise ValueError("Order must be 1 or a positive even number.")
+    if reps < 1:
+        raise ValueError("Number of repetitions must be positive.")
+    return merge_stages(_suzuki(order, range(num_stages), 1.0) * reps)
@@ -0,0 +1,140 @@
+import numpy as np
+import pytest
+import scipy.linalg
+from qiskit.quantum_info import SparsePauliOp
+
+from .error import (
+    CommutatorNorms,
+    bitwise_error,
+    commutator_norms,
+    grouped_norms,
+    overlap_norms,
+    trotter_error,
+    trotter_norms,
+)
+from ..grouping.bitwise import Bitwise
+from ..hamiltonian.random_hamiltonian import random_table
+from ..hamiltonian.table import PauliTable
+from ..qdrift.simple import qdrift_error
+
+
+def _matrices(table: PauliTable) -> list[np.ndarray]:
+    return [SparsePauliOp(p.upper(), c).to_matrix() for p, c in table.items()]
+
+
+def _pauli_norm(matrix: np.ndarray) -> float:
+    op = SparsePauliOp.from_operator(matrix).simplify(atol=1e-12)
+    return float(np.sum(np.abs(op.coeffs)))
+
+
+def _product(matrices, t, reps, order):
+    step = np.eye(matrices[0].shape[0], dtype=complex)
+    if order == 1:
+        for matrix in matrices:
+            step = scipy.linalg.expm(-1j * matrix * t / reps) @ step
+    else:
+        for matrix in matrices + matrices[::-1]:
+            step = scipy.linalg.expm(-0.5j * matrix * t / reps) @ step
+    return np.linalg.matrix_power(step, reps)
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_matches_dense(seed):
+    h = random_table(3, 8, seed=seed)
+    matrices = _matrices(h)
+    norms = commutator_norms(h, order=2)
+
+    first = inner = 0.0
+    for ind, matrix in enumerate(matrices):
+        later = sum(matrices[ind + 1 :], np.zeros_like(matrix))
+        comm = later @ matrix - matrix @ later
+        first += _pauli_norm(comm)
+        inner += _pauli_norm(matrix @ comm - comm @ matrix)
+    assert norms.first == pytest.approx(first)
+    assert norms.inner == pytest.approx(inner)
+
+    exact = scipy.linalg.expm(-1j * sum(matrices) * 0.7)
+    for reps in (1, 3):
+        for order in (1, 2):
+            error = np.linalg.norm(exact - _product(matrices, 0.7, reps, order), 2)
+            assert error <= norms.error(0.7, reps, order)
+
+
+def test_stages():
+    # Terms of a stage are exponentiated together, only later stages count
+    h = PauliTable.from_labels(["zi", "iz", "xi", "ix"], [1.0, 0.5, 0.3, 0.2])
+    assert commutator_norms(h, [2, 2]).first == pytest.approx(
+        2 * 1.0 * 0.3 + 2 * 0.5 * 0.2
+    )
+    assert commutator_norms(h, [4]).first == 0.0
+    with pytest.raises(ValueError):
+        commutator_norms(h, [1, 2])
+    with pytest.raises(ValueError):
+        commutator_norms(h, order=3)
+
+    commuting = PauliTable.from_labels(["zz", "zi", "iz"])
+    assert trotter_norms(commuting, 2) == (0.0, 0.0, 0.0)
+
+
+def test_chunks():
+    h = random_table(5, 30, seed=4)
+    expected = trotter_norms(h, 2)
+    result = commutator_norms(h, order=2, chunk_size=3)
+    assert np.allclose(result, expected)
+
+
+def test_grouped():
+    h = random_table(4, 20, seed=5)
+    grouped = grouped_norms(Bitwise, h, 2)
+    assert grouped.first <= trotter_norms(h).first + 1e-9
+
+    matrices = []
+    grouper = Bitwise(set(h.to_dict()))
+    ham = h.to_dict()
+    for group in grouper.groups:
+        matrices.append(
+            sum(SparsePauliOp(p.upper(), ham[p]).to_matrix() for p in group)
+        )
+    exact = scipy.linalg.expm(-1j * sum(matrices) * 0.5)
+    error = np.linalg.norm(exact - _product(matrices, 0.5, 2, 1), 2)
+    assert error <= bitwise_error(h, 0.5, 2)
+
+
+def test_reps_for():
+    norms = CommutatorNorms(10.0, 40.0, 4.0)
+    assert norms.error(2.0, 4) == pytest.approx(5.0)
+    assert norms.error(1.0, 2, 2) == pytest.approx((40 / 12 + 4 / 24) / 4)
+
+    for order in (1, 2):
+        reps = norms.reps_for(2.0, 0.01, order)
+        assert norms.error(2.0, reps, order) <= 0.01
+        assert norms.error(2.0, reps - 1, order) > 0.01 if reps > 1 else True
+
+    with pytest.raises(ValueError):
+        CommutatorNorms(1.0).error(1.0, 1, 2)
+    with pytest.raises(ValueError):
+        norms.error(1.0, 0)
+    with pytest.raises(ValueError):
+        norms.reps_for(1.0, 0.0)
+
+    h = random_table(4, 10, seed=6)
+    assert trotter_error(h, 1.0, 4) == pytest.approx(trotter_error(h, 1.0, 1) / 4)
+
+
+def test_qdrift_error():
+    h = {"xx": 1.0, "zz": -0.5}
+    expected = 4 * 1.5**2 / 4 * np.exp(1.5 * 2 / 2)
+    assert qdrift_error(h, 1.0, 2) == pytest.approx(expected)
+    assert qdrift_error(PauliTable.from_dict(h), 1.0, 2) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_overlap_norms(seed):
+    h = random_table(6, 40, seed=seed)
+    assert overlap_norms(h).first >= trotter_norms(h).first
+    assert overlap_norms(h, [10] * 4).first >= commutator_norms(h, [10] * 4).first
+
+    assert overlap_norms(PauliTable.from_labels(["zz", "iz", "zi"])).first == 0.0
+    assert overlap_norms(PauliTable.from_labels(["zi", "xi"], [1.0, 0.5])).first == 1.0
+    with pytest.raises(ValueError):
+        overlap_norms(h, [1])
@@ -2,6 +2,7 @@ from qiskit import QuantumCircuit
 from qiskit.opflow import X, Y, Z, I
 from ..utils import qiskit_string_repr, circuit_eq
 from .simple import trotter, trotter_from_terms, trotter_from_term
+from ..hamiltonian import PauliTable
 
 import pytest
 
@@ -85,3 +86,9 @@ def test_from_term(term: tuple[str, float]):
     expected = trotter({pauli: coeff})
 
     assert circuit_eq(expected, result)
+
+
+@pytest.mark.parametrize("h", hamiltonians)
+def test_trotter_table(h):
+    result = trotter(PauliTable.from_dict(h), 1.0)
+    assert circuit_eq(trotter(h, 1.0), result)
@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+import scipy.linalg
+from qiskit.quantum_info import Operator, SparsePauliOp
+
+from .simple import trotter
+from .suzuki import suzuki_fraction, suzuki_schedule
+from ..hamiltonian.random_hamiltonian import random_table
+from ..trotter_grouping.bitwise_simple import bitwise_simple
+
+
+def _error(h, circuit, t):
+    matrix = sum(SparsePauliOp(p.upper(), c).to_matrix() for p, c in h.items())
+    exact = scipy.linalg.expm(-1j * matrix * t)
+    product = Operator(circuit).data
+    overlap = np.vdot(product.ravel(), exact.ravel())
+    return np.linalg.norm(exact - product * overlap / abs(overlap), 2)
+
+
+def test_schedule():
+    assert suzuki_schedule(3, 1) == [(0, 1.0), (1, 1.0), (2, 1.0)]
+    assert suzuki_schedule(3, 2) == [(0, 0.5), (1, 0.5), (2, 1.0), (1, 0.5), (0, 0.5)]
+    # Half-steps at the boundary between steps are merged
+    assert suzuki_schedule(2, 2, 2) == [
+        (0, 0.5),
+        (1, 1.0),
+        (0, 1.0),
+        (1, 1.0),
+        (0, 0.5),
+    ]
+    assert suzuki_schedule(1, 4, 3) == [(0, pytest.approx(3.0))]
+
+    for order in (2, 4, 6):
+        schedule = suzuki_schedule(4, order, 3)
+        for stage in range(4):
+            total = sum(f for s, f in schedule if s == stage)
+            assert total == pytest.approx(3.0)
+        assert all(a[0] != b[0] for a, b in zip(schedule, schedule[1:]))
+
+    assert suzuki_fraction(4) == pytest.approx(1 / (4 - 4 ** (1 / 3)))
+    for order, reps in ((3, 1), (0, 1), (2, 0)):
+        with pytest.raises(ValueError):
+            suzuki_schedule(2, order, reps)
+
+
+@pytest.mark.parametrize("order", [2, 4])
+def test_convergence(order):
+    h = random_table(3, 8, seed=1)
+    for formula in (trotter, bitwise_simple):
+        errors = [_error(h, formula(h, 1.0, reps, order=order), 1.0) for reps in (4, 8)]
+        # The error falls as reps^-order
+        assert errors[0] / errors[1] == pytest.approx(2**order, rel=0.2)
+        assert errors[0] < _error(h, formula(h, 1.0, 4), 1.0)
+
+
+@pytest.mark.parametrize("order", [2, 4])
+def test_lazy(order):
+    h = random_table(4, 10, seed=2)
+    for formula in (trotter, bitwise_simple):
+        unrolled = formula(h, 0.7, 3, order=order)
+        lazy = formula(h, 0.7, 3, lazy=True, order=order)
+        assert lazy.reps == 3
+        assert Operator(unrolled).equiv(Operator(lazy.to_circuit()))
+        # Merging the boundaries saves a stage per step
+        assert unrolled.size() < lazy.size()
+
+    with pytest.raises(ValueError):
+        trotter(h, 0.7, 3, order=3)
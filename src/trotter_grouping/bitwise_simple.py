@@ -1,22 +1,30 @@
 from qiskit import QuantumCircuit
 
 from ..grouping.bitwise import Bitwise
+from ..synthesis.repeated import RepeatedCircuit
+from ..hamiltonian.table import PauliTable
 
 from .group_trotter import generic
 from ..ordering import lexico
 
 
 def bitwise_simple(
-    h: dict[str, float], t: float = 1.0, reps: int = 1
-) -> QuantumCircuit:
+    h: dict[str, float] | PauliTable,
+    t: float = 1.0,
+    reps: int = 1,
+    lazy: bool = False,
+    order: int = 1,
+) -> QuantumCircuit | RepeatedCircuit:
     """
     Takes in a Hamiltonian and constructs the simple Trotterization circuit
     after grouping the terms using bitwise Pauli grouping.
 
     Inputs:
-        - h: Hamiltonian in dictionary form.
+        - h: Hamiltonian in dictionary form, or PauliTable.
         - t: Float representing time of evolution.
         - reps: Repetitions for Trotterization.
+        - lazy: Return a single step with the repetition count.
+        - order: Order of the Suzuki formula over the groups, 1 or even.
     Returns: QuantumCircuit that will simulate the Hamiltonian
     """
-    return generic(Bitwise, lexico, h, t, reps)
+    return generic(Bitwise, lexico, h, t, reps, lazy=lazy, order=order)
@@ -1,74 +1,115 @@
-from typing import Callable
+from typing import Callable, Union
 from qiskit import QuantumCircuit
 
 from ..grouping.grouper import Grouper
+from ..hamiltonian.table import PauliTable, as_table
 
-from ..trotter.simple import trotter_from_terms
+from ..synthesis.builder import CircuitBuilder
+from ..synthesis.cache import TEMPLATE_CACHE, TemplateCache
+from ..synthesis.diagonal import DIAGONAL_SYNTHESES, DiagonalTemplate
+from ..synthesis.repeated import RepeatedCircuit
 
-from ..utils import circuit_constructor, get_el
+from ..utils.trace import span, traced
+from ..trotter.suzuki import suzuki_schedule
 
 
+@traced("generic")
 def generic(
-    grouper_class: Callable[[set[str]], Grouper],
-    orderer: Callable[[set[str]], list[str]],
-    h: dict[str, float],
+    grouper_class: Callable[[PauliTable], Grouper],
+    orderer: Callable[[PauliTable], PauliTable],
+    h: dict[str, float] | PauliTable,
     t: float = 1.0,
     reps: int = 1,
-) -> QuantumCircuit:
+    ladder: str = "chain",
+    cache: Union[TemplateCache, None] = None,
+    lazy: bool = False,
+    order: int = 1,
+    synthesis: str = "rotations",
+) -> QuantumCircuit | RepeatedCircuit:
     """
     A generic trotterization constructor.
 
     Inputs:
-        - grouper: Pauli grouper
-        - orderer: Function that orders the diagonalized terms
-        - h: Hamiltonian in dictionary form
+        - grouper: Pauli grouper, built from the table of the Hamiltonian.
+        - orderer: Function that orders the terms of a group, given and
+        returned as a table.
+        - h: Hamiltonian in dictionary form, or PauliTable
         - t: Float representing time of evolution
         - reps: Repetitions for Trotterization.
+        - ladder: Shape of the CNOT parity ladder, `chain` or `tree`.
+        - cache: Rotation templates to reuse, defaults to the shared cache.
+        - lazy: Return a single step with the repetition count instead of
+        unrolling all the repetitions.
+        - order: Order of the Suzuki formula over the groups, 1 or even.
+        - synthesis: `rotations` synthesizes every diagonalized term on its own
+        with the ladder, `ladder` carries one parity ladder through the ordered
+        terms of a group and `phase_polynomial` synthesizes the whole group as
+        a single parity network, whatever the order.
     Returns: QuantumCircuit that will simulate the Hamiltonian
+
+    Every group is exponentiated exactly, the half-steps of higher orders that
+    meet at the boundary between steps are merged unless `lazy` is set.
     """
-    pauli_list = set(h.keys())
+    cache = TEMPLATE_CACHE if cache is None else cache
+    table = as_table(h)
 
-    if len(pauli_list) == 0:
+    if len(table) == 0:
         raise ValueError("Input Hamiltonian was empty.")
+    if synthesis != "rotations" and synthesis not in DIAGONAL_SYNTHESES:
+        raise ValueError(f"Unknown synthesis: {synthesis}")
 
-    # size of any pauli operator
-    first = get_el(pauli_list)
-    num_qubits = len(first)
-
-    grouper = grouper_class(pauli_list)
-    groups = grouper.groups
-    group_circs = []
-
-    # Get relevant circuits for all the groups
-    for group in groups:
-        pauli = get_el(group)
+    with span("generic.grouping"):
+        grouper = grouper_class(table)
+    groups = grouper.group_indices
+    group_parts = []
 
+    # Get relevant circuits for all the groups, every group is a sub-table of
+    # the rows of the Hamiltonian
+    for ind, rows in enumerate(groups):
         # Diagonalizing circuits
-        diag_circ = circuit_constructor(grouper.circuit(pauli))
-        diag_circ_c = diag_circ.inverse()
+        with span("generic.diagonalization"):
+            diag_circ = grouper.group_circuit(ind)
+            diag_circ_c = diag_circ.inverse()
 
         # Setting the order according to ordere
-        ordered = orderer(group)
-        ordered_tuples = []
-        for p in ordered:
-            coeff, term = grouper.diagonalize(p)
-            coeff = (t / reps) * h[p] * coeff
-            ordered_tuples.append((term, coeff))
-
-        # time will be scaled down by reps
-        exp_circ = trotter_from_terms(ordered_tuples)
-
-        final_circuit = QuantumCircuit(num_qubits)
-
-        # TODO: Issue 30
-        # Combining the three sections
-        final_circuit = diag_circ.compose(exp_circ)
-        final_circuit = final_circuit.compose(diag_circ_c)
-        group_circs.append(final_circuit)
-
-    final_circuit = QuantumCircuit(num_qubits)
-    for _ in range(reps):
-        for group_circ in group_circs:
-            final_circuit = final_circuit.compose(group_circ)
-
-    return final_circuit
+        with span("generic.ordering"):
+            diagonal = grouper.diagonalize_group(ind, orderer(table[rows]))
+            coeffs = ((t / reps) * diagonal.coeffs).tolist()
+
+        # Templates are shared by every stage of the group, time will be scaled
+        # down by reps
+        with span("generic.synthesis"):
+            if synthesis == "rotations":
+                synthesized = [
+                    cache.get_row(diagonal, row, ladder) for row in range(len(diagonal))
+                ]
+            else:
+                synthesized = DiagonalTemplate(diagonal.labels(), synthesis)
+        group_parts.append((diag_circ, diag_circ_c, synthesized, coeffs))
+
+    merge = order > 1 and not lazy
+    schedule = suzuki_schedule(len(groups), order, reps if merge else 1)
+
+    # Combining the three sections of every stage
+    with span("generic.compose"):
+        builder = CircuitBuilder(table.num_qubits)
+        for ind, fraction in schedule:
+            diag_circ, diag_circ_c, synthesized, coeffs = group_parts[ind]
+            builder.compose(diag_circ)
+            if synthesis == "rotations":
+                for template, coeff in zip(synthesized, coeffs):
+                    builder.append_template(template, coeff * fraction)
+            else:
+                builder.append_diagonal(
+                    synthesized, [coeff * fraction for coeff in coeffs]
+                )
+            builder.compose(diag_circ_c)
+        step = builder.build()
+
+    if merge:
+        return step
+    repeated = RepeatedCircuit(step, reps)
+    if lazy:
+        return repeated
+    with span("generic.unroll"):
+        return repeated.to_circuit()
@@ -5,7 +5,8 @@ from ..utils import circuit_eq
 from .group_trotter import generic
 
 from ..grouping import Bitwise
-from ..ordering import lexico
+from ..ordering import lexico, greedy, gray, two_opt
+from ..hamiltonian import PauliTable, random_table
 
 import itertools
 
@@ -98,3 +99,60 @@ def test_bitwise_simple_multiple_groups(reps, h, groups, qubits):
         check = check or circuit_eq(result, expected)
 
     assert check
+
+
+def test_generic_table():
+    h = {"xx": 1.0, "zz": 2.0, "zi": 3.0}
+    result = generic(Bitwise, lexico, PauliTable.from_dict(h))
+
+    groups = [{"xx": 1.0}, {"zz": 2.0, "zi": 3.0}]
+    check = False
+    for order in itertools.permutations(groups):
+        expected = QuantumCircuit(2)
+        for group in order:
+            expected = expected.compose(trotter(group))
+        check = check or circuit_eq(result, expected)
+
+    assert check
+
+
+def test_generic_rows():
+    # Grouping and ordering get the packed rows, never the strings
+    h = random_table(4, 20, seed=9)
+    calls = []
+
+    def orderer(table):
+        calls.append(table)
+        return lexico(table)
+
+    result = generic(Bitwise, orderer, h, 0.4)
+    assert all(isinstance(table, PauliTable) for table in calls)
+    assert sum(len(table) for table in calls) == len(h)
+    assert circuit_eq(result, generic(Bitwise, lexico, h.to_dict(), 0.4))
+
+
+def test_qubit_order():
+    # Diagonalization has to act on the qubit of each position in the string
+    for h in [{"xy": 1.0}, {"xiz": 1.0, "iiz": -0.5}, {"yzx": 0.3}]:
+        result = generic(Bitwise, lexico, h)
+        assert circuit_eq(result, trotter(h))
+
+
+@pytest.mark.parametrize("orderer", [greedy, gray, two_opt])
+def test_shared_ladder(orderer):
+    h = random_table(4, 16, seed=7)
+    expected = generic(Bitwise, lexico, h, 0.4, 2)
+    result = generic(Bitwise, orderer, h, 0.4, 2, synthesis="ladder")
+    assert circuit_eq(result, expected)
+    assert result.count_ops()["cx"] < expected.count_ops()["cx"]
+
+    with pytest.raises(ValueError):
+        generic(Bitwise, orderer, h, 0.4, synthesis="network")
+
+
+def test_phase_polynomial():
+    h = random_table(4, 16, seed=8)
+    expected = generic(Bitwise, lexico, h, 0.4, 2, order=2)
+    result = generic(Bitwise, lexico, h, 0.4, 2, order=2, synthesis="phase_polynomial")
+    assert circuit_eq(result, expected)
+    assert result.count_ops()["cx"] < expected.count_ops()["cx"]
@@ -1,4 +1,6 @@
 from .norm import circuit_eq
+from .equivalence import clifford_eq, pauli_eq, statevector_eq
 from .repr import qiskit_string_repr
 from .circuit import circuit_constructor
 from .sample import get_el
+from .trace import Profiler, SpanStats, profile, span, traced
@@ -1,6 +1,9 @@
 from qiskit import QuantumCircuit
 
+from .trace import traced
 
+
+@traced("utils.circuit_constructor")
 def circuit_constructor(gates_list: list[str], is_dag: bool = False) -> QuantumCircuit:
     """
     Constructs the circuit corresponding to the gates list given.
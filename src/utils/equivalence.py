@@ -0,0 +1,399 @@
+import math
+from typing import Union
+
+import numpy as np
+from qiskit import QuantumCircuit
+from qiskit.exceptions import QiskitError
+from qiskit.quantum_info import Clifford, random_statevector
+
+# Pauli operator `i^phase X^x Z^z`, bit `q` of `x` and `z` acts on qubit `q`
+Pauli = tuple[int, int, int]
+
+# Rotation `exp(-i a P / 2)` of a Hermitian Pauli operator given by its bits
+Rotation = tuple[tuple[int, int], float]
+
+_HALF_PI = math.pi / 2
+_QUARTER_PI = math.pi / 4
+
+
+def _product(a: Pauli, b: Pauli) -> Pauli:
+    # Moving the Z of `a` past the X of `b` flips the sign once per qubit
+    return a[0] ^ b[0], a[1] ^ b[1], (a[2] + b[2] + 2 * (a[1] & b[0]).bit_count()) % 4
+
+
+def _times(a: Pauli, phase: int) -> Pauli:
+    """
+    Multiplies the operator by `i^phase`.
+    """
+    return a[0], a[1], (a[2] + phase) % 4
+
+
+def _anticommute(a: tuple[int, int], b: tuple[int, int]) -> bool:
+    return ((a[0] & b[1]) ^ (a[1] & b[0])).bit_count() % 2 == 1
+
+
+def _hermitian(pauli: Pauli) -> tuple[tuple[int, int], int]:
+    """
+    Bits and sign of a Hermitian operator `±P`, where `P = i^#Y X^x Z^z` is
+    the product of the single qubit Pauli matrices.
+    """
+    x, z, phase = pauli
+    sign = (phase - (x & z).bit_count()) % 4
+    if sign % 2 == 1:
+        raise ValueError("Rotation of a non Hermitian operator.")
+    return (x, z), 1 if sign == 0 else -1
+
+
+def _conjugate(pauli: Pauli, axis: tuple[int, int], power: int) -> Pauli:
+    """
+    `K^† Q K` for the Clifford rotation `K = exp(-i power π/4 P)` of the
+    Hermitian operator `P` with the given bits.
+    """
+    if power % 4 == 0 or not _anticommute(pauli[:2], axis):
+        return pauli
+    if power % 2 == 0:
+        return _times(pauli, 2)
+    # K^† Q K = exp(i power π/2 P) Q = ±i P Q
+    p = (axis[0], axis[1], (axis[0] & axis[1]).bit_count() % 4)
+    return _times(_product(p, pauli), 1 if power % 4 == 1 else 3)
+
+
+def _split(angle: float, atol: float) -> tuple[int, float]:
+    """
+    Splits the angle into `power π/2 + rest`, with the rest in `(-π/4, π/4]`
+    up to the tolerance, so that the rotation is a Clifford rotation followed
+    by a small one.
+    """
+    power = math.ceil((angle - _QUARTER_PI - atol) / _HALF_PI)
+    return power % 4, angle - power * _HALF_PI
+
+
+class PauliFrame:
+    """
+    Propagates the Pauli operators through a Clifford+rotation circuit. For
+    the Clifford `C` applied so far, the frame stores `C^† X_q C` and
+    `C^† Z_q C` of every qubit, so that a rotation applied after `C` is the
+    rotation of the propagated operator applied before it. The circuit is then
+    the list of rotations on the input followed by the Clifford `C`.
+
+    Rotations by a multiple of `π/2` are Clifford gates and are absorbed into
+    the frame. Operations without a known rule are replaced by their
+    definition, global phases are ignored.
+    """
+
+    def __init__(self, num_qubits: int, atol: float = 1e-8):
+        self.num_qubits = num_qubits
+        self.atol = atol
+        self.x: list[Pauli] = [(1 << q, 0, 0) for q in range(num_qubits)]
+        self.z: list[Pauli] = [(0, 1 << q, 0) for q in range(num_qubits)]
+        self.rotations: list[Rotation] = []
+
+    def _y(self, q: int) -> Pauli:
+        # Y = i X Z
+        return _times(_product(self.x[q], self.z[q]), 1)
+
+    def h(self, q: int):
+        self.x[q], self.z[q] = self.z[q], self.x[q]
+
+    def s(self, q: int, power: int = 1):
+        # S^† X S = -Y and S X S^† = Y, Z is unchanged
+        for _ in range(power % 4):
+            self.x[q] = _times(self._y(q), 2)
+
+    def cx(self, control: int, target: int):
+        self.x[control] = _product(self.x[control], self.x[target])
+        self.z[target] = _product(self.z[control], self.z[target])
+
+    def cz(self, a: int, b: int):
+        self.x[a], self.x[b] = (
+            _product(self.x[a], self.z[b]),
+            _product(self.z[a], self.x[b]),
+        )
+
+    def rotate(self, pauli: Pauli, angle: float):
+        """
+        Appends `exp(-i angle P / 2)` for the propagated operator `P`, which
+        must be Hermitian.
+        """
+        bits, sign = _hermitian(pauli)
+        self.rotations.append((bits, sign * angle))
+
+    def rz(self, q: int, angle: float):
+        # The Clifford part is kept in the frame, it commutes with the rest
+        power, rest = _split(angle, self.atol)
+        if abs(rest) > self.atol:
+            self.rotate(self.z[q], rest)
+        self.s(q, power)
+
+    def rx(self, q: int, angle: float):
+        self.h(q)
+        self.rz(q, angle)
+        self.h(q)
+
+    def ry(self, q: int, angle: float):
+        self.s(q, 3)
+        self.rx(q, angle)
+        self.s(q)
+
+    def append(self, circuit: QuantumCircuit, qubits: Union[list[int], None] = None):
+        """
+        Propagates through every operation of the circuit, acting on the
+        given qubits of the frame.
+
+        Raises:
+            - ValueError: if an operation has no rule and no definition, or a
+            symbolic angle.
+        """
+        if qubits is None:
+            qubits = list(range(circuit.num_qubits))
+        index = {bit: qubits[ind] for ind, bit in enumerate(circuit.qubits)}
+
+        for instruction in circuit.data:
+            operation = instruction.operation
+            q = [index[bit] for bit in instruction.qubits]
+            try:
+                params = [float(param) for param in operation.params]
+            except TypeError:
+                raise ValueError(f"Symbolic angle in {operation.name}.")
+
+            match operation.name:
+                case "id" | "barrier" | "delay" | "global_phase":
+                    pass
+                case "h":
+                    self.h(q[0])
+                case "s":
+                    self.s(q[0])
+                case "sdg":
+                    self.s(q[0], 3)
+                case "x":
+                    self.z[q[0]] = _times(self.z[q[0]], 2)
+                case "y":
+                    self.x[q[0]] = _times(self.x[q[0]], 2)
+                    self.z[q[0]] = _times(self.z[q[0]], 2)
+                case "z":
+                    self.x[q[0]] = _times(self.x[q[0]], 2)
+                case "cx":
+                    self.cx(q[0], q[1])
+                case "cz":
+                    self.cz(q[0], q[1])
+                case "swap":
+                    self.x[q[0]], self.x[q[1]] = self.x[q[1]], self.x[q[0]]
+                    self.z[q[0]], self.z[q[1]] = self.z[q[1]], self.z[q[0]]
+                case "rz" | "p" | "u1":
+                    self.rz(q[0], params[0])
+                case "t" | "tdg":
+                    self.rz(
+                        q[0], math.pi / 4 if operation.name == "t" else -math.pi / 4
+                    )
+                case "rx":
+                    self.rx(q[0], params[0])
+                case "sx" | "sxdg":
+                    self.rx(q[0], _HALF_PI if operation.name == "sx" else -_HALF_PI)
+                case "ry":
+                    self.ry(q[0], params[0])
+                case "u" | "u3" | "u2":
+                    if operation.name == "u2":
+                        params = [_HALF_PI] + params
+                    # U(θ, φ, λ) = RZ(φ) RY(θ) RZ(λ) up to a global phase
+                    self.rz(q[0], params[2])
+                    self.ry(q[0], params[0])
+                    self.rz(q[0], params[1])
+                case "rzz":
+                    self.rotate(_product(self.z[q[0]], self.z[q[1]]), params[0])
+                case "rxx":
+                    self.rotate(_product(self.x[q[0]], self.x[q[1]]), params[0])
+                case "ryy":
+                    self.rotate(_product(self._y(q[0]), self._y(q[1])), params[0])
+                case _:
+                    if operation.definition is None:
+                        raise ValueError(f"Unsupported operation: {operation.name}")
+                    self.append(operation.definition, q)
+
+    def clifford(self) -> tuple[tuple[Pauli, ...], tuple[Pauli, ...]]:
+        return tuple(self.x), tuple(self.z)
+
+    def normal_form(
+        self,
+    ) -> tuple[tuple[tuple[Pauli, ...], tuple[Pauli, ...]], list[dict]]:
+        """
+        Clifford and layers of rotations that do not depend on how the
+        circuit was written. Whenever merged rotations add up to more than
+        `π/4`, their Clifford part is moved past the later rotations into the
+        Clifford, which conjugates them.
+
+        Returns: Clifford of the frame and the layers of `rotation_layers`.
+        """
+        x, z = list(self.x), list(self.z)
+        rotations = list(self.rotations)
+
+        while True:
+            layers = rotation_layers(rotations, self.atol)
+            flat = [item for layer in layers for item in layer.items()]
+            for ind, (axis, angle) in enumerate(flat):
+                power, rest = _split(angle, self.atol)
+                if power != 0:
+                    break
+            else:
+                return (tuple(x), tuple(z)), layers
+
+            flat[ind] = (axis, rest)
+            for later in range(ind + 1, len(flat)):
+                bits, angle = flat[later]
+                bits, sign = _hermitian(
+                    _conjugate(
+                        (bits[0], bits[1], (bits[0] & bits[1]).bit_count()),
+                        axis,
+                        power,
+                    )
+                )
+                flat[later] = (bits, sign * angle)
+            x = [_conjugate(pauli, axis, power) for pauli in x]
+            z = [_conjugate(pauli, axis, power) for pauli in z]
+            rotations = flat
+
+
+def pauli_frame(circuit: QuantumCircuit, atol: float = 1e-8) -> PauliFrame:
+    frame = PauliFrame(circuit.num_qubits, atol)
+    frame.append(circuit)
+    return frame
+
+
+def _is_identity(angle: float, atol: float) -> bool:
+    # Rotations by multiples of 2π only contribute a global phase
+    angle = angle % (2 * math.pi)
+    return min(angle, 2 * math.pi - angle) <= atol
+
+
+def rotation_layers(
+    rotations: list[Rotation], atol: float = 1e-8
+) -> list[dict[tuple[int, int], float]]:
+    """
+    Normal form of a product of Pauli rotations. Every rotation is moved to
+    the earliest layer after the last rotation it does not commute with, and
+    rotations of the same operator in a layer are merged, which does not
+    depend on the order of commuting rotations. Rotations that merge into the
+    identity are dropped and the layers are rebuilt.
+
+    Returns: List of layers, each mapping the commuting operators to their
+    total angle.
+    """
+    while True:
+        layers: list[dict[tuple[int, int], float]] = []
+        for pauli, angle in rotations:
+            level = 0
+            for ind in range(len(layers) - 1, -1, -1):
+                if any(_anticommute(pauli, other) for other in layers[ind]):
+                    level = ind + 1
+                    break
+            if level == len(layers):
+                layers.append({})
+            layers[level][pauli] = layers[level].get(pauli, 0.0) + angle
+
+        merged = [item for layer in layers for item in layer.items()]
+        kept = [item for item in merged if not _is_identity(item[1], atol)]
+        if len(kept) == len(merged):
+            return layers
+        rotations = kept
+
+
+def pauli_eq(
+    circuit1: QuantumCircuit, circuit2: QuantumCircuit, atol: float = 1e-8
+) -> bool:
+    """
+    Compares two Clifford+rotation circuits through their Pauli frames, in
+    memory polynomial in the number of qubits. The circuits are equal, up to a
+    global phase, if their Cliffords and the normal forms of their rotations
+    match. Rotation angles are compared with the absolute tolerance.
+
+    Equal normal forms prove equivalence. Different normal forms only
+    disprove it when the rotations can not be rewritten by identities beyond
+    commutation and merging, which holds for the product formulas, but two
+    arbitrary circuits may be reported different while being equal.
+
+    Raises:
+        - ValueError: if the circuits have a different number of qubits or an
+        operation can not be propagated.
+    """
+    if circuit1.num_qubits != circuit2.num_qubits:
+        raise ValueError("Circuits act on a different number of qubits.")
+
+    clifford1, layers1 = pauli_frame(circuit1, atol).normal_form()
+    clifford2, layers2 = pauli_frame(circuit2, atol).normal_form()
+    if clifford1 != clifford2 or len(layers1) != len(layers2):
+        return False
+    for layer1, layer2 in zip(layers1, layers2):
+        if layer1.keys() != layer2.keys():
+            return False
+        for pauli, angle in layer1.items():
+            if not _is_identity(angle - layer2[pauli], atol):
+                return False
+    return True
+
+
+def clifford_eq(circuit1: QuantumCircuit, circuit2: QuantumCircuit) -> bool:
+    """
+    Exact comparison of two Clifford circuits through their stabilizer
+    tableaux, up to a global phase.
+
+    Raises:
+        - ValueError: if a circuit is not a Clifford circuit.
+    """
+    try:
+        return Clifford(circuit1) == Clifford(circuit2)
+    except QiskitError:
+        raise ValueError("Circuit is not a Clifford circuit.")
+
+
+def num_states_for(confidence: float) -> int:
+    """
+    Number of random states such that a difference that is caught by every
+    state with probability at least 1/2 is missed with probability at most
+    `1 - confidence`.
+    """
+    if not 0 < confidence < 1:
+        raise ValueError("Confidence must be in (0, 1).")
+    return max(1, math.ceil(-math.log2(1 - confidence)))
+
+
+def statevector_eq(
+    circuit1: QuantumCircuit,
+    circuit2: QuantumCircuit,
+    num_states: Union[int, None] = None,
+    confidence: float = 0.999,
+    atol: float = 1e-8,
+    seed=None,
+) -> bool:
+    """
+    Randomized comparison on Haar random input states, which needs the
+    memory of a few statevectors instead of a dense operator. The circuits are
+    considered equal if every overlap `<ψ| U_2^† U_1 |ψ>` has absolute value 1
+    and they all share the same phase.
+
+    Inputs:
+        - circuit1, circuit2: Circuits to compare.
+        - num_states: Number of random states, derived from the confidence if
+        not given.
+        - confidence: Probability of catching a difference that a random state
+        detects at least half of the time.
+        - atol: Absolute tolerance of the overlaps.
+        - seed: Generator or seed of the random states.
+
+    Returns: True if every state agrees.
+    """
+    if circuit1.num_qubits != circuit2.num_qubits:
+        raise ValueError("Circuits act on a different number of qubits.")
+
+    num_states = num_states_for(confidence) if num_states is None else num_states
+    rng = np.random.default_rng(seed)
+
+    phase = None
+    for _ in range(num_states):
+        state = random_statevector(2**circuit1.num_qubits, seed=rng)
+        overlap = np.vdot(state.evolve(circuit2).data, state.evolve(circuit1).data)
+        if abs(abs(overlap) - 1) > atol:
+            return False
+        if phase is None:
+            phase = overlap
+        elif abs(overlap - phase) > atol:
+            return False
+    return True
@@ -1,9 +1,66 @@
 from qiskit.quantum_info import Operator
 
+from .equivalence import clifford_eq, pauli_eq, statevector_eq
 
-def circuit_eq(circuit1, circuit2) -> bool:
-    # Conversion to Operator for the sake of checking equality
-    Op1 = Operator(circuit1)
-    Op2 = Operator(circuit2)
+# Largest number of qubits compared with dense operators by the `auto` method
+OPERATOR_QUBITS = 10
 
-    return Op1.equiv(Op2)
+METHODS = ("operator", "statevector", "clifford", "pauli", "auto")
+
+
+def circuit_eq(
+    circuit1,
+    circuit2,
+    method: str = "operator",
+    atol: float = 1e-8,
+    num_states: int | None = None,
+    confidence: float = 0.999,
+    seed=None,
+) -> bool:
+    """
+    Checks if two circuits are equal up to a global phase.
+
+    Inputs:
+        - circuit1, circuit2: Circuits to compare.
+        - method: `operator` compares dense operators, `statevector` random
+        input states, `clifford` stabilizer tableaux and `pauli` the Pauli
+        rotations of Clifford+rotation circuits. `auto` uses dense operators
+        up to `OPERATOR_QUBITS` qubits. Beyond, equal Pauli rotations prove
+        equivalence, and random input states decide when they differ or can
+        not be computed, since different rotations do not disprove it.
+        - atol: Absolute tolerance.
+        - num_states, confidence, seed: Options of the `statevector` method.
+
+    Returns: True if the circuits are equal.
+
+    Raises:
+        - ValueError: if the method is unknown or does not support the
+        circuits.
+    """
+    if method == "auto":
+        if circuit1.num_qubits <= OPERATOR_QUBITS:
+            method = "operator"
+        else:
+            try:
+                if pauli_eq(circuit1, circuit2, atol):
+                    return True
+            except ValueError:
+                pass
+            method = "statevector"
+
+    match method:
+        case "operator":
+            # Conversion to Operator for the sake of checking equality
+            Op1 = Operator(circuit1)
+            Op2 = Operator(circuit2)
+            return Op1.equiv(Op2, atol=atol)
+        case "statevector":
+            return statevector_eq(
+                circuit1, circuit2, num_states, confidence, atol, seed
+            )
+        case "clifford":
+            return clifford_eq(circuit1, circuit2)
+        case "pauli":
+            return pauli_eq(circuit1, circuit2, atol)
+        case _:
+            raise ValueError(f"Unknown method: {method}, expected one of {METHODS}")
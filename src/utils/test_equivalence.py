@@ -0,0 +1,171 @@
+import numpy as np
+import pytest
+from qiskit import QuantumCircuit, transpile
+from qiskit.quantum_info import Operator
+
+from . import circuit_eq
+from .equivalence import num_states_for, pauli_eq, pauli_frame, rotation_layers
+from ..benchmark.decompose import decompose
+from ..grouping.bitwise import Bitwise
+from ..hamiltonian.random_hamiltonian import random_table
+from ..trotter.simple import trotter, trotter_from_terms
+from ..trotter_grouping.bitwise_simple import bitwise_simple
+
+_GATES = ["h", "s", "sdg", "x", "y", "z", "t", "sx", "cx", "cz", "swap"]
+_ROTATIONS = ["rz", "rx", "ry", "p", "rzz", "rxx", "ryy"]
+
+
+def _random_circuit(rng, num_qubits, num_gates):
+    circuit = QuantumCircuit(num_qubits)
+    for _ in range(num_gates):
+        name = rng.choice(_GATES + _ROTATIONS)
+        qubits = [int(q) for q in rng.choice(num_qubits, 2, replace=False)]
+        # Multiples of π/4 exercise the Clifford parts of the rotations
+        angle = float(rng.choice([rng.uniform(-4, 4), np.pi / 4 * rng.integers(-8, 9)]))
+        gate = getattr(circuit, name)
+        if name in _ROTATIONS:
+            num = 2 if name.startswith("r") and len(name) == 3 else 1
+            gate(angle, *qubits[:num])
+        else:
+            gate(*qubits[: 2 if name in ("cx", "cz", "swap") else 1])
+    return circuit
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_pauli_matches_operator(seed):
+    rng = np.random.default_rng(seed)
+    for _ in range(10):
+        circuit = _random_circuit(rng, 3, 12)
+
+        # Rewritten gate by gate, without resynthesizing any rotation
+        for basis in (["rz", "h", "s", "cx", "cz"], ["u", "cx"], ["rz", "sx", "cx"]):
+            rewritten = transpile(circuit, basis_gates=basis, optimization_level=0)
+            assert pauli_eq(circuit, rewritten)
+        assert pauli_eq(circuit, decompose(circuit))
+
+        # Sound on circuits that differ
+        other = circuit.copy()
+        other.data.pop(int(rng.integers(len(other.data))))
+        if pauli_eq(circuit, other):
+            assert Operator(circuit).equiv(Operator(other))
+
+
+def test_rotation_layers():
+    z, x = (0, 1), (1, 0)
+    zz = (0, 3)
+    # Commuting rotations are merged regardless of their order
+    assert rotation_layers([(z, 0.1), (zz, 0.2), (z, 0.3)]) == [{z: 0.4, zz: 0.2}]
+    assert rotation_layers([(z, 0.1), (x, 0.2), (z, 0.3)]) == [
+        {z: 0.1},
+        {x: 0.2},
+        {z: 0.3},
+    ]
+    # Merging into the identity lets the neighbours merge in turn
+    assert rotation_layers([(z, 0.1), (x, 0.2), (x, -0.2), (z, 0.3)]) == [{z: 0.4}]
+
+
+def test_frame_clifford_angles():
+    circuit = QuantumCircuit(1)
+    circuit.rz(np.pi / 2, 0)
+    frame = pauli_frame(circuit)
+    assert frame.rotations == []
+
+    expected = QuantumCircuit(1)
+    expected.s(0)
+    assert frame.clifford() == pauli_frame(expected).clifford()
+
+    # Merged rotations that add up to a Clifford rotation
+    circuit = QuantumCircuit(1)
+    circuit.rz(0.7, 0)
+    circuit.rz(np.pi / 2 - 0.7, 0)
+    circuit.h(0)
+    circuit.rz(0.3, 0)
+    expected = QuantumCircuit(1)
+    expected.s(0)
+    expected.h(0)
+    expected.rz(0.3, 0)
+    assert pauli_eq(circuit, expected)
+
+
+def test_large_product_formulas():
+    h = random_table(30, 60, seed=3)
+
+    grouped = bitwise_simple(h, 0.5, 2)
+    assert circuit_eq(grouped, decompose(grouped), method="pauli")
+    assert circuit_eq(grouped, decompose(grouped), method="auto")
+
+    chain = trotter(h, 0.5, ladder="chain")
+    assert circuit_eq(chain, trotter(h, 0.5, ladder="tree"), method="pauli")
+
+    perturbed = h.to_dict()
+    key = next(iter(perturbed))
+    perturbed[key] += 1e-3
+    assert not circuit_eq(chain, trotter(perturbed, 0.5), method="pauli")
+
+    # Commuting terms can be swapped, anticommuting ones can not
+    terms = [("zz" + "i" * 28, 0.3), ("iz" + "x" * 28, 0.2), ("xi" + "i" * 28, 0.1)]
+    commuting = [terms[1], terms[0], terms[2]]
+    anticommuting = [terms[2], terms[0], terms[1]]
+    circuit = trotter_from_terms(terms)
+    assert circuit_eq(circuit, trotter_from_terms(commuting), method="pauli")
+    assert not circuit_eq(circuit, trotter_from_terms(anticommuting), method="pauli")
+
+
+def test_auto_resynthesized():
+    # Resynthesized rotations have different normal forms while being equal
+    circuit = QuantumCircuit(11)
+    circuit.rx(0.3, 0)
+    circuit.rz(0.4, 0)
+    circuit.h(0)
+    transpiled = transpile(
+        circuit, basis_gates=["rz", "sx", "cx"], optimization_level=3
+    )
+    assert not circuit_eq(circuit, transpiled, method="pauli")
+    assert circuit_eq(circuit, transpiled, method="auto")
+
+    different = circuit.copy()
+    different.rz(0.1, 1)
+    assert not circuit_eq(circuit, different, method="auto")
+
+
+def test_clifford():
+    h = random_table(30, 40, seed=4)
+    grouper = Bitwise(h)
+    for group in grouper.groups[:5]:
+        diagonal = grouper.diagonal_circuit(next(iter(group)))
+        assert circuit_eq(diagonal, decompose(diagonal), method="clifford")
+        if diagonal.size() > 0:
+            assert not circuit_eq(diagonal, QuantumCircuit(30), method="clifford")
+
+    with pytest.raises(ValueError):
+        circuit_eq(trotter(h, 0.5), trotter(h, 0.5), method="clifford")
+
+
+def test_statevector():
+    h = random_table(8, 20, seed=5)
+    circuit = bitwise_simple(h, 0.3)
+    assert circuit_eq(circuit, decompose(circuit), method="statevector", seed=1)
+    assert not circuit_eq(
+        circuit, bitwise_simple(h, 0.31), method="statevector", num_states=2, seed=1
+    )
+
+    shifted = circuit.copy()
+    shifted.global_phase += 0.5
+    assert circuit_eq(circuit, shifted, method="statevector", num_states=3)
+
+    assert num_states_for(0.5) == 1
+    assert num_states_for(0.999) == 10
+    with pytest.raises(ValueError):
+        num_states_for(1.0)
+
+
+def test_methods():
+    circuit = QuantumCircuit(2)
+    circuit.h(0)
+    circuit.cx(0, 1)
+    with pytest.raises(ValueError):
+        circuit_eq(circuit, circuit, method="dense")
+    with pytest.raises(ValueError):
+        circuit_eq(circuit, QuantumCircuit(3), method="pauli")
+    for method in ("operator", "statevector", "clifford", "pauli", "auto"):
+        assert circuit_eq(circuit, circuit, method=method)
@@ -0,0 +1,121 @@
+import json
+import time
+import tracemalloc
+
+import pytest
+
+from . import trace
+from .trace import profile, span, traced
+from ..hamiltonian.random_hamiltonian import random_table
+from ..qdrift.simple import qdrift
+from ..trotter.simple import trotter
+from ..trotter_grouping.bitwise_simple import bitwise_simple
+
+
+@traced("test.double")
+def _double(x):
+    return 2 * x
+
+
+def test_disabled():
+    assert trace.active() is None
+    with span("test.block") as block:
+        assert block is None
+    assert _double(3) == 6
+    assert _double.__name__ == "_double"
+
+
+def test_nested_spans():
+    with profile() as profiler:
+        assert trace.active() is profiler
+        with span("test.outer"):
+            time.sleep(0.01)
+            for _ in range(3):
+                with span("test.inner"):
+                    time.sleep(0.001)
+        assert _double(2) == 4
+
+    assert trace.active() is None
+    stats = profiler.stats()
+    assert set(stats) == {"test.outer", "test.inner", "test.double"}
+    assert stats["test.inner"].calls == 3
+    assert stats["test.outer"].calls == 1
+    assert stats["test.outer"].total_time >= stats["test.inner"].total_time + 0.01
+    assert stats["test.outer"].self_time == pytest.approx(
+        stats["test.outer"].total_time - stats["test.inner"].total_time
+    )
+    assert stats["test.inner"].alloc == 0
+
+    report = profiler.report().splitlines()
+    assert len(report) == 5
+    assert report[2].startswith("test.outer")
+
+
+def test_exception():
+    with profile() as profiler:
+        with pytest.raises(ValueError):
+            with span("test.error"):
+                raise ValueError()
+    assert profiler.stats()["test.error"].calls == 1
+    assert trace.active() is None
+
+
+def test_nested_profilers():
+    with profile() as outer:
+        with profile(keep_events=False) as inner:
+            _double(1)
+        _double(1)
+
+    assert inner.stats()["test.double"].calls == 1
+    assert inner.events == []
+    assert outer.stats()["test.double"].calls == 1
+
+
+def test_track_memory():
+    assert not tracemalloc.is_tracing()
+    with profile(track_memory=True) as profiler:
+        with span("test.alloc"):
+            data = bytearray(1 << 20)
+    assert not tracemalloc.is_tracing()
+    assert profiler.stats()["test.alloc"].alloc >= len(data)
+
+
+def test_chrome_trace(tmp_path):
+    with profile(track_memory=True) as profiler:
+        with span("test.outer"):
+            with span("test.inner"):
+                pass
+
+    file = tmp_path / "trace.json"
+    profiler.save_chrome_trace(str(file))
+    with open(file) as infile:
+        events = json.load(infile)["traceEvents"]
+
+    assert [event["name"] for event in events] == ["test.inner", "test.outer"]
+    inner, outer = events
+    assert all(event["ph"] == "X" and event["cat"] == "test" for event in events)
+    assert outer["ts"] <= inner["ts"]
+    assert inner["ts"] + inner["dur"] <= outer["ts"] + outer["dur"]
+    assert inner["args"]["depth"] == 1 and outer["args"]["depth"] == 0
+    assert "alloc" in inner["args"]
+
+
+def test_pipeline_spans():
+    h = random_table(5, 30, seed=2)
+    with profile() as profiler:
+        bitwise_simple(h, 1.0, 2)
+        qdrift(h, 1.0, 1.0, rng=3)
+        trotter(h, 1.0, 2)
+
+    stats = profiler.stats()
+    assert stats["generic"].calls == 1
+    assert stats["grouping.bitwise"].calls == 1
+    groups = stats["generic.synthesis"].calls
+    assert stats["ordering.lexico"].calls == groups
+    assert stats["utils.circuit_constructor"].calls == groups
+    assert stats["qdrift"].calls == 1
+    assert stats["qdrift.synthesis"].calls == 1
+    assert stats["qdrift.compose"].calls >= 1
+    assert stats["qdrift.sample"].calls == stats["qdrift.compose"].calls + 1
+    assert stats["trotter.synthesis"].calls == 1
+    assert stats["trotter.compose"].calls == 1
@@ -0,0 +1,217 @@
+import contextlib
+import functools
+import json
+import os
+import threading
+import time
+import tracemalloc
+from typing import Callable, NamedTuple, Union
+
+# Profiler the spans are recorded into, None while profiling is disabled
+_active: Union["Profiler", None] = None
+
+# Returned by `span` while disabled, entering it does nothing
+_NULL_SPAN = contextlib.nullcontext()
+
+
+class SpanStats(NamedTuple):
+    """
+    Aggregated measurements of every span with the same name. Times are in
+    seconds, `self_time` excludes the time spent in nested spans, and `alloc`
+    is the net change of traced memory in bytes, zero unless memory is tracked.
+    """
+
+    calls: int
+    total_time: float
+    self_time: float
+    max_time: float
+    alloc: int
+
+
+class _Span:
+    __slots__ = ("profiler", "name", "start", "memory", "children")
+
+    def __init__(self, profiler: "Profiler", name: str):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.children = 0
+        self.memory = self.profiler._memory()
+        self.profiler._stack.append(self)
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        end = time.perf_counter_ns()
+        self.profiler._record(self, end)
+
+
+class Profiler:
+    """
+    Records the named spans entered while it is active. Only one profiler is
+    active at a time, entering a profiler replaces the active one until it
+    exits.
+
+    Inputs:
+        - track_memory: Also record the allocation delta of every span with
+        `tracemalloc`, which is started if it is not already tracing.
+        - keep_events: Keep every span for `chrome_trace`, otherwise only the
+        aggregated statistics are kept.
+    """
+
+    def __init__(self, track_memory: bool = False, keep_events: bool = True):
+        self.track_memory = track_memory
+        self.keep_events = keep_events
+        # (name, start, duration, alloc, depth) with times in nanoseconds
+        self.events: list[tuple[str, int, int, int, int]] = []
+        self._stats: dict[str, list[int]] = {}
+        self._stack: list[_Span] = []
+        self._origin = time.perf_counter_ns()
+        self._previous: Union[Profiler, None] = None
+        self._started_tracing = False
+
+    def _memory(self) -> int:
+        return tracemalloc.get_traced_memory()[0] if self.track_memory else 0
+
+    def _record(self, span: _Span, end: int):
+        duration = end - span.start
+        alloc = self._memory() - span.memory if self.track_memory else 0
+
+        self._stack.pop()
+        if len(self._stack) > 0:
+            self._stack[-1].children += duration
+
+        stats = self._stats.get(span.name)
+        if stats is None:
+            stats = self._stats[span.name] = [0, 0, 0, 0, 0]
+        stats[0] += 1
+        stats[1] += duration
+        stats[2] += duration - span.children
+        stats[3] = max(stats[3], duration)
+        stats[4] += alloc
+
+        if self.keep_events:
+            self.events.append(
+                (span.name, span.start, duration, alloc, len(self._stack))
+            )
+
+    def span(self, name: str) -> _Span:
+        return _Span(self, name)
+
+    def __enter__(self) -> "Profiler":
+        global _active
+        if self.track_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        self._previous, _active = _active, self
+        return self
+
+    def __exit__(self, *exc):
+        global _active
+        _active = self._previous
+        self._previous = None
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def stats(self) -> dict[str, SpanStats]:
+        """
+        Statistics of every span name, in the order the names were first
+        completed.
+        """
+        return {
+            name: SpanStats(calls, total / 1e9, self_time / 1e9, max_time / 1e9, alloc)
+            for name, (calls, total, self_time, max_time, alloc) in self._stats.items()
+        }
+
+    def report(self) -> str:
+        """
+        Flat report of the statistics as a text table, sorted by total time.
+        """
+        rows = sorted(self.stats().items(), key=lambda item: -item[1].total_time)
+        width = max([len("span")] + [len(name) for name, _ in rows])
+        header = (
+            f"{'span':<{width}} {'calls':>8} {'total (s)':>11} "
+            f"{'self (s)':>11} {'max (s)':>11} {'alloc (B)':>12}"
+        )
+        lines = [header, "-" * len(header)]
+        for name, stats in rows:
+            lines.append(
+                f"{name:<{width}} {stats.calls:>8} {stats.total_time:>11.6f} "
+                f"{stats.self_time:>11.6f} {stats.max_time:>11.6f} {stats.alloc:>12}"
+            )
+        return "\n".join(lines)
+
+    def chrome_trace(self) -> dict:
+        """
+        Recorded spans in the Chrome trace event format, as complete events
+        with times in microseconds since the profiler was created. Can be
+        opened in `chrome://tracing` or Perfetto.
+        """
+        pid, tid = os.getpid(), threading.get_ident()
+        events = []
+        for name, start, duration, alloc, depth in self.events:
+            event = {
+                "name": name,
+                "cat": name.split(".")[0],
+                "ph": "X",
+                "ts": (start - self._origin) / 1e3,
+                "dur": duration / 1e3,
+                "pid": pid,
+                "tid": tid,
+                "args": {"depth": depth},
+            }
+            if self.track_memory:
+                event["args"]["alloc"] = alloc
+            events.append(event)
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def save_chrome_trace(self, file: str):
+        with open(file, "w") as outfile:
+            json.dump(self.chrome_trace(), outfile)
+
+
+def profile(track_memory: bool = False, keep_events: bool = True) -> Profiler:
+    """
+    New profiler to be used as a context manager, spans are only recorded
+    inside of it:
+
+        with profile() as profiler:
+            bitwise_simple(h, t, reps)
+        print(profiler.report())
+    """
+    return Profiler(track_memory, keep_events)
+
+
+def active() -> Union[Profiler, None]:
+    return _active
+
+
+def span(name: str):
+    """
+    Context manager measuring the enclosed block as the span `name`, which
+    does nothing unless a profiler is active.
+    """
+    if _active is None:
+        return _NULL_SPAN
+    return _active.span(name)
+
+
+def traced(name: str) -> Callable[[Callable], Callable]:
+    """
+    Decorator measuring every call of the function as the span `name`. While
+    disabled the only cost is the check for an active profiler.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _active is None:
+                return func(*args, **kwargs)
+            with _active.span(name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator